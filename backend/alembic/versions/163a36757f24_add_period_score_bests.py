@@ -0,0 +1,81 @@
+"""add period score bests
+
+Revision ID: 163a36757f24
+Revises: 9535db3649d9
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "163a36757f24"
+down_revision: Union[str, Sequence[str], None] = "9535db3649d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill(period: str) -> str:
+    start = f"date_trunc('{period}', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+    return f"""
+        INSERT INTO period_score_bests
+            (period, period_start, scenario_id, user_id, score_id,
+             score_value, weight_lifted, achieved_at)
+        SELECT DISTINCT ON ({start}, scenario_id, user_id)
+               '{period}', {start}, scenario_id, user_id, id,
+               score_value, weight_lifted, created_at
+        FROM scores
+        WHERE created_at >= now() - interval '400 days'
+        ORDER BY {start}, scenario_id, user_id,
+                 score_value DESC, created_at DESC, id DESC
+    """
+
+
+def upgrade() -> None:
+    """Create weekly/monthly best-score rollups and backfill recent periods."""
+
+    op.create_table(
+        "period_score_bests",
+        sa.Column("period", sa.String(length=8), nullable=False),
+        sa.Column("period_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("scenario_id", sa.String(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("score_id", sa.Integer(), nullable=False),
+        sa.Column("score_value", sa.Float(), nullable=False),
+        sa.Column("weight_lifted", sa.Float(), nullable=False),
+        sa.Column("achieved_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "period IN ('week', 'month')",
+            name="ck_period_score_bests_period",
+        ),
+        sa.ForeignKeyConstraint(["scenario_id"], ["scenarios.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["score_id"], ["scores.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "period",
+            "period_start",
+            "scenario_id",
+            "user_id",
+            name="pk_period_score_bests",
+        ),
+    )
+    op.create_index(
+        "ix_period_score_bests_board",
+        "period_score_bests",
+        ["period", "period_start", "scenario_id", sa.text("score_value DESC")],
+        unique=False,
+    )
+
+    op.execute(_backfill("week"))
+    op.execute(_backfill("month"))
+
+
+def downgrade() -> None:
+    """Drop the period rollups."""
+
+    op.drop_index("ix_period_score_bests_board", table_name="period_score_bests")
+    op.drop_table("period_score_bests")
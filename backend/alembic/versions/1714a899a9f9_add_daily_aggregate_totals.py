@@ -0,0 +1,70 @@
+"""add daily aggregate totals
+
+Revision ID: 1714a899a9f9
+Revises: 402a7b60f7a0
+Create Date: 2026-10-19 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1714a899a9f9"
+down_revision: Union[str, Sequence[str], None] = "402a7b60f7a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-day totals and mark existing submissions as already aggregated."""
+
+    op.add_column(
+        "daily_workout_aggregates",
+        sa.Column("total_minutes", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "daily_workout_aggregates",
+        sa.Column("workout_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "routine_submission",
+        sa.Column("aggregated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.execute(
+        """
+        INSERT INTO daily_workout_aggregates (
+            user_id, day, longest_session_minutes, qualified_30,
+            total_minutes, workout_count, created_at, updated_at
+        )
+        SELECT
+            user_id,
+            date_trunc('day', completion_timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+            round(max(duration))::integer,
+            round(max(duration)) >= 30,
+            sum(duration),
+            count(*),
+            now(),
+            now()
+        FROM routine_submission
+        GROUP BY 1, 2
+        ON CONFLICT (user_id, day) DO UPDATE SET
+            longest_session_minutes = EXCLUDED.longest_session_minutes,
+            qualified_30 = EXCLUDED.qualified_30,
+            total_minutes = EXCLUDED.total_minutes,
+            workout_count = EXCLUDED.workout_count,
+            updated_at = EXCLUDED.updated_at
+        """
+    )
+    op.execute("UPDATE routine_submission SET aggregated_at = now()")
+
+
+def downgrade() -> None:
+    """Drop the per-day totals and aggregation marker."""
+
+    op.drop_column("routine_submission", "aggregated_at")
+    op.drop_column("daily_workout_aggregates", "workout_count")
+    op.drop_column("daily_workout_aggregates", "total_minutes")
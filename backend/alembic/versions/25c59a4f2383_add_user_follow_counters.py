@@ -0,0 +1,58 @@
+"""add user follow counters
+
+Revision ID: 25c59a4f2383
+Revises: c7ae0b8eddb7
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "25c59a4f2383"
+down_revision: Union[str, Sequence[str], None] = "c7ae0b8eddb7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add denormalized follow counters and backfill them from social_edges."""
+
+    for column in ("follower_count", "following_count", "mutual_count"):
+        op.add_column(
+            "users",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.execute(
+        """
+        UPDATE users AS u
+        SET follower_count = counts.followers,
+            following_count = counts.following,
+            mutual_count = counts.mutuals
+        FROM (
+            SELECT u2.id,
+                   (SELECT count(*) FROM social_edges e
+                     WHERE e.followee_id = u2.id AND e.status = 'active') AS followers,
+                   (SELECT count(*) FROM social_edges e
+                     WHERE e.follower_id = u2.id AND e.status = 'active') AS following,
+                   (SELECT count(*) FROM social_edges f
+                      JOIN social_edges r
+                        ON r.follower_id = f.followee_id AND r.followee_id = f.follower_id
+                     WHERE f.follower_id = u2.id
+                       AND f.status = 'active' AND r.status = 'active') AS mutuals
+            FROM users u2
+        ) AS counts
+        WHERE counts.id = u.id
+          AND (counts.followers > 0 OR counts.following > 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the follow counters."""
+
+    for column in ("mutual_count", "following_count", "follower_count"):
+        op.drop_column("users", column)
@@ -0,0 +1,65 @@
+"""add user quest history
+
+Revision ID: 402a7b60f7a0
+Revises: cbe85b824ce6
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "402a7b60f7a0"
+down_revision: Union[str, Sequence[str], None] = "cbe85b824ce6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the quest archive table and the (user_id, cycle_start DESC) read index."""
+
+    op.create_table(
+        "user_quest_history",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("template_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("progress_value", sa.Integer(), nullable=False),
+        sa.Column("required_value", sa.Integer(), nullable=False),
+        sa.Column("cycle_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("cycle_end", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("reward_claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["template_id"], ["quest_templates.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_user_quest_history_user_cycle_start",
+        "user_quest_history",
+        ["user_id", sa.text("cycle_start DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_quests_user_cycle_start",
+        "user_quests",
+        ["user_id", sa.text("cycle_start DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the quest archive table and read index."""
+
+    op.drop_index("ix_user_quests_user_cycle_start", table_name="user_quests")
+    op.drop_index(
+        "ix_user_quest_history_user_cycle_start", table_name="user_quest_history"
+    )
+    op.drop_table("user_quest_history")
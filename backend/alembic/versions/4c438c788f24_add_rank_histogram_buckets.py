@@ -0,0 +1,69 @@
+"""add rank histogram buckets
+
+Revision ID: 4c438c788f24
+Revises: e32b53d9e423
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c438c788f24"
+down_revision: Union[str, Sequence[str], None] = "e32b53d9e423"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match BUCKET_WIDTHS in app/services/histogram_service.py.
+_SCENARIO_WIDTH = 2.5
+_ENERGY_WIDTH = 10.0
+
+
+def upgrade() -> None:
+    """Create the histogram table and backfill it from scores and users."""
+
+    op.create_table(
+        "rank_histogram_buckets",
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("key", sa.String(), nullable=False, server_default=""),
+        sa.Column("bucket", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.CheckConstraint(
+            "kind IN ('scenario', 'energy')",
+            name="ck_rank_histogram_buckets_kind",
+        ),
+        sa.PrimaryKeyConstraint("kind", "key", "bucket", name="pk_rank_histogram_buckets"),
+    )
+
+    op.execute(
+        f"""
+        INSERT INTO rank_histogram_buckets (kind, key, bucket, count)
+        SELECT 'scenario', scenario_id, floor(best / {_SCENARIO_WIDTH})::int, count(*)
+        FROM (
+            SELECT scenario_id, user_id, max(score_value) AS best
+            FROM scores
+            GROUP BY scenario_id, user_id
+        ) AS bests
+        WHERE best >= 0
+        GROUP BY scenario_id, floor(best / {_SCENARIO_WIDTH})::int
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO rank_histogram_buckets (kind, key, bucket, count)
+        SELECT 'energy', '', floor(energy / {_ENERGY_WIDTH})::int, count(*)
+        FROM users
+        WHERE energy > 0
+        GROUP BY floor(energy / {_ENERGY_WIDTH})::int
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the histogram table."""
+
+    op.drop_table("rank_histogram_buckets")
@@ -0,0 +1,70 @@
+"""add activity feed
+
+Revision ID: 5745992277a3
+Revises: 77f399a25f50
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5745992277a3"
+down_revision: Union[str, Sequence[str], None] = "77f399a25f50"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create feed items and per-follower inbox pointers."""
+
+    op.create_table(
+        "feed_items",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("actor_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("source_id", sa.String(length=64), nullable=False),
+        sa.Column("summary", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "kind IN ('personal_best', 'workout')",
+            name="ck_feed_items_kind",
+        ),
+        sa.ForeignKeyConstraint(["actor_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_feed_items_actor_created",
+        "feed_items",
+        ["actor_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+    op.create_table(
+        "feed_inbox",
+        sa.Column("owner_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("item_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["item_id"], ["feed_items.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("owner_id", "item_id", name="pk_feed_inbox"),
+    )
+    op.create_index(
+        "ix_feed_inbox_owner_created",
+        "feed_inbox",
+        ["owner_id", sa.text("created_at DESC"), sa.text("item_id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the feed tables."""
+
+    op.drop_index("ix_feed_inbox_owner_created", table_name="feed_inbox")
+    op.drop_table("feed_inbox")
+    op.drop_index("ix_feed_items_actor_created", table_name="feed_items")
+    op.drop_table("feed_items")
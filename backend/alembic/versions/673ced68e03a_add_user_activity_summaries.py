@@ -0,0 +1,109 @@
+"""add user activity summaries
+
+Revision ID: 673ced68e03a
+Revises: 1714a899a9f9
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "673ced68e03a"
+down_revision: Union[str, Sequence[str], None] = "1714a899a9f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-user streak summary and backfill it from daily aggregates."""
+
+    op.create_table(
+        "user_activity_summaries",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("current_streak", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("longest_streak", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_active_day", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("recent_anchor_day", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("recent_workouts", sa.JSON(), nullable=False, server_default="[]"),
+        sa.Column("recent_minutes", sa.JSON(), nullable=False, server_default="[]"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # Gaps-and-islands over active days: the last island is the current
+    # streak, the longest island is the longest streak.
+    op.execute(
+        """
+        WITH days AS (
+            SELECT user_id, day
+            FROM daily_workout_aggregates
+            WHERE workout_count > 0
+        ),
+        runs AS (
+            SELECT
+                user_id,
+                day,
+                day - (row_number() OVER (PARTITION BY user_id ORDER BY day))
+                    * interval '1 day' AS grp
+            FROM days
+        ),
+        islands AS (
+            SELECT user_id, max(day) AS end_day, count(*) AS length
+            FROM runs
+            GROUP BY user_id, grp
+        ),
+        ranked AS (
+            SELECT
+                user_id,
+                end_day,
+                length,
+                max(length) OVER (PARTITION BY user_id) AS longest,
+                row_number() OVER (PARTITION BY user_id ORDER BY end_day DESC) AS rn
+            FROM islands
+        )
+        INSERT INTO user_activity_summaries (
+            user_id, current_streak, longest_streak, last_active_day,
+            recent_anchor_day, recent_workouts, recent_minutes, updated_at
+        )
+        SELECT
+            r.user_id,
+            r.length,
+            r.longest,
+            r.end_day,
+            r.end_day,
+            (
+                SELECT json_agg(coalesce(a.workout_count, 0) ORDER BY g.i)
+                FROM generate_series(0, 27) AS g(i)
+                LEFT JOIN daily_workout_aggregates a
+                    ON a.user_id = r.user_id
+                   AND a.day = r.end_day - g.i * interval '1 day'
+            ),
+            (
+                SELECT json_agg(round(coalesce(a.total_minutes, 0)::numeric, 2) ORDER BY g.i)
+                FROM generate_series(0, 27) AS g(i)
+                LEFT JOIN daily_workout_aggregates a
+                    ON a.user_id = r.user_id
+                   AND a.day = r.end_day - g.i * interval '1 day'
+            ),
+            now()
+        FROM ranked r
+        WHERE r.rn = 1
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-user streak summary."""
+
+    op.drop_table("user_activity_summaries")
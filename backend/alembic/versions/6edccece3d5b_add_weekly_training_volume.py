@@ -0,0 +1,78 @@
+"""add weekly training volume
+
+Revision ID: 6edccece3d5b
+Revises: c937516f3acb
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6edccece3d5b"
+down_revision: Union[str, Sequence[str], None] = "c937516f3acb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_WEEK = "date_trunc('week', rs.completion_timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+
+
+def upgrade() -> None:
+    """Create the weekly volume rollup and backfill it from existing submissions."""
+
+    op.create_table(
+        "weekly_training_volume",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("week_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("dimension", sa.String(length=16), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("volume", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("sets", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.CheckConstraint(
+            "dimension IN ('muscle', 'scenario')",
+            name="ck_weekly_training_volume_dimension",
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "user_id", "week_start", "dimension", "key", name="pk_weekly_training_volume"
+        ),
+    )
+
+    op.execute(
+        f"""
+        INSERT INTO weekly_training_volume (user_id, week_start, dimension, key, volume, sets)
+        SELECT rs.user_id, {_WEEK}, 'scenario', rss.scenario_id,
+               sum(rss.total_volume), sum(rss.sets)
+        FROM routine_scenario_submission rss
+        JOIN routine_submission rs ON rs.id = rss.routine_id
+        GROUP BY rs.user_id, {_WEEK}, rss.scenario_id
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO weekly_training_volume (user_id, week_start, dimension, key, volume, sets)
+        SELECT rs.user_id, {_WEEK}, 'muscle', pm.muscle_id,
+               sum(rss.total_volume), sum(rss.sets)
+        FROM routine_scenario_submission rss
+        JOIN routine_submission rs ON rs.id = rss.routine_id
+        JOIN scenario_primary_muscle_association pm ON pm.scenario_id = rss.scenario_id
+        GROUP BY rs.user_id, {_WEEK}, pm.muscle_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the weekly volume rollup."""
+
+    op.drop_table("weekly_training_volume")
@@ -0,0 +1,50 @@
+"""add social edge keyset indexes
+
+Revision ID: 77f399a25f50
+Revises: 25c59a4f2383
+Create Date: 2026-10-19 15:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "77f399a25f50"
+down_revision: Union[str, Sequence[str], None] = "25c59a4f2383"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the id-only partial indexes with ones ordered by created_at."""
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_social_following_active_created "
+        "ON social_edges (follower_id, created_at DESC, followee_id DESC) "
+        "WHERE status = 'active'"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_social_followers_active_created "
+        "ON social_edges (followee_id, created_at DESC, follower_id DESC) "
+        "WHERE status = 'active'"
+    )
+    # The new indexes lead with the same columns, so these are redundant.
+    op.execute("DROP INDEX IF EXISTS idx_social_following_active")
+    op.execute("DROP INDEX IF EXISTS idx_social_followers_active")
+
+
+def downgrade() -> None:
+    """Restore the id-only partial indexes."""
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_social_following_active "
+        "ON social_edges (follower_id) WHERE status = 'active'"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_social_followers_active "
+        "ON social_edges (followee_id) WHERE status = 'active'"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_social_followers_active_created")
+    op.execute("DROP INDEX IF EXISTS idx_social_following_active_created")
@@ -0,0 +1,49 @@
+"""add id to quest cycle indexes
+
+Revision ID: 7fcddac6f371
+Revises: b94100b7c312
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7fcddac6f371"
+down_revision: Union[str, Sequence[str], None] = "b94100b7c312"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_user_quests_user_cycle_start", "user_quests"),
+    ("ix_user_quest_history_user_cycle_start", "user_quest_history"),
+)
+
+
+def upgrade() -> None:
+    """Extend the quest read indexes to the (cycle_start, id) sort they serve."""
+
+    for name, table in INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(
+            name,
+            table,
+            ["user_id", sa.text("cycle_start DESC"), sa.text("id DESC")],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Restore the (user_id, cycle_start DESC) indexes."""
+
+    for name, table in INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(
+            name,
+            table,
+            ["user_id", sa.text("cycle_start DESC")],
+            unique=False,
+        )
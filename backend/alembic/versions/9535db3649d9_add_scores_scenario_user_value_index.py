@@ -0,0 +1,35 @@
+"""add scores scenario user value index
+
+Revision ID: 9535db3649d9
+Revises: 4c438c788f24
+Create Date: 2026-10-19 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9535db3649d9"
+down_revision: Union[str, Sequence[str], None] = "4c438c788f24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index scores by (scenario_id, user_id, score_value DESC) for per-user bests."""
+
+    op.create_index(
+        "ix_scores_scenario_user_value",
+        "scores",
+        ["scenario_id", "user_id", sa.text("score_value DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove the per-user best index."""
+
+    op.drop_index("ix_scores_scenario_user_value", table_name="scores")
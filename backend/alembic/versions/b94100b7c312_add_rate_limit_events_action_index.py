@@ -0,0 +1,32 @@
+"""add rate limit events action index
+
+Revision ID: b94100b7c312
+Revises: 5745992277a3
+Create Date: 2026-10-19 16:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b94100b7c312"
+down_revision: Union[str, Sequence[str], None] = "5745992277a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index rate limit events by (action, occurred_at) for the reaper."""
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_rate_limit_events_action_time "
+        "ON rate_limit_events (action, occurred_at)"
+    )
+
+
+def downgrade() -> None:
+    """Remove the reaper index."""
+
+    op.execute("DROP INDEX IF EXISTS ix_rate_limit_events_action_time")
@@ -0,0 +1,38 @@
+"""add user search trigram indexes
+
+Revision ID: c7ae0b8eddb7
+Revises: 163a36757f24
+Create Date: 2026-10-19 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7ae0b8eddb7"
+down_revision: Union[str, Sequence[str], None] = "163a36757f24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and index lowercased usernames and display names."""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_username_trgm "
+        "ON users USING gin (lower(username) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_display_name_trgm "
+        "ON users USING gin (lower(coalesce(display_name, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes; the extension is left installed."""
+
+    op.execute("DROP INDEX IF EXISTS ix_users_display_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_username_trgm")
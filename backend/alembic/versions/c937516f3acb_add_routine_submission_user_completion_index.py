@@ -0,0 +1,37 @@
+"""add routine submission user completion index
+
+Revision ID: c937516f3acb
+Revises: 673ced68e03a
+Create Date: 2026-10-19 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c937516f3acb"
+down_revision: Union[str, Sequence[str], None] = "673ced68e03a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index submissions by (user_id, completion_timestamp DESC) for history pages."""
+
+    op.create_index(
+        "ix_routine_submission_user_completion",
+        "routine_submission",
+        ["user_id", sa.text("completion_timestamp DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove the history index."""
+
+    op.drop_index(
+        "ix_routine_submission_user_completion", table_name="routine_submission"
+    )
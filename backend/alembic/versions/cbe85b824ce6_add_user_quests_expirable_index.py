@@ -0,0 +1,36 @@
+"""add user quests expirable index
+
+Revision ID: cbe85b824ce6
+Revises: df36db76003c
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "cbe85b824ce6"
+down_revision: Union[str, Sequence[str], None] = "df36db76003c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index unexpired quests by expiry for the bulk expiry sweeper."""
+
+    op.create_index(
+        "ix_user_quests_expirable",
+        "user_quests",
+        ["expires_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('active', 'completed')"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the expiry sweeper index."""
+
+    op.drop_index("ix_user_quests_expirable", table_name="user_quests")
@@ -0,0 +1,68 @@
+"""add daily energy rollups
+
+Revision ID: e32b53d9e423
+Revises: 6edccece3d5b
+Create Date: 2026-10-19 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e32b53d9e423"
+down_revision: Union[str, Sequence[str], None] = "6edccece3d5b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_DAY = "date_trunc('day', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+
+
+def upgrade() -> None:
+    """Index energy history per user and backfill per-day rollups from it."""
+
+    op.create_index(
+        "ix_energy_history_user_created",
+        "energy_history",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+    op.create_table(
+        "daily_energy_rollups",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("min_energy", sa.Float(), nullable=False),
+        sa.Column("max_energy", sa.Float(), nullable=False),
+        sa.Column("last_energy", sa.Float(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "day", name="pk_daily_energy_rollups"),
+    )
+
+    op.execute(
+        f"""
+        INSERT INTO daily_energy_rollups
+            (user_id, day, min_energy, max_energy, last_energy, sample_count)
+        SELECT user_id, {_DAY}, min(energy), max(energy),
+               (array_agg(energy ORDER BY created_at DESC))[1], count(*)
+        FROM energy_history
+        GROUP BY user_id, {_DAY}
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the rollups and the history index."""
+
+    op.drop_table("daily_energy_rollups")
+    op.drop_index("ix_energy_history_user_created", table_name="energy_history")
@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from app.api.v1.energy import router as energy_router
+from app.api.v1.feed import router as feed_router
 from app.api.v1.guilds import router as guilds_router
 from app.api.v1.levels import router as levels_router
 from app.api.v1.payments import router as payments_router
@@ -37,3 +38,4 @@ api_router.include_router(webhooks_router)
 api_router.include_router(levels_router)
 api_router.include_router(quests_router)
 api_router.include_router(personal_best_events_router)
+api_router.include_router(feed_router)
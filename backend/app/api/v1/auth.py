@@ -1,37 +1,13 @@
 # backend/app/api/v1/auth.py
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.ext.asyncio import AsyncSession
+"""Authentication dependencies for the v1 routers.
 
-from app.api.v1.deps import get_db
-from app.core.config import settings
-from app.models.user import User
-from app.services.user_service import get_user_by_id
+Re-exported from :mod:`app.core.auth` so every router shares one principal
+cache. Use ``get_current_principal`` when only the caller's id or tier is
+needed, and ``get_current_user`` when the full ``User`` row is read or
+modified.
+"""
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
+from app.core.auth import get_current_principal, get_current_user, oauth2_scheme
 
-
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    user = await get_user_by_id(db, user_id)
-    if user is None:
-        raise credentials_exception
-    return user
+__all__ = ["get_current_principal", "get_current_user", "oauth2_scheme"]
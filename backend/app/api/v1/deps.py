@@ -1,12 +1,24 @@
 # backend/app/api/v1/deps.py
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import async_session
 
+SessionFactory = Callable[[], AsyncSession]
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
+
+
+def get_session_factory() -> SessionFactory:
+    """Session factory for work that outlives the request's ``get_db`` session.
+
+    Streamed response bodies are sent after yield dependencies have exited,
+    so they open (and close) a session of their own from this factory.
+    """
+
+    return async_session
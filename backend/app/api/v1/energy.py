@@ -1,21 +1,48 @@
 # backend/app/api/v1/energy.py
 
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from sqlalchemy import func, select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.deps import get_db
+from app.api.v1.auth import get_current_principal
+from app.api.v1.deps import SessionFactory, get_db, get_session_factory
+from app.core.config import settings
 from app.models.energy_history import EnergyHistory
+from app.models.energy_rollup import DailyEnergyRollup
 from app.models.user import User
+from app.schemas.distribution import (
+    EnergyDistribution,
+    HistogramBucketOut,
+    PercentileOut,
+    RankTierCount,
+)
 from app.schemas.energy import (
     DailyEnergyEntry,
     EnergyEntry,
     EnergyLeaderboardEntry,
+    EnergySeries,
+    EnergySeriesPoint,
     EnergySubmit,
 )
+from app.services.energy_series_service import SeriesResolution, get_energy_series
+from app.services.energy_service import record_energy
+from app.services.histogram_service import (
+    BUCKET_WIDTHS,
+    ENERGY_KEY,
+    HistogramKind,
+    adjust_histogram,
+    get_distribution,
+    get_percentile,
+)
+from app.services.leaderboard_service import following_energy_leaderboard
+from app.services.principal_cache import AuthenticatedUser
+from app.utils.datetime import ensure_aware_utc
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(
     prefix="/energy",
@@ -45,32 +72,52 @@ def _rank_from_energy(energy: float) -> str:
 
 @router.post("/submit")
 async def submit_energy(data: EnergySubmit, db: AsyncSession = Depends(get_db)):
-    stmt = select(User).where(User.id == data.user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-
-    if user is None:
+    result = await db.execute(
+        select(User.energy).where(User.id == data.user_id).with_for_update()
+    )
+    current = result.first()
+    if current is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    user.energy = data.energy
-    user.rank = data.rank
-    db.add(user)
+    await db.execute(
+        update(User)
+        .where(User.id == data.user_id)
+        .values(energy=data.energy, rank=data.rank)
+        .execution_options(synchronize_session=False)
+    )
+    await adjust_histogram(
+        db, HistogramKind.ENERGY, ENERGY_KEY, old=current.energy, new=data.energy
+    )
 
-    entry = EnergyHistory(user_id=data.user_id, energy=data.energy)
-    db.add(entry)
+    # Clients resend their current value on every app resume; an unchanged
+    # value inside the dedupe window leaves history untouched.
+    recorded = await record_energy(
+        db,
+        data.user_id,
+        data.energy,
+        dedupe_window=timedelta(seconds=settings.ENERGY_DEDUPE_WINDOW_SECONDS),
+    )
 
     await db.commit()
 
-    return {"message": "Energy and rank updated successfully"}
+    return {"message": "Energy and rank updated successfully", "recorded": recorded}
 
 
 @router.get("/history/{user_id}", response_model=list[EnergyEntry])
-async def get_energy_history(user_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_energy_history(
+    user_id: UUID,
+    request: Request,
+    format: str | None = Query(None, pattern="^(json|ndjson)$"),
+    db: AsyncSession = Depends(get_db),
+    session_factory: SessionFactory = Depends(get_session_factory),
+):
     stmt = (
         select(EnergyHistory)
         .where(EnergyHistory.user_id == user_id)
         .order_by(EnergyHistory.created_at.desc())
     )
+    if wants_ndjson(request, format):
+        return ndjson_response(session_factory, stmt, EnergyEntry)
     result = await db.execute(stmt)
     return result.scalars().all()
 
@@ -114,23 +161,138 @@ async def get_energy_leaderboard(
     return entries
 
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _decode_energy_cursor(cursor: str) -> tuple[float, UUID, int]:
+    raw_energy, raw_id, raw_rank = decode_cursor(cursor, size=3)
+    try:
+        return float(raw_energy), UUID(raw_id), int(raw_rank)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("/leaderboard/following", response_model=list[EnergyLeaderboardEntry])
+async def get_following_energy_leaderboard(
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
+):
+    """Energy leaderboard of the current user and everyone they follow.
+
+    Keyset-paginated through the ``X-Next-Cursor`` header, which also carries
+    the last rank so positions continue across pages.
+    """
+
+    after = _decode_energy_cursor(cursor) if cursor else None
+    users = await following_energy_leaderboard(
+        db,
+        current_user.id,
+        limit=limit,
+        after=after[:2] if after else None,
+    )
+
+    start = after[2] + 1 if after else 1
+    entries = []
+    for index, user in enumerate(users, start=start):
+        total_energy = int(round(user.energy or 0))
+        entries.append(
+            EnergyLeaderboardEntry(
+                rank=index,
+                user_id=user.id,
+                username=user.username,
+                display_name=user.display_name,
+                avatar_url=user.avatar_url,
+                total_energy=total_energy,
+                user_rank=_rank_from_energy(total_energy),
+            )
+        )
+    if len(users) == limit:
+        last = users[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [float(last.energy or 0.0), last.id, start + len(users) - 1]
+        )
+    return entries
+
+
 @router.get("/daily/{user_id}", response_model=list[DailyEnergyEntry])
 async def get_energy_by_day(user_id: UUID, db: AsyncSession = Depends(get_db)):
     stmt = (
-        select(
-            func.date(EnergyHistory.created_at).label("date"),
-            func.max(EnergyHistory.energy).label("total_energy"),
-        )
-        .where(EnergyHistory.user_id == user_id)
-        .group_by(func.date(EnergyHistory.created_at))
-        .order_by(func.date(EnergyHistory.created_at))
+        select(DailyEnergyRollup.day, DailyEnergyRollup.max_energy)
+        .where(DailyEnergyRollup.user_id == user_id)
+        .order_by(DailyEnergyRollup.day)
     )
     result = await db.execute(stmt)
     return [
-        DailyEnergyEntry(date=row.date, total_energy=row.total_energy) for row in result
+        DailyEnergyEntry(
+            date=ensure_aware_utc(row.day, field_name="day", allow_naive=True).date(),
+            total_energy=row.max_energy,
+        )
+        for row in result
     ]
 
 
+@router.get("/series/{user_id}", response_model=EnergySeries)
+async def get_energy_series_for_user(
+    user_id: UUID,
+    resolution: SeriesResolution = Query(SeriesResolution.DAY),
+    points: int = Query(200, ge=3, le=2000),
+    since: datetime | None = Query(None),
+    until: datetime | None = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Energy per day/week/month from the daily rollups, downsampled with LTTB
+    so the response never exceeds ``points`` entries."""
+
+    series = await get_energy_series(
+        db,
+        user_id,
+        resolution=resolution,
+        points=points,
+        since=ensure_aware_utc(since, field_name="since", allow_naive=True) if since else None,
+        until=ensure_aware_utc(until, field_name="until", allow_naive=True) if until else None,
+    )
+    return EnergySeries(
+        resolution=resolution,
+        points=[EnergySeriesPoint.model_validate(point) for point in series],
+    )
+
+
+@router.get("/distribution", response_model=EnergyDistribution)
+async def get_energy_distribution(db: AsyncSession = Depends(get_db)):
+    """How many lifters sit in each rank tier, from the energy histogram."""
+
+    buckets = await get_distribution(db, HistogramKind.ENERGY, ENERGY_KEY)
+    tiers: dict[str, int] = {}
+    for bucket in buckets:
+        # Tier thresholds are multiples of the bucket width, so a bucket
+        # never straddles two tiers.
+        rank = _rank_from_energy(bucket.lower)
+        tiers[rank] = tiers.get(rank, 0) + bucket.count
+    return EnergyDistribution(
+        bucket_width=BUCKET_WIDTHS[HistogramKind.ENERGY],
+        total=sum(bucket.count for bucket in buckets),
+        tiers=[RankTierCount(rank=rank, count=count) for rank, count in tiers.items()],
+        buckets=[HistogramBucketOut.model_validate(bucket) for bucket in buckets],
+    )
+
+
+@router.get("/percentile/{user_id}", response_model=PercentileOut)
+async def get_energy_percentile(user_id: UUID, db: AsyncSession = Depends(get_db)):
+    """Share of lifters with less energy than the user."""
+
+    result = await db.execute(select(User.energy).where(User.id == user_id))
+    current = result.first()
+    if current is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    percentile = await get_percentile(
+        db, HistogramKind.ENERGY, ENERGY_KEY, float(current.energy or 0.0)
+    )
+    return PercentileOut.model_validate(percentile)
+
+
 @router.get("/latest/{user_id}", response_model=int)
 async def get_latest_energy(user_id: UUID, db: AsyncSession = Depends(get_db)):
     stmt = select(User.energy).where(User.id == user_id)
@@ -0,0 +1,73 @@
+# backend/app/api/v1/feed.py
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.auth import get_current_principal
+from app.api.v1.deps import get_db
+from app.schemas.feed import FeedActor, FeedItemRead
+from app.services import feed_service
+from app.services.principal_cache import AuthenticatedUser
+from app.utils.datetime import ensure_aware_utc
+from app.utils.pagination import decode_cursor, encode_cursor
+
+router = APIRouter(prefix="/feed", tags=["feed"])
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _decode_feed_cursor(cursor: str) -> tuple[datetime, UUID]:
+    raw_created, raw_id = decode_cursor(cursor, size=2)
+    try:
+        created_at = ensure_aware_utc(
+            datetime.fromisoformat(raw_created), field_name="cursor", allow_naive=True
+        )
+        return created_at, UUID(raw_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("", response_model=list[FeedItemRead])
+async def get_feed(
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
+) -> list[FeedItemRead]:
+    """Newest-first personal bests and workouts from followed accounts.
+
+    The cursor for the next page, if any, is returned in the
+    ``X-Next-Cursor`` header.
+    """
+
+    entries = await feed_service.get_feed(
+        db,
+        current_user.id,
+        limit=limit,
+        after=_decode_feed_cursor(cursor) if cursor else None,
+    )
+    if len(entries) == limit:
+        last = entries[-1].item
+        created_at = ensure_aware_utc(
+            last.created_at, field_name="created_at", allow_naive=True
+        )
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [created_at.isoformat(), last.id]
+        )
+    return [
+        FeedItemRead(
+            id=entry.item.id,
+            kind=entry.item.kind,
+            source_id=entry.item.source_id,
+            summary=entry.item.summary or {},
+            created_at=entry.item.created_at,
+            actor=FeedActor.model_validate(entry.actor),
+        )
+        for entry in entries
+    ]
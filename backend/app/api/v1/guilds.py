@@ -3,11 +3,11 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.auth import get_current_user
+from app.api.v1.auth import get_current_principal
 from app.api.v1.deps import get_db
-from app.models.user import User
 from app.schemas.guild import GuildCreate, GuildRead
 from app.services.guild_service import create_guild, get_user_guilds
+from app.services.principal_cache import AuthenticatedUser
 
 router = APIRouter(prefix="/guilds", tags=["guilds"])
 
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/guilds", tags=["guilds"])
 async def create_user_guild(
     guild_in: GuildCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     return await create_guild(db, guild_in, current_user)
 
@@ -24,6 +24,6 @@ async def create_user_guild(
 @router.get("/", response_model=list[GuildRead])
 async def get_my_guilds(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     return await get_user_guilds(db, current_user.id)
@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.auth import get_current_user
+from app.api.v1.auth import get_current_principal
 from app.api.v1.deps import get_db
 from app.models.user import User
 from app.schemas.level import AwardXPRequest, AwardXPResponse, LevelProgress
@@ -15,6 +15,7 @@ from app.services.level_service import (
     get_level_progress,
     xp_gained_this_week,
 )
+from app.services.principal_cache import AuthenticatedUser
 from app.services.user_service import get_user_by_id
 
 router = APIRouter(prefix="/levels", tags=["levels"])
@@ -36,7 +37,7 @@ async def _to_schema(
 @router.get("/me", response_model=LevelProgress)
 async def read_my_level(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> LevelProgress:
     stats = await get_level_progress(db, current_user.id)
     return await _to_schema(db, current_user.id, stats)
@@ -64,7 +65,7 @@ async def award_my_level_xp(
     payload: AwardXPRequest,
     idempotency_key_header: str | None = Header(default=None, alias="Idempotency-Key"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> AwardXPResponse:
     reason = payload.reason.strip() if payload.reason else None
     header_key = idempotency_key_header.strip() if idempotency_key_header else None
@@ -14,6 +14,7 @@ from app.schemas.payment import (
     StripeCheckoutSessionResponse,
     StripePortalSessionResponse,
 )
+from app.services.principal_cache import invalidate_principal
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
@@ -136,6 +137,7 @@ async def stripe_webhook(request: Request, db: AsyncSession = Depends(get_db)):
             user.stripe_subscription_id = stripe_subscription_id
             db.add(user)
             await db.commit()
+            invalidate_principal(user.id)
         else:
             pass
     elif event["type"] == "customer.subscription.deleted":
@@ -7,10 +7,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_db
-from app.core.auth import get_current_user
+from app.core.auth import get_current_principal
 from app.models.personal_best_event import PersonalBestEvent
-from app.models.user import User
 from app.schemas.personal_best_event import PersonalBestEventRead
+from app.services.principal_cache import AuthenticatedUser
 
 router = APIRouter(prefix="/personal_best_events", tags=["Personal Best Events"])
 
@@ -20,7 +20,7 @@ async def list_personal_best_events(
     user_id: UUID,
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
-    _current_user: User = Depends(get_current_user),
+    _current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     stmt = (
         select(PersonalBestEvent)
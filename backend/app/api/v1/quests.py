@@ -7,15 +7,22 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.auth import get_current_user
+from app.api.v1.auth import get_current_principal
 from app.api.v1.deps import get_db
-from app.models.user import User
-from app.schemas.quest import QuestInstance, QuestListResponse
-from app.services.quest_service import claim_user_quest, get_user_quests
+from app.models.quest import UserQuestHistory
+from app.schemas.quest import QuestHistoryResponse, QuestInstance, QuestListResponse
+from app.services.principal_cache import AuthenticatedUser
+from app.services.quest_service import (
+    claim_user_quest,
+    get_user_quest_history,
+    get_user_quests,
+)
+from app.utils.datetime import ensure_aware_utc
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/quests", tags=["quests"])
 
@@ -27,14 +34,55 @@ def _now() -> datetime:
 @router.get("/me", response_model=QuestListResponse)
 async def read_my_quests(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> QuestListResponse:
     timestamp = _now()
     quests = await get_user_quests(db, current_user.id, now=timestamp)
-    payload = [QuestInstance.from_model(q) for q in quests]
+    payload = [QuestInstance.from_model(q, now=timestamp) for q in quests]
     return QuestListResponse(generated_at=timestamp, quests=payload)
 
 
+def _decode_history_cursor(cursor: str) -> tuple[datetime, UUID]:
+    raw_start, raw_id = decode_cursor(cursor, size=2)
+    try:
+        cycle_start = ensure_aware_utc(
+            datetime.fromisoformat(raw_start), field_name="cursor", allow_naive=True
+        )
+        return cycle_start, UUID(raw_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("/me/history", response_model=QuestHistoryResponse)
+async def read_my_quest_history(
+    cursor: str | None = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
+) -> QuestHistoryResponse:
+    timestamp = _now()
+    before = _decode_history_cursor(cursor) if cursor else None
+    quests = await get_user_quest_history(
+        db, current_user.id, limit=limit, before=before, now=timestamp
+    )
+    next_cursor = None
+    if len(quests) == limit:
+        last = quests[-1]
+        last_start = ensure_aware_utc(
+            last.cycle_start, field_name="cycle_start", allow_naive=True
+        )
+        next_cursor = encode_cursor([last_start.isoformat(), last.id])
+    return QuestHistoryResponse(
+        quests=[
+            QuestInstance.from_history(q)
+            if isinstance(q, UserQuestHistory)
+            else QuestInstance.from_model(q, now=timestamp)
+            for q in quests
+        ],
+        next_cursor=next_cursor,
+    )
+
+
 @router.post(
     "/me/{quest_id}/claim",
     response_model=QuestInstance,
@@ -43,7 +91,7 @@ async def read_my_quests(
 async def claim_my_quest(
     quest_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> QuestInstance:
     try:
         quest = await claim_user_quest(db, current_user.id, quest_id, now=_now())
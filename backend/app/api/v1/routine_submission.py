@@ -1,19 +1,24 @@
 # backend/app/api/v1/routine_submission.py
 
-from typing import List
+from datetime import datetime
+from typing import List, Union
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.api.v1.deps import get_db
-from app.core.auth import get_current_user
-from app.models.routine_submission import RoutineSubmission
-from app.models.user import User
+from app.api.v1.deps import SessionFactory, get_db, get_session_factory
+from app.core.auth import get_current_principal
 from app.schemas.routine_submission import (RoutineSubmissionCreate,
-                                            RoutineSubmissionRead)
-from app.services.routine_submission_service import create_routine_submission
+                                            RoutineSubmissionRead,
+                                            RoutineSubmissionSummary)
+from app.services.principal_cache import AuthenticatedUser
+from app.services.routine_submission_service import (create_routine_submission,
+                                                     get_user_submissions,
+                                                     user_submissions_query)
+from app.utils.datetime import ensure_aware_utc
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/routine_submission", tags=["routine_submission"])
 
@@ -24,35 +29,85 @@ router = APIRouter(prefix="/routine_submission", tags=["routine_submission"])
 async def submit_routine(
     routine_submission_data: RoutineSubmissionCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     try:
         submission = await create_routine_submission(
             db, routine_submission_data, current_user
         )
-        await db.refresh(submission)
-
-        result = await db.execute(
-            select(RoutineSubmission)
-            .options(selectinload(RoutineSubmission.scenario_submissions))
-            .where(RoutineSubmission.id == submission.id)
-        )
-        loaded = result.scalars().first()
-        return RoutineSubmissionRead.model_validate(loaded)
+        return RoutineSubmissionRead.model_validate(submission)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/user/{user_id}", response_model=List[RoutineSubmissionRead])
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_HISTORY_LIMIT = 50
+
+
+def _decode_history_cursor(cursor: str) -> tuple[datetime, UUID]:
+    raw_completed, raw_id = decode_cursor(cursor, size=2)
+    try:
+        completed_at = ensure_aware_utc(
+            datetime.fromisoformat(raw_completed), field_name="cursor", allow_naive=True
+        )
+        return completed_at, UUID(raw_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get(
+    "/user/{user_id}",
+    response_model=Union[List[RoutineSubmissionRead], List[RoutineSubmissionSummary]],
+)
 async def get_user_routine_history(
-    user_id: str,
+    user_id: UUID,
+    request: Request,
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=200),
+    since: datetime | None = Query(None),
+    until: datetime | None = Query(None),
+    summary: bool = Query(False),
+    format: str | None = Query(None, pattern="^(json|ndjson)$"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_session_factory),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
-    result = await db.execute(
-        select(RoutineSubmission)
-        .options(selectinload(RoutineSubmission.scenario_submissions))
-        .where(RoutineSubmission.user_id == user_id)
+    """Newest-first page of a user's submissions.
+
+    The body stays a plain list; the cursor for the next page, if any, is
+    returned in the ``X-Next-Cursor`` header. Requests that send neither
+    ``limit`` nor ``cursor`` get the whole filtered history, as clients that
+    predate pagination expect. ``summary=true`` omits the
+    per-scenario rows. With ``format=ndjson`` (or ``Accept:
+    application/x-ndjson``) the whole filtered history is streamed one
+    submission per line unless ``limit`` is given.
+    """
+
+    schema = RoutineSubmissionSummary if summary else RoutineSubmissionRead
+    filters = dict(
+        before=_decode_history_cursor(cursor) if cursor else None,
+        since=ensure_aware_utc(since, field_name="since", allow_naive=True) if since else None,
+        until=ensure_aware_utc(until, field_name="until", allow_naive=True) if until else None,
+        include_scenarios=not summary,
     )
-    submissions = result.scalars().all()
-    return [RoutineSubmissionRead.model_validate(sub) for sub in submissions]
+    if wants_ndjson(request, format):
+        return ndjson_response(
+            session_factory, user_submissions_query(user_id, limit=limit, **filters), schema
+        )
+
+    if limit is None and cursor is None:
+        submissions = await get_user_submissions(db, user_id, **filters)
+        return [schema.model_validate(sub) for sub in submissions]
+
+    limit = limit or DEFAULT_HISTORY_LIMIT
+    submissions = await get_user_submissions(db, user_id, limit=limit, **filters)
+    if len(submissions) == limit:
+        last = submissions[-1]
+        last_completed = ensure_aware_utc(
+            last.completion_timestamp, field_name="completion_timestamp", allow_naive=True
+        )
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [last_completed.isoformat(), last.id]
+        )
+    return [schema.model_validate(sub) for sub in submissions]
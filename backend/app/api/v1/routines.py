@@ -7,13 +7,13 @@ from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.auth import get_current_user
+from app.api.v1.auth import get_current_principal
 from app.api.v1.deps import get_db
 from app.models.routine import Routine
-from app.models.user import User
 from app.schemas.routine import RoutineCreate, RoutineRead, RoutineUpdate
 from app.schemas.routine_share import RoutineImportRequest, RoutineShareRead
 from app.services import routine_service
+from app.services.principal_cache import AuthenticatedUser
 from app.utils.storage import build_public_url, save_image_upload
 
 router = APIRouter(prefix="/routines", tags=["Routines"])
@@ -27,7 +27,7 @@ router = APIRouter(prefix="/routines", tags=["Routines"])
 async def upload_routine_image(
     request: Request,
     file: UploadFile = File(..., alias="image"),
-    _current_user: User = Depends(get_current_user),
+    _current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     storage_key = await save_image_upload(file, subdir="routine-images")
     public_url = build_public_url(storage_key)
@@ -45,7 +45,7 @@ async def upload_routine_image(
 async def create_routine(
     payload: RoutineCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     if current_user.subscription_level == "free":
         result = await db.execute(
@@ -69,7 +69,7 @@ async def create_routine(
 )
 async def list_user_routines(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     routines = await routine_service.get_user_routines(db, current_user.id)
     return routines
@@ -83,7 +83,7 @@ async def list_user_routines(
 async def get_routine_by_id(
     routine_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     routine = await routine_service.get_routine_read(db, routine_id)
     if not routine:
@@ -100,7 +100,7 @@ async def update_routine_by_id(
     routine_id: UUID,
     updated_data: RoutineUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     routine_orm = await routine_service.get_routine(db, routine_id)
     if not routine_orm:
@@ -123,7 +123,7 @@ async def update_routine_by_id(
 async def delete_routine_by_id(
     routine_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     routine_orm = await routine_service.get_routine(db, routine_id)
     if not routine_orm:
@@ -145,7 +145,7 @@ async def delete_routine_by_id(
 async def create_routine_share_code(
     routine_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     routine = await routine_service.get_routine(db, routine_id)
     if not routine:
@@ -185,7 +185,7 @@ async def get_shared_routine_snapshot(
 async def import_routine_by_share_code(
     payload: RoutineImportRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     share = await routine_service.get_routine_share_snapshot(db, payload.share_code)
     if not share:
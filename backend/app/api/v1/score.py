@@ -1,31 +1,60 @@
 # backend/app/api/v1/score.py
 
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.v1.auth import get_current_user
-from app.api.v1.deps import get_db
+from app.api.v1.auth import get_current_principal
+from app.api.v1.deps import SessionFactory, get_db, get_session_factory
+from app.db.functions import advisory_lock_key, advisory_xact_lock
 from app.models.score import Score
 from app.models.personal_best_event import PersonalBestEvent
 from app.models.scenario import Scenario
-from app.models.user import User
 from app.schemas.score import (
     ScoreCreate,
     ScoreCreateResponse,
     ScoreOut,
     ScoreReadWithUser,
 )
+from app.schemas.distribution import HistogramBucketOut, PercentileOut, ScoreDistribution
 from app.services.energy_service import update_energy_if_personal_best
+from app.services.feed_service import FeedItemKind, add_feed_item
+from app.services.histogram_service import (
+    BUCKET_WIDTHS,
+    HistogramKind,
+    adjust_histogram,
+    get_distribution,
+    get_percentile,
+)
+from app.services.leaderboard_service import (
+    LeaderboardWindow,
+    following_score_leaderboard,
+    record_period_bests,
+    windowed_score_leaderboard,
+)
 from app.services.level_service import award_xp
+from app.services.outbox_service import add_outbox_event
+from app.services.principal_cache import AuthenticatedUser
+from app.services.rate_limiter import DistributedRateLimiter
 from app.services.score_service import calculate_score_value
 from app.services.user_service import get_user_by_id
+from app.tasks.feed_tasks import FEED_FANOUT_TOPIC, build_feed_fanout_payload
+from app.utils.datetime import ensure_aware_utc
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/scores", tags=["Scores"])
 
+score_rate_limiter = DistributedRateLimiter(
+    action="score_submit",
+    limit=300,
+    window=timedelta(hours=1),
+)
+
 
 def _effective_multiplier(value: float | None) -> float:
     if value is None:
@@ -105,6 +134,12 @@ async def _create_score_entry(
     payload: ScoreCreate,
     user_id: UUID,
 ) -> tuple[Score, bool, Score | None]:
+    await score_rate_limiter.check(db, user_id)
+    # Concurrent submissions for the same lift would both read the same
+    # previous best and move it out of its histogram bucket twice.
+    await db.execute(
+        select(advisory_xact_lock(advisory_lock_key("score", user_id, scenario.id)))
+    )
     previous_best_stmt = (
         select(Score)
         .where(Score.user_id == user_id, Score.scenario_id == scenario.id)
@@ -137,15 +172,46 @@ async def _create_score_entry(
     db.add(db_score)
 
     if is_personal_best:
-        db.add(
-            PersonalBestEvent(
-                user_id=user_id,
-                scenario_id=scenario.id,
-                score_value=score_value,
-                weight_lifted=payload.weight_lifted,
-                reps=payload.reps,
-                is_bodyweight=scenario.is_bodyweight,
-            )
+        await adjust_histogram(
+            db,
+            HistogramKind.SCENARIO,
+            scenario.id,
+            old=previous_best.score_value if previous_best is not None else None,
+            new=score_value,
+        )
+        personal_best_event = PersonalBestEvent(
+            user_id=user_id,
+            scenario_id=scenario.id,
+            score_value=score_value,
+            weight_lifted=payload.weight_lifted,
+            reps=payload.reps,
+            is_bodyweight=scenario.is_bodyweight,
+        )
+        db.add(personal_best_event)
+
+    await db.flush()
+    await record_period_bests(db, db_score)
+    if is_personal_best:
+        # Follower inboxes are filled by the outbox relay, committed with the PR.
+        feed_item = add_feed_item(
+            db,
+            actor_id=user_id,
+            kind=FeedItemKind.PERSONAL_BEST,
+            source_id=personal_best_event.id,
+            summary={
+                "scenario_id": scenario.id,
+                "scenario_name": scenario.name,
+                "score_value": score_value,
+                "weight_lifted": payload.weight_lifted,
+                "reps": payload.reps,
+                "is_bodyweight": bool(scenario.is_bodyweight),
+            },
+            occurred_at=personal_best_event.created_at,
+        )
+        add_outbox_event(
+            db,
+            topic=FEED_FANOUT_TOPIC,
+            payload=build_feed_fanout_payload(item_id=feed_item.id),
         )
 
     await db.commit()
@@ -181,7 +247,7 @@ async def _create_score_entry(
 async def create_score(
     score: ScoreCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     if not score.scenario_id:
         raise HTTPException(
@@ -208,7 +274,7 @@ async def create_score_for_scenario(
     scenario_id: str,
     score: ScoreCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     scenario = await db.get(Scenario, scenario_id)
     if not scenario:
@@ -249,7 +315,23 @@ async def get_leaderboard(
     db: AsyncSession = Depends(get_db),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    window: LeaderboardWindow = Query(LeaderboardWindow.ALL),
 ):
+    if window is not LeaderboardWindow.ALL:
+        bests = await windowed_score_leaderboard(
+            db, scenario_id, window, offset=offset, limit=limit
+        )
+        return [
+            ScoreReadWithUser(
+                id=best.score_id,
+                weight_lifted=best.weight_lifted,
+                score_value=best.score_value,
+                created_at=best.achieved_at,
+                user=best.user,
+            )
+            for best in bests
+        ]
+
     subquery = (
         select(Score.user_id, func.max(Score.score_value).label("max_score"))
         .where(Score.scenario_id == scenario_id)
@@ -279,17 +361,112 @@ async def get_leaderboard(
     return result.scalars().all()
 
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _decode_score_cursor(cursor: str) -> tuple[float, datetime, int]:
+    raw_value, raw_created, raw_id = decode_cursor(cursor, size=3)
+    try:
+        created_at = ensure_aware_utc(
+            datetime.fromisoformat(raw_created), field_name="cursor", allow_naive=True
+        )
+        return float(raw_value), created_at, int(raw_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get(
+    "/scenario/{scenario_id}/leaderboard/following",
+    response_model=list[ScoreReadWithUser],
+)
+async def get_following_leaderboard(
+    scenario_id: str,
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
+):
+    """Best scores of the current user and everyone they follow.
+
+    Keyset-paginated: pass the ``X-Next-Cursor`` response header back as
+    ``cursor`` to fetch the next page.
+    """
+
+    scores = await following_score_leaderboard(
+        db,
+        current_user.id,
+        scenario_id,
+        limit=limit,
+        after=_decode_score_cursor(cursor) if cursor else None,
+    )
+    if len(scores) == limit:
+        last = scores[-1]
+        last_created = ensure_aware_utc(
+            last.created_at, field_name="created_at", allow_naive=True
+        )
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [last.score_value, last_created.isoformat(), last.id]
+        )
+    return scores
+
+
+@router.get("/scenario/{scenario_id}/distribution", response_model=ScoreDistribution)
+async def get_score_distribution(
+    scenario_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """Histogram of every lifter's best score for the scenario."""
+
+    buckets = await get_distribution(db, HistogramKind.SCENARIO, scenario_id)
+    return ScoreDistribution(
+        scenario_id=scenario_id,
+        bucket_width=BUCKET_WIDTHS[HistogramKind.SCENARIO],
+        total=sum(bucket.count for bucket in buckets),
+        buckets=[HistogramBucketOut.model_validate(bucket) for bucket in buckets],
+    )
+
+
+@router.get(
+    "/scenario/{scenario_id}/percentile/{user_id}", response_model=PercentileOut
+)
+async def get_score_percentile(
+    scenario_id: str,
+    user_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Share of lifters whose best score is below the user's best."""
+
+    result = await db.execute(
+        select(func.max(Score.score_value)).where(
+            Score.user_id == user_id, Score.scenario_id == scenario_id
+        )
+    )
+    best = result.scalar_one_or_none()
+    if best is None:
+        raise HTTPException(
+            status_code=404, detail="No score found for this user and scenario"
+        )
+    percentile = await get_percentile(db, HistogramKind.SCENARIO, scenario_id, best)
+    return PercentileOut.model_validate(percentile)
+
+
 @router.get("/user/{user_id}/scenario/{scenario_id}", response_model=list[ScoreOut])
 async def get_user_score_history(
     user_id: UUID,
     scenario_id: str,
+    request: Request,
+    format: str | None = Query(None, pattern="^(json|ndjson)$"),
     db: AsyncSession = Depends(get_db),
+    session_factory: SessionFactory = Depends(get_session_factory),
 ):
     stmt = (
         select(Score)
         .where(Score.user_id == user_id, Score.scenario_id == scenario_id)
         .order_by(Score.created_at.desc())
     )
+    if wants_ndjson(request, format):
+        return ndjson_response(session_factory, stmt, ScoreOut)
     result = await db.execute(stmt)
     return result.scalars().all()
 
@@ -321,7 +498,7 @@ async def get_user_high_score(
 async def delete_all_user_scores(
     user_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     if current_user.id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
@@ -333,7 +510,15 @@ async def delete_all_user_scores(
     if not user_scores:
         raise HTTPException(status_code=404, detail="No scores found for this user")
 
+    bests: dict[str, float] = {}
     for score in user_scores:
+        bests[score.scenario_id] = max(
+            score.score_value, bests.get(score.scenario_id, score.score_value)
+        )
         await db.delete(score)
+    for scenario_id, best in bests.items():
+        await adjust_histogram(
+            db, HistogramKind.SCENARIO, scenario_id, old=best, new=None
+        )
 
     await db.commit()
@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.auth import get_current_user
+from app.api.v1.auth import get_current_principal
 from app.api.v1.deps import get_db
 from app.models.user import User
 from app.schemas.social import SocialListResponse, SocialUser
 from app.services import social_service
-from app.services.rate_limiter import DistributedRateLimiter
+from app.services.principal_cache import AuthenticatedUser
+from app.services.rate_limiter import DistributedRateLimiter, InMemoryRateLimitBackend
 from app.services.user_service import get_user_by_id
+from app.utils.datetime import ensure_aware_utc
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 follow_rate_limiter = DistributedRateLimiter(
@@ -23,6 +26,16 @@ follow_rate_limiter = DistributedRateLimiter(
     window=timedelta(hours=1),
 )
 
+# Generous enough for search-as-you-type, one request per keystroke. Kept
+# per process: a lookup must not write to the database on every keystroke,
+# and a loose anti-abuse limit does not need a shared budget.
+search_rate_limiter = DistributedRateLimiter(
+    action="user_search",
+    limit=120,
+    window=timedelta(minutes=1),
+    backend=InMemoryRateLimitBackend(),
+)
+
 router = APIRouter(prefix="/users", tags=["social"])
 
 
@@ -34,25 +47,60 @@ async def _ensure_user(db: AsyncSession, user_id: UUID) -> User:
 
 
 def _build_list_response(
-    entries: list[dict[str, object]], offset: int, total: int
+    entries: list[dict[str, object]],
+    offset: int,
+    total: int,
+    *,
+    has_more: bool | None = None,
+    cursor: str | None = None,
 ) -> SocialListResponse:
+    """Wrap a page of entries.
+
+    ``has_more`` comes from the page query itself; without it the page is
+    compared against ``total``. Pages addressed by ``cursor`` have no
+    meaningful offset, so ``next_offset`` is left null for them.
+    """
+
     items = [SocialUser.model_validate(entry) for entry in entries]
     count = len(items)
-    next_offset = offset + count if (count and offset + count < total) else None
+    if has_more is None:
+        has_more = bool(count) and offset + count < total
+    next_offset = offset + count if (has_more and cursor is None) else None
+    next_cursor = None
+    if has_more and items[-1].followed_at is not None:
+        last = items[-1]
+        followed_at = ensure_aware_utc(
+            last.followed_at, field_name="followed_at", allow_naive=True
+        )
+        next_cursor = encode_cursor([followed_at.isoformat(), last.id])
     return SocialListResponse(
         items=items,
         count=count,
         total=total,
         offset=offset,
         next_offset=next_offset,
+        next_cursor=next_cursor,
     )
 
 
+def _decode_list_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+    if cursor is None:
+        return None
+    raw_followed_at, raw_id = decode_cursor(cursor, size=2)
+    try:
+        followed_at = ensure_aware_utc(
+            datetime.fromisoformat(raw_followed_at), field_name="cursor", allow_naive=True
+        )
+        return followed_at, UUID(raw_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
 @router.get("/{user_id}/relationship", response_model=SocialUser)
 async def get_relationship(
     user_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> SocialUser:
     target = await _ensure_user(db, user_id)
     summary = await social_service.get_user_relationship(db, target, current_user.id)
@@ -63,7 +111,7 @@ async def get_relationship(
 async def follow_user(
     user_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> Response:
     if current_user.id == user_id:
         raise HTTPException(
@@ -80,7 +128,7 @@ async def follow_user(
 async def unfollow_user(
     user_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> Response:
     target = await _ensure_user(db, user_id)
     await follow_rate_limiter.check(db, current_user.id)
@@ -93,14 +141,17 @@ async def list_followers(
     user_id: UUID,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> SocialListResponse:
     await _ensure_user(db, user_id)
-    entries, total = await social_service.get_followers(
-        db, user_id, current_user.id, offset, limit
+    entries, total, has_more = await social_service.get_followers(
+        db, user_id, current_user.id, offset, limit, after=_decode_list_cursor(cursor)
+    )
+    return _build_list_response(
+        entries, offset, total, has_more=has_more, cursor=cursor
     )
-    return _build_list_response(entries, offset, total)
 
 
 @router.get("/{user_id}/following", response_model=SocialListResponse)
@@ -108,14 +159,17 @@ async def list_following(
     user_id: UUID,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> SocialListResponse:
     await _ensure_user(db, user_id)
-    entries, total = await social_service.get_following(
-        db, user_id, current_user.id, offset, limit
+    entries, total, has_more = await social_service.get_following(
+        db, user_id, current_user.id, offset, limit, after=_decode_list_cursor(cursor)
+    )
+    return _build_list_response(
+        entries, offset, total, has_more=has_more, cursor=cursor
     )
-    return _build_list_response(entries, offset, total)
 
 
 @router.get("/{user_id}/friends", response_model=SocialListResponse)
@@ -123,14 +177,17 @@ async def list_mutuals(
     user_id: UUID,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> SocialListResponse:
     await _ensure_user(db, user_id)
-    entries, total = await social_service.get_mutuals(
-        db, user_id, current_user.id, offset, limit
+    entries, total, has_more = await social_service.get_mutuals(
+        db, user_id, current_user.id, offset, limit, after=_decode_list_cursor(cursor)
+    )
+    return _build_list_response(
+        entries, offset, total, has_more=has_more, cursor=cursor
     )
-    return _build_list_response(entries, offset, total)
 
 
 @router.get("/lookup", response_model=SocialListResponse)
@@ -139,11 +196,12 @@ async def search_users(
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ) -> SocialListResponse:
     query = q.strip()
     if not query:
         return _build_list_response([], offset, 0)
+    await search_rate_limiter.check(db, current_user.id)
     entries, total = await social_service.search_users(
         db, current_user.id, query, offset, limit
     )
@@ -4,19 +4,25 @@ from typing import Annotated
 from uuid import UUID
 
 import stripe
-from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.auth import get_current_user
+from app.api.v1.auth import get_current_principal, get_current_user
 from app.api.v1.deps import get_db
 from app.core.config import settings
 from app.core.security import create_access_token, create_refresh_token, decode_refresh_token
 from app.models import user as models
 from app.schemas import user as schemas
+from app.schemas.activity_summary import ActivitySummaryRead
+from app.schemas.training_volume import TrainingVolumeBucket, TrainingVolumeResponse
 from app.schemas.token import Token
 from sqlalchemy import select, delete
 from app.models.hidden_routine import HiddenRoutine
+from app.services.principal_cache import AuthenticatedUser, invalidate_principal
+from app.services.streak_service import get_activity_summary
+from app.services.training_volume_service import VolumeDimension, get_weekly_volume
+from app.services.user_search_index import user_search_index
 from app.services.user_service import (
     authenticate_user,
     create_user,
@@ -226,6 +232,7 @@ async def update_unit_preference(
     db.add(current_user)
     await db.commit()
     await db.refresh(current_user)
+    invalidate_principal(current_user.id)
     return current_user
 
 
@@ -238,6 +245,29 @@ async def read_user_by_id(user_id: UUID, db: AsyncSession = Depends(get_db)):
     return user
 
 
+@router.get("/{user_id}/activity-summary", response_model=ActivitySummaryRead)
+async def read_user_activity_summary(user_id: UUID, db: AsyncSession = Depends(get_db)):
+    summary = await get_activity_summary(db, user_id)
+    if summary is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {user_id} not found")
+    return summary
+
+
+@router.get("/{user_id}/training-volume", response_model=TrainingVolumeResponse)
+async def read_user_training_volume(
+    user_id: UUID,
+    group_by: VolumeDimension = Query(VolumeDimension.MUSCLE),
+    weeks: int = Query(12, ge=1, le=104),
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
+):
+    rows = await get_weekly_volume(db, user_id, dimension=group_by, weeks=weeks)
+    return TrainingVolumeResponse(
+        dimension=group_by,
+        buckets=[TrainingVolumeBucket.model_validate(row) for row in rows],
+    )
+
+
 @router.get("/username/{username}", response_model=schemas.UserRead)
 async def get_user_uuid_by_username(username: str, db: AsyncSession = Depends(get_db)):
     user = await get_user_by_username(db, username)
@@ -261,6 +291,8 @@ async def upload_avatar(
     db.add(current_user)
     await db.commit()
     await db.refresh(current_user)
+    if user_search_index.ready or user_search_index.loading:
+        user_search_index.upsert(current_user)
 
     return current_user
 
@@ -279,7 +311,7 @@ async def delete_current_user(
 @router.get("/me/hidden-routines", response_model=list[str])
 async def get_hidden_routines(
     db: AsyncSession = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     result = await db.execute(select(HiddenRoutine.routine_id).where(HiddenRoutine.user_id == current_user.id))
     rows = result.scalars().all()
@@ -291,7 +323,7 @@ async def get_hidden_routines(
 async def hide_routine(
     routine_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     try:
         entry = HiddenRoutine(user_id=current_user.id, routine_id=routine_id)
@@ -307,7 +339,7 @@ async def hide_routine(
 async def unhide_routine(
     routine_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_principal),
 ):
     await db.execute(
         delete(HiddenRoutine).where(
@@ -2,6 +2,7 @@
 
 import logging
 from typing import Optional
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, WebSocket, status
 from fastapi.security import OAuth2PasswordBearer
@@ -13,6 +14,11 @@ from app.core.config import settings
 from app.db.session import async_session
 from app.models.user import User
 from app.schemas.user import UserRead
+from app.services.principal_cache import (
+    AuthenticatedUser,
+    invalidate_principal,
+    load_principal,
+)
 from app.services.user_service import get_user_by_id
 
 logging.basicConfig(level=logging.ERROR)
@@ -27,13 +33,10 @@ async def get_current_user_ws(
     db: AsyncSession,
 ) -> Optional[UserRead]:
     try:
-        logger.debug(f"[WS AUTH] token: {token}")
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        logger.debug(f"[WS AUTH] payload: {payload}")
         user_id = payload.get("sub")
-        logger.debug(f"[WS AUTH] extracted user_id: {user_id}")
 
         if not user_id:
             logger.warning("[WS AUTH] no sub claim in token")
@@ -41,9 +44,8 @@ async def get_current_user_ws(
             return None
 
         user = await db.get(User, user_id)
-        logger.debug(f"[WS AUTH] resolved user: {user}")
         if not user:
-            logger.warning(f"[WS AUTH] no user found with id: {user_id}")
+            logger.warning("[WS AUTH] no user found with id: %s", user_id)
             await websocket.close(code=1008)
             return None
 
@@ -55,31 +57,48 @@ async def get_current_user_ws(
         return None
 
 
-async def get_current_user(
+async def get_current_principal(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
-) -> User:
+) -> AuthenticatedUser:
+    """The caller's slim principal; cached, so most requests skip ``users``."""
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        logger.debug(f"Authorization token received: {token}")
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        logger.debug(f"Decoded JWT payload: {payload}")
-        user_id: Optional[str] = payload.get("sub")
-        if user_id is None:
-            logger.warning("JWT token does not contain 'sub' claim.")
-            raise credentials_exception
+        user_id = UUID(str(payload["sub"]))
     except JWTError as e:
-        logger.warning(f"JWT decoding error: {e}")
+        logger.warning("JWT decoding error: %s", e)
+        raise credentials_exception
+    except (KeyError, ValueError):
+        logger.warning("JWT token does not contain a valid 'sub' claim.")
         raise credentials_exception
 
-    user = await get_user_by_id(db, user_id)
-    if user is None:
-        logger.warning(f"User not found for id: {user_id}")
+    principal = await load_principal(db, user_id)
+    if principal is None:
+        logger.warning("User not found for id: %s", user_id)
         raise credentials_exception
+    return principal
+
+
+async def get_current_user(
+    principal: AuthenticatedUser = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """The caller's full ``User`` row, for endpoints that read or modify it."""
+
+    user = await get_user_by_id(db, principal.id)
+    if user is None:
+        invalidate_principal(principal.id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
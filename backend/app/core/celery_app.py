@@ -81,6 +81,62 @@ celery_app.conf.update(
     broker_connection_retry_on_startup=True,
     task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
     task_eager_propagates=True,
+    imports=(
+        "app.tasks.quest_tasks",
+        "app.tasks.analytics_tasks",
+        "app.tasks.export_tasks",
+        "app.tasks.outbox_tasks",
+        "app.tasks.energy_tasks",
+        "app.tasks.social_tasks",
+        "app.tasks.feed_tasks",
+        "app.tasks.rate_limit_tasks",
+    ),
+    beat_schedule={
+        "outbox-relay": {
+            "task": "outbox.relay_events",
+            "schedule": settings.OUTBOX_RELAY_INTERVAL_SECONDS,
+        },
+        "quests-expire-stale": {
+            "task": "quests.expire_stale",
+            "schedule": 300.0,
+        },
+        "quests-archive-history": {
+            "task": "quests.archive_history",
+            "schedule": 86400.0,
+        },
+        "outbox-purge": {
+            "task": "outbox.purge_published",
+            "schedule": 3600.0,
+        },
+        "analytics-rebuild-rank-histograms": {
+            "task": "analytics.rebuild_rank_histograms",
+            "schedule": 86400.0,
+        },
+        "analytics-purge-leaderboard-periods": {
+            "task": "analytics.purge_leaderboard_periods",
+            "schedule": 86400.0,
+        },
+        "exports-purge-expired": {
+            "task": "exports.purge_expired",
+            "schedule": 86400.0,
+        },
+        "energy-compact-history": {
+            "task": "energy.compact_history",
+            "schedule": 86400.0,
+        },
+        "social-reconcile-follow-counts": {
+            "task": "social.reconcile_follow_counts",
+            "schedule": 86400.0,
+        },
+        "feed-trim-inboxes": {
+            "task": "feed.trim_inboxes",
+            "schedule": 3600.0,
+        },
+        "rate-limits-purge-events": {
+            "task": "rate_limits.purge_events",
+            "schedule": 600.0,
+        },
+    },
 )
 
 celery_app.autodiscover_tasks(["app.tasks"])
@@ -68,6 +68,183 @@ class Settings(BaseSettings):
         ),
     )
 
+    OUTBOX_RELAY_IN_PROCESS: Optional[bool] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "OUTBOX_RELAY_IN_PROCESS",
+            "outbox_relay_in_process",
+        ),
+    )
+    OUTBOX_RELAY_INTERVAL_SECONDS: float = Field(
+        default=2.0,
+        validation_alias=AliasChoices(
+            "OUTBOX_RELAY_INTERVAL_SECONDS",
+            "outbox_relay_interval_seconds",
+        ),
+    )
+    OUTBOX_RELAY_BATCH_SIZE: int = Field(
+        default=100,
+        validation_alias=AliasChoices(
+            "OUTBOX_RELAY_BATCH_SIZE",
+            "outbox_relay_batch_size",
+        ),
+    )
+    OUTBOX_RETENTION_DAYS: int = Field(
+        default=7,
+        validation_alias=AliasChoices(
+            "OUTBOX_RETENTION_DAYS",
+            "outbox_retention_days",
+        ),
+    )
+
+    QUEST_ARCHIVE_AFTER_DAYS: int = Field(
+        default=30,
+        validation_alias=AliasChoices(
+            "QUEST_ARCHIVE_AFTER_DAYS",
+            "quest_archive_after_days",
+        ),
+    )
+
+    EXPORT_CHUNK_ROWS: int = Field(
+        default=100_000,
+        validation_alias=AliasChoices(
+            "EXPORT_CHUNK_ROWS",
+            "export_chunk_rows",
+        ),
+    )
+
+    # History exports hold every user's data, so they must never be written
+    # under STATIC_STORAGE_DIR, which is served publicly at /static.
+    EXPORT_STORAGE_DIR: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "EXPORT_STORAGE_DIR",
+            "export_storage_dir",
+        ),
+    )
+
+    EXPORT_RETENTION_DAYS: int = Field(
+        default=7,
+        validation_alias=AliasChoices(
+            "EXPORT_RETENTION_DAYS",
+            "export_retention_days",
+        ),
+    )
+
+    ENERGY_DEDUPE_WINDOW_SECONDS: int = Field(
+        default=3600,
+        validation_alias=AliasChoices(
+            "ENERGY_DEDUPE_WINDOW_SECONDS",
+            "energy_dedupe_window_seconds",
+        ),
+    )
+
+    LEADERBOARD_PERIOD_RETENTION_DAYS: int = Field(
+        default=400,
+        validation_alias=AliasChoices(
+            "LEADERBOARD_PERIOD_RETENTION_DAYS",
+            "leaderboard_period_retention_days",
+        ),
+    )
+
+    FEED_FANOUT_MAX_FOLLOWERS: int = Field(
+        default=10_000,
+        validation_alias=AliasChoices(
+            "FEED_FANOUT_MAX_FOLLOWERS",
+            "feed_fanout_max_followers",
+        ),
+    )
+
+    FEED_INBOX_MAX_ITEMS: int = Field(
+        default=500,
+        validation_alias=AliasChoices(
+            "FEED_INBOX_MAX_ITEMS",
+            "feed_inbox_max_items",
+        ),
+    )
+
+    RATE_LIMIT_BACKEND: str = Field(
+        default="auto",
+        validation_alias=AliasChoices(
+            "RATE_LIMIT_BACKEND",
+            "rate_limit_backend",
+        ),
+    )
+
+    RATE_LIMIT_REDIS_URL: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "RATE_LIMIT_REDIS_URL",
+            "rate_limit_redis_url",
+        ),
+    )
+
+    RATE_LIMIT_EVENT_RETENTION_HOURS: int = Field(
+        default=24,
+        validation_alias=AliasChoices(
+            "RATE_LIMIT_EVENT_RETENTION_HOURS",
+            "rate_limit_event_retention_hours",
+        ),
+    )
+
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        validation_alias=AliasChoices(
+            "AUTH_PRINCIPAL_CACHE_TTL_SECONDS",
+            "auth_principal_cache_ttl_seconds",
+        ),
+    )
+
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000,
+        validation_alias=AliasChoices(
+            "AUTH_PRINCIPAL_CACHE_MAX_ENTRIES",
+            "auth_principal_cache_max_entries",
+        ),
+    )
+
+    PASSWORD_BCRYPT_ROUNDS: int = Field(
+        default=12,
+        validation_alias=AliasChoices("PASSWORD_BCRYPT_ROUNDS", "password_bcrypt_rounds"),
+    )
+
+    PASSWORD_REHASH_ON_LOGIN: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "PASSWORD_REHASH_ON_LOGIN",
+            "password_rehash_on_login",
+        ),
+    )
+
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4,
+        validation_alias=AliasChoices("PASSWORD_HASH_WORKERS", "password_hash_workers"),
+    )
+
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=64,
+        validation_alias=AliasChoices(
+            "PASSWORD_HASH_MAX_PENDING",
+            "password_hash_max_pending",
+        ),
+    )
+
+    USER_SEARCH_INDEX_ENABLED: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "USER_SEARCH_INDEX_ENABLED",
+            "user_search_index_enabled",
+        ),
+    )
+
+    USER_SEARCH_INDEX_REFRESH_SECONDS: float = Field(
+        default=300.0,
+        validation_alias=AliasChoices(
+            "USER_SEARCH_INDEX_REFRESH_SECONDS",
+            "user_search_index_refresh_seconds",
+        ),
+    )
+
     STATIC_STORAGE_DIR: Optional[str] = Field(
         default=None,
         validation_alias=AliasChoices(
@@ -178,6 +355,17 @@ class Settings(BaseSettings):
             static_dir = default_static_dir
         self.STATIC_STORAGE_DIR = static_dir
 
+        export_dir = (self.EXPORT_STORAGE_DIR or "").strip()
+        if export_dir:
+            export_dir = os.path.abspath(os.path.expanduser(export_dir))
+        else:
+            export_dir = os.path.abspath(
+                os.path.join(os.path.dirname(__file__), "..", "..", "exports")
+            )
+        if os.path.commonpath([export_dir, static_dir]) == static_dir:
+            raise ValueError("EXPORT_STORAGE_DIR must not be inside STATIC_STORAGE_DIR")
+        self.EXPORT_STORAGE_DIR = export_dir
+
         if not self.REFRESH_JWT_SECRET_KEY:
             self.REFRESH_JWT_SECRET_KEY = self.JWT_SECRET_KEY
         if self.COOKIE_SAMESITE:
@@ -190,6 +378,49 @@ class Settings(BaseSettings):
             self.COOKIE_DOMAIN = self.COOKIE_DOMAIN.strip()
         if self.CELERY_TASK_DEFAULT_QUEUE:
             self.CELERY_TASK_DEFAULT_QUEUE = self.CELERY_TASK_DEFAULT_QUEUE.strip() or "repduel"
+        if self.OUTBOX_RELAY_IN_PROCESS is None:
+            # Without a broker there is no beat scheduler, so relay from the API process.
+            self.OUTBOX_RELAY_IN_PROCESS = self.CELERY_TASK_ALWAYS_EAGER
+        if self.OUTBOX_RELAY_INTERVAL_SECONDS <= 0:
+            self.OUTBOX_RELAY_INTERVAL_SECONDS = 2.0
+        if self.OUTBOX_RELAY_BATCH_SIZE < 1:
+            self.OUTBOX_RELAY_BATCH_SIZE = 1
+        if self.OUTBOX_RETENTION_DAYS < 1:
+            self.OUTBOX_RETENTION_DAYS = 1
+        if self.QUEST_ARCHIVE_AFTER_DAYS < 1:
+            self.QUEST_ARCHIVE_AFTER_DAYS = 1
+        if self.EXPORT_CHUNK_ROWS < 1:
+            self.EXPORT_CHUNK_ROWS = 100_000
+        if self.EXPORT_RETENTION_DAYS < 1:
+            self.EXPORT_RETENTION_DAYS = 1
+        if self.ENERGY_DEDUPE_WINDOW_SECONDS < 0:
+            self.ENERGY_DEDUPE_WINDOW_SECONDS = 0
+        if self.LEADERBOARD_PERIOD_RETENTION_DAYS < 31:
+            # Never purge the month that is still being ranked.
+            self.LEADERBOARD_PERIOD_RETENTION_DAYS = 31
+        if self.FEED_FANOUT_MAX_FOLLOWERS < 0:
+            self.FEED_FANOUT_MAX_FOLLOWERS = 0
+        if self.FEED_INBOX_MAX_ITEMS < 1:
+            self.FEED_INBOX_MAX_ITEMS = 1
+        self.RATE_LIMIT_BACKEND = (self.RATE_LIMIT_BACKEND or "auto").strip().lower()
+        if self.RATE_LIMIT_BACKEND not in {"auto", "memory", "redis", "database"}:
+            self.RATE_LIMIT_BACKEND = "auto"
+        if self.RATE_LIMIT_EVENT_RETENTION_HOURS < 2:
+            # Never reap events still inside the longest (hourly) window.
+            self.RATE_LIMIT_EVENT_RETENTION_HOURS = 2
+        if self.AUTH_PRINCIPAL_CACHE_TTL_SECONDS < 0:
+            # Zero disables the cache.
+            self.AUTH_PRINCIPAL_CACHE_TTL_SECONDS = 0.0
+        if self.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES < 1:
+            self.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES = 1
+        # bcrypt accepts cost factors 4 through 31.
+        self.PASSWORD_BCRYPT_ROUNDS = min(max(self.PASSWORD_BCRYPT_ROUNDS, 4), 31)
+        if self.PASSWORD_HASH_WORKERS < 1:
+            self.PASSWORD_HASH_WORKERS = 1
+        if self.PASSWORD_HASH_MAX_PENDING < self.PASSWORD_HASH_WORKERS:
+            self.PASSWORD_HASH_MAX_PENDING = self.PASSWORD_HASH_WORKERS
+        if self.USER_SEARCH_INDEX_REFRESH_SECONDS < 10:
+            self.USER_SEARCH_INDEX_REFRESH_SECONDS = 10.0
         return self
 
 
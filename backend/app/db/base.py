@@ -13,7 +13,7 @@ from app.models.routine_submission import (RoutineScenarioSubmission,
 from app.models.scenario import Scenario
 from app.models.score import Score
 from app.models.user import User
-from app.models.quest import QuestTemplate, UserQuest
+from app.models.quest import QuestTemplate, UserQuest, UserQuestHistory
 from app.models.hidden_routine import HiddenRoutine
 from app.models.bodyweight_calibration import BodyweightCalibration
 from app.models.xp_event import XPEvent
@@ -22,3 +22,10 @@ from app.models.social import SocialEdge
 from app.models.personal_best_event import PersonalBestEvent
 from app.models.daily_workout_aggregate import DailyWorkoutAggregate
 from app.models.routine_share_snapshot import RoutineShareSnapshot
+from app.models.outbox_event import OutboxEvent
+from app.models.user_activity_summary import UserActivitySummary
+from app.models.training_volume import WeeklyTrainingVolume
+from app.models.energy_rollup import DailyEnergyRollup
+from app.models.rank_histogram import RankHistogramBucket
+from app.models.period_score_best import PeriodScoreBest
+from app.models.feed import FeedInbox, FeedItem
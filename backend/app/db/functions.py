@@ -0,0 +1,91 @@
+# backend/app/db/functions.py
+
+"""SQL functions that need a per-dialect spelling."""
+
+import hashlib
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement, ReturnTypeFromArgs
+
+
+class greatest(ReturnTypeFromArgs):
+    """``GREATEST(a, b, ...)``; SQLite spells it as the multi-argument ``max``."""
+
+    inherit_cache = True
+
+
+@compiles(greatest, "sqlite")
+def _compile_greatest_sqlite(element, compiler, **kw):
+    return "max(%s)" % compiler.process(element.clauses, **kw)
+
+
+class least(ReturnTypeFromArgs):
+    """``LEAST(a, b, ...)``; SQLite spells it as the multi-argument ``min``."""
+
+    inherit_cache = True
+
+
+@compiles(least, "sqlite")
+def _compile_least_sqlite(element, compiler, **kw):
+    return "min(%s)" % compiler.process(element.clauses, **kw)
+
+
+class utc_week_start(FunctionElement):
+    """Midnight UTC on the Monday of the week containing the timestamp."""
+
+    type = DateTime(timezone=True)
+    name = "utc_week_start"
+    inherit_cache = True
+
+
+@compiles(utc_week_start)
+def _compile_utc_week_start(element, compiler, **kw):
+    return "(date_trunc('week', %s AT TIME ZONE 'UTC') AT TIME ZONE 'UTC')" % (
+        compiler.process(element.clauses, **kw)
+    )
+
+
+@compiles(utc_week_start, "sqlite")
+def _compile_utc_week_start_sqlite(element, compiler, **kw):
+    return "datetime(%s, '-6 days', 'weekday 1', 'start of day')" % (
+        compiler.process(element.clauses, **kw)
+    )
+
+
+class advisory_xact_lock(FunctionElement):
+    """``pg_advisory_xact_lock(key)``: held until the transaction ends.
+
+    SQLite already serializes writers, so there it is a no-op ``SELECT 0``.
+    """
+
+    name = "advisory_xact_lock"
+    inherit_cache = True
+
+
+@compiles(advisory_xact_lock)
+def _compile_advisory_xact_lock(element, compiler, **kw):
+    return "pg_advisory_xact_lock(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(advisory_xact_lock, "sqlite")
+def _compile_advisory_xact_lock_sqlite(element, compiler, **kw):
+    return "0"
+
+
+def advisory_lock_key(*parts: object) -> int:
+    """A stable signed 64-bit lock key for ``parts``, e.g. ``("score", user_id)``."""
+
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+__all__ = [
+    "advisory_lock_key",
+    "advisory_xact_lock",
+    "greatest",
+    "least",
+    "utc_week_start",
+]
@@ -1,5 +1,6 @@
 # backend/app/main.py
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
@@ -19,6 +20,7 @@ from app.core.celery_app import celery_app
 from app.core.config import settings
 from app.api.v1.api_router import api_router
 from app.db.session import async_session
+from app.services.password_service import password_service
 
 _fastapi_kwargs = dict(
     title="RepDuel API",
@@ -31,7 +33,32 @@ _fastapi_kwargs = dict(
 async def _lifespan(app: FastAPI):  # pragma: no cover - exercised via app startup
     # Run async initialization when the app starts (avoids asyncio.run() inside a running loop)
     await init_env()
-    yield
+    relay_stop: asyncio.Event | None = None
+    relay_task: asyncio.Task | None = None
+    if settings.OUTBOX_RELAY_IN_PROCESS:
+        from app.tasks.outbox_tasks import run_relay_loop
+
+        relay_stop = asyncio.Event()
+        relay_task = asyncio.create_task(run_relay_loop(relay_stop))
+    search_stop: asyncio.Event | None = None
+    search_task: asyncio.Task | None = None
+    if settings.USER_SEARCH_INDEX_ENABLED:
+        from app.services.user_search_index import run_refresh_loop
+
+        search_stop = asyncio.Event()
+        search_task = asyncio.create_task(
+            run_refresh_loop(search_stop, settings.USER_SEARCH_INDEX_REFRESH_SECONDS)
+        )
+    try:
+        yield
+    finally:
+        if relay_stop is not None and relay_task is not None:
+            relay_stop.set()
+            await relay_task
+        if search_stop is not None and search_task is not None:
+            search_stop.set()
+            await search_task
+        password_service.shutdown()
 
 
 _base_url = getattr(settings, "BASE_URL", "").strip()
@@ -92,6 +119,8 @@ cors_config = dict(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    # Paginated list endpoints return the next-page cursor as a header.
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.add_middleware(CORSMiddleware, **cors_config)
@@ -178,6 +207,11 @@ async def health_db():
     return {"status": "ok", "database": "reachable"}
 
 
+@app.get("/health/passwords", tags=["health"])
+def health_passwords():
+    return {"status": "ok", **password_service.snapshot()}
+
+
 def _queue_depth(snapshot: dict[str, list] | None) -> int:
     if not snapshot:
         return 0
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, PrimaryKeyConstraint
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, PrimaryKeyConstraint
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.base_class import Base
@@ -17,6 +17,8 @@ class DailyWorkoutAggregate(Base):
     day = Column(DateTime(timezone=True), nullable=False)
     longest_session_minutes = Column(Integer, nullable=False, default=0)
     qualified_30 = Column(Boolean, nullable=False, default=False)
+    total_minutes = Column(Float, nullable=False, default=0.0)
+    workout_count = Column(Integer, nullable=False, default=0)
     created_at = Column(
         DateTime(timezone=True),
         nullable=False,
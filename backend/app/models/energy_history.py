@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -28,3 +28,7 @@ class EnergyHistory(Base):
     )
 
     user = relationship("User", back_populates="energy_history")
+
+    __table_args__ = (
+        Index("ix_energy_history_user_created", "user_id", text("created_at DESC")),
+    )
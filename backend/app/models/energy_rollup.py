@@ -0,0 +1,37 @@
+# backend/app/models/energy_rollup.py
+
+"""Per-day energy rollups that back the energy charts."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+
+class DailyEnergyRollup(Base):
+    __tablename__ = "daily_energy_rollups"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Midnight UTC of the day the samples were recorded.
+    day = Column(DateTime(timezone=True), nullable=False)
+    min_energy = Column(Float, nullable=False)
+    max_energy = Column(Float, nullable=False)
+    last_energy = Column(Float, nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "day", name="pk_daily_energy_rollups"),
+    )
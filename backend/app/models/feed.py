@@ -0,0 +1,88 @@
+# backend/app/models/feed.py
+
+"""Activity feed: one row per activity plus per-follower inbox pointers."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.types import JSON
+
+from app.db.base_class import Base
+
+
+class FeedItem(Base):
+    __tablename__ = "feed_items"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    actor_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    kind = Column(String(32), nullable=False)
+    # Id of the row the activity points at (personal best event, submission).
+    source_id = Column(String(64), nullable=False)
+    # Compact, render-ready fields so reading the feed needs no extra joins.
+    summary = Column(JSON, nullable=False, default=dict)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    actor = relationship("User")
+
+    __table_args__ = (
+        CheckConstraint(
+            "kind IN ('personal_best', 'workout')",
+            name="ck_feed_items_kind",
+        ),
+        # Fan-out-on-read for accounts above the fan-out threshold.
+        Index(
+            "ix_feed_items_actor_created",
+            "actor_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
+
+
+class FeedInbox(Base):
+    __tablename__ = "feed_inbox"
+
+    owner_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    item_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("feed_items.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Copied from the item so inbox pages are read from this index alone.
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("owner_id", "item_id", name="pk_feed_inbox"),
+        Index(
+            "ix_feed_inbox_owner_created",
+            "owner_id",
+            text("created_at DESC"),
+            text("item_id DESC"),
+        ),
+    )
@@ -0,0 +1,67 @@
+# backend/app/models/period_score_best.py
+
+"""Best score per user, scenario and calendar period (week or month)."""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.db.base_class import Base
+
+
+class PeriodScoreBest(Base):
+    __tablename__ = "period_score_bests"
+
+    period = Column(String(8), nullable=False)
+    # Midnight UTC on the Monday of the week, or on the 1st of the month.
+    period_start = Column(DateTime(timezone=True), nullable=False)
+    scenario_id = Column(
+        String, ForeignKey("scenarios.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    score_id = Column(
+        Integer, ForeignKey("scores.id", ondelete="CASCADE"), nullable=False
+    )
+    score_value = Column(Float, nullable=False)
+    weight_lifted = Column(Float, nullable=False)
+    achieved_at = Column(DateTime(timezone=True), nullable=False)
+
+    user = relationship("User")
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "period",
+            "period_start",
+            "scenario_id",
+            "user_id",
+            name="pk_period_score_bests",
+        ),
+        CheckConstraint(
+            "period IN ('week', 'month')",
+            name="ck_period_score_bests_period",
+        ),
+        Index(
+            "ix_period_score_bests_board",
+            "period",
+            "period_start",
+            "scenario_id",
+            text("score_value DESC"),
+        ),
+    )
@@ -14,9 +14,11 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -159,4 +161,56 @@ class UserQuest(Base):
             "required_value >= 0",
             name="ck_user_quests_required_nonnegative",
         ),
+        Index(
+            "ix_user_quests_expirable",
+            "expires_at",
+            postgresql_where=text("status IN ('active', 'completed')"),
+        ),
+        Index(
+            "ix_user_quests_user_cycle_start",
+            "user_id",
+            text("cycle_start DESC"),
+            text("id DESC"),
+        ),
+    )
+
+
+class UserQuestHistory(Base):
+    """Compact archive of finished quests moved out of ``user_quests``."""
+
+    __tablename__ = "user_quest_history"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    template_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("quest_templates.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status = Column(String(16), nullable=False)
+    progress_value = Column(Integer, nullable=False)
+    required_value = Column(Integer, nullable=False)
+    cycle_start = Column(DateTime(timezone=True), nullable=False)
+    cycle_end = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    reward_claimed_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    template = relationship("QuestTemplate")
+
+    __table_args__ = (
+        Index(
+            "ix_user_quest_history_user_cycle_start",
+            "user_id",
+            text("cycle_start DESC"),
+            text("id DESC"),
+        ),
     )
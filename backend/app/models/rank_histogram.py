@@ -0,0 +1,28 @@
+# backend/app/models/rank_histogram.py
+
+"""Fixed-width histograms of per-user best scores and energy."""
+
+from __future__ import annotations
+
+from sqlalchemy import CheckConstraint, Column, Integer, PrimaryKeyConstraint, String
+
+from app.db.base_class import Base
+
+
+class RankHistogramBucket(Base):
+    __tablename__ = "rank_histogram_buckets"
+
+    # "scenario" rows are keyed by scenarios.id; the single "energy" histogram
+    # uses an empty key.
+    kind = Column(String(16), nullable=False)
+    key = Column(String, nullable=False, default="")
+    bucket = Column(Integer, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("kind", "key", "bucket", name="pk_rank_histogram_buckets"),
+        CheckConstraint(
+            "kind IN ('scenario', 'energy')",
+            name="ck_rank_histogram_buckets_kind",
+        ),
+    )
@@ -26,4 +26,10 @@ class RateLimitEvent(Base):
             "action",
             "occurred_at",
         ),
+        # Serves the per-action chunks of the expired-event reaper.
+        Index(
+            "ix_rate_limit_events_action_time",
+            "action",
+            "occurred_at",
+        ),
     )
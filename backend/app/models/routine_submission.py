@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -54,6 +54,8 @@ class RoutineSubmission(Base):
     )
     status = Column(String, nullable=False)
     title = Column(String, nullable=False)
+    # Set once the submission has been folded into daily_workout_aggregates.
+    aggregated_at = Column(DateTime(timezone=True), nullable=True)
 
     scenario_submissions = relationship(
         "RoutineScenarioSubmission",
@@ -65,3 +67,11 @@ class RoutineSubmission(Base):
 
     routine = relationship("Routine", back_populates="submissions")
     user = relationship("User", back_populates="routine_submissions")
+
+    __table_args__ = (
+        Index(
+            "ix_routine_submission_user_completion",
+            "user_id",
+            text("completion_timestamp DESC"),
+        ),
+    )
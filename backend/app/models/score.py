@@ -1,7 +1,7 @@
 # backend/app/models/score.py
 
 from datetime import datetime, timezone
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
@@ -28,3 +28,12 @@ class Score(Base):
 
     scenario = relationship("Scenario", back_populates="scores")
     user = relationship("User", back_populates="scores")
+
+    __table_args__ = (
+        Index(
+            "ix_scores_scenario_user_value",
+            "scenario_id",
+            "user_id",
+            text("score_value DESC"),
+        ),
+    )
@@ -34,15 +34,21 @@ class SocialEdge(Base):
         nullable=False,
     )
 
+    # Partial indexes matching the keyset order of the follower/following
+    # lists: newest edge first, ties broken on the other user's id.
     __table_args__ = (
         Index(
-            "idx_social_following_active",
+            "idx_social_following_active_created",
             "follower_id",
+            text("created_at DESC"),
+            text("followee_id DESC"),
             postgresql_where=text("status = 'active'"),
         ),
         Index(
-            "idx_social_followers_active",
+            "idx_social_followers_active_created",
             "followee_id",
+            text("created_at DESC"),
+            text("follower_id DESC"),
             postgresql_where=text("status = 'active'"),
         ),
     )
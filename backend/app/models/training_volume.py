@@ -0,0 +1,52 @@
+# backend/app/models/training_volume.py
+
+"""Weekly training volume rollups per muscle group and per scenario."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base_class import Base
+
+
+class WeeklyTrainingVolume(Base):
+    __tablename__ = "weekly_training_volume"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    week_start = Column(DateTime(timezone=True), nullable=False)
+    # "muscle" rows are keyed by muscles.id, "scenario" rows by scenarios.id.
+    dimension = Column(String(16), nullable=False)
+    key = Column(String, nullable=False)
+    volume = Column(Float, nullable=False, default=0.0)
+    sets = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "user_id", "week_start", "dimension", "key", name="pk_weekly_training_volume"
+        ),
+        CheckConstraint(
+            "dimension IN ('muscle', 'scenario')",
+            name="ck_weekly_training_volume_dimension",
+        ),
+    )
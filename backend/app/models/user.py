@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, Float, String, CheckConstraint
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String, CheckConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -45,6 +45,13 @@ class User(Base):
     # Defaults to "kg"; update via PATCH /users/unit and recompute energy/rank.
     preferred_unit = Column(String(3), nullable=False, server_default="kg", index=True)
 
+    # --- Social counters ---
+    # Active ``social_edges`` counts, kept in step by social_service.follow /
+    # unfollow and corrected by the ``social.reconcile_follow_counts`` task.
+    follower_count = Column(Integer, nullable=False, default=0, server_default="0")
+    following_count = Column(Integer, nullable=False, default=0, server_default="0")
+    mutual_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -112,4 +119,17 @@ class User(Base):
             "preferred_unit IN ('kg','lbs')",
             name="ck_users_preferred_unit",
         ),
+        # Trigram indexes (pg_trgm) serving the ``LIKE '%q%'`` user lookup.
+        Index(
+            "ix_users_username_trgm",
+            func.lower(username).label("username_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"username_lower": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_display_name_trgm",
+            func.lower(func.coalesce(display_name, "")).label("display_name_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"display_name_lower": "gin_trgm_ops"},
+        ),
     )
@@ -0,0 +1,36 @@
+# backend/app/models/user_activity_summary.py
+
+"""Per-user streak and rolling workout counters."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import JSON
+
+from app.db.base_class import Base
+
+
+class UserActivitySummary(Base):
+    __tablename__ = "user_activity_summaries"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Length of the run of active days ending at last_active_day.
+    current_streak = Column(Integer, nullable=False, default=0)
+    longest_streak = Column(Integer, nullable=False, default=0)
+    last_active_day = Column(DateTime(timezone=True), nullable=True)
+    # Per-day counters, index 0 is recent_anchor_day and index i is i days earlier.
+    recent_anchor_day = Column(DateTime(timezone=True), nullable=True)
+    recent_workouts = Column(JSON, nullable=False, default=list)
+    recent_minutes = Column(JSON, nullable=False, default=list)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
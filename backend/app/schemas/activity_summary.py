@@ -0,0 +1,25 @@
+# backend/app/schemas/activity_summary.py
+
+"""Pydantic schema for the per-user activity summary."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ActivitySummaryRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    user_id: UUID
+    current_streak: int = Field(..., ge=0)
+    longest_streak: int = Field(..., ge=0)
+    last_active_day: datetime | None = None
+    workouts_7d: int = Field(..., ge=0)
+    minutes_7d: int = Field(..., ge=0)
+    active_days_7d: int = Field(..., ge=0)
+    workouts_28d: int = Field(..., ge=0)
+    minutes_28d: int = Field(..., ge=0)
+    active_days_28d: int = Field(..., ge=0)
@@ -0,0 +1,42 @@
+# backend/app/schemas/distribution.py
+
+"""Pydantic schemas for percentile and rank-distribution reads."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class HistogramBucketOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    lower: float
+    upper: float
+    count: int
+
+
+class PercentileOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    value: float
+    percentile: float
+    total: int
+
+
+class ScoreDistribution(BaseModel):
+    scenario_id: str
+    bucket_width: float
+    total: int
+    buckets: list[HistogramBucketOut]
+
+
+class RankTierCount(BaseModel):
+    rank: str
+    count: int
+
+
+class EnergyDistribution(BaseModel):
+    bucket_width: float
+    total: int
+    tiers: list[RankTierCount]
+    buckets: list[HistogramBucketOut]
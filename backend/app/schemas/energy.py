@@ -6,6 +6,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, FieldSerializationInfo, field_serializer, field_validator
 
+from app.services.energy_series_service import SeriesResolution
 from app.utils.datetime import ensure_aware_utc
 from app.utils.storage import build_public_url
 
@@ -36,6 +37,21 @@ class EnergyEntry(BaseModel):
         return ensure_aware_utc(value, field_name="created_at", allow_naive=True)
 
 
+class EnergySeriesPoint(BaseModel):
+    period_start: datetime
+    energy: float
+    min_energy: float
+    last_energy: float
+    samples: int
+
+    model_config = {"from_attributes": True}
+
+
+class EnergySeries(BaseModel):
+    resolution: SeriesResolution
+    points: list[EnergySeriesPoint]
+
+
 class EnergyLeaderboardEntry(BaseModel):
     rank: int
     user_id: UUID
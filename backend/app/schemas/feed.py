@@ -0,0 +1,35 @@
+# backend/app/schemas/feed.py
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, FieldSerializationInfo, field_serializer
+
+from app.utils.storage import build_public_url
+
+
+class FeedActor(BaseModel):
+    id: UUID
+    username: str
+    display_name: str | None = None
+    avatar_url: str | None = None
+
+    model_config = {"from_attributes": True}
+
+    @field_serializer("avatar_url")
+    def _serialize_avatar_url(
+        self, value: str | None, info: FieldSerializationInfo
+    ) -> str | None:
+        return build_public_url(value)
+
+
+class FeedItemRead(BaseModel):
+    id: UUID
+    kind: str
+    source_id: str
+    summary: dict[str, Any]
+    created_at: datetime
+    actor: FeedActor
+
+    model_config = {"from_attributes": True}
@@ -9,7 +9,13 @@ from uuid import UUID
 
 from pydantic import BaseModel, ValidationInfo, field_validator
 
-from app.models.quest import QuestCadence, QuestMetric, QuestStatus, UserQuest
+from app.models.quest import (
+    QuestCadence,
+    QuestMetric,
+    QuestStatus,
+    UserQuest,
+    UserQuestHistory,
+)
 from app.utils.datetime import ensure_aware_utc, ensure_optional_aware_utc
 
 
@@ -39,7 +45,9 @@ class QuestTemplateSummary(BaseModel):
         )
 
     @classmethod
-    def from_model(cls, quest: UserQuest) -> "QuestTemplateSummary":
+    def from_model(
+        cls, quest: UserQuest | UserQuestHistory
+    ) -> "QuestTemplateSummary":
         template = quest.template
         if template is None:
             raise ValueError("Quest template must be loaded")
@@ -96,16 +104,31 @@ class QuestInstance(BaseModel):
         )
 
     @classmethod
-    def from_model(cls, quest: UserQuest) -> "QuestInstance":
+    def from_model(
+        cls, quest: UserQuest, *, now: datetime | None = None
+    ) -> "QuestInstance":
+        """Build the payload; with ``now``, unswept quests past expiry read as expired."""
+
         if quest.template is None:
             raise ValueError("Quest template must be loaded")
         summary = QuestTemplateSummary.from_model(quest)
+        status = QuestStatus(quest.status)
+        expires_at = ensure_optional_aware_utc(
+            quest.expires_at, field_name="expires_at", allow_naive=True
+        )
+        if (
+            now is not None
+            and expires_at is not None
+            and now >= expires_at
+            and status in (QuestStatus.ACTIVE, QuestStatus.COMPLETED)
+        ):
+            status = QuestStatus.EXPIRED
         required = max(0, quest.required_value)
         progress = max(0, quest.progress_value)
         pct = 1.0 if required == 0 else min(1.0, progress / required)
         return cls(
             id=quest.id,
-            status=QuestStatus(quest.status),
+            status=status,
             progress=progress,
             required=required,
             progress_pct=pct,
@@ -120,6 +143,33 @@ class QuestInstance(BaseModel):
             template=summary,
         )
 
+    @classmethod
+    def from_history(cls, entry: UserQuestHistory) -> "QuestInstance":
+        """Build the payload for an archived quest; its window is the cycle itself."""
+
+        if entry.template is None:
+            raise ValueError("Quest template must be loaded")
+        summary = QuestTemplateSummary.from_model(entry)
+        required = max(0, entry.required_value)
+        progress = max(0, entry.progress_value)
+        pct = 1.0 if required == 0 else min(1.0, progress / required)
+        return cls(
+            id=entry.id,
+            status=QuestStatus(entry.status),
+            progress=progress,
+            required=required,
+            progress_pct=pct,
+            available_from=entry.cycle_start,
+            expires_at=entry.cycle_end,
+            cycle_start=entry.cycle_start,
+            cycle_end=entry.cycle_end,
+            completed_at=entry.completed_at,
+            reward_claimed_at=entry.reward_claimed_at,
+            last_progress_at=None,
+            reward_xp=summary.reward_xp,
+            template=summary,
+        )
+
 
 class QuestListResponse(BaseModel):
     generated_at: datetime
@@ -128,3 +178,8 @@ class QuestListResponse(BaseModel):
     @field_validator("generated_at", mode="after")
     def _validate_generated_at(cls, value: datetime) -> datetime:
         return ensure_aware_utc(value, field_name="generated_at", allow_naive=True)
+
+
+class QuestHistoryResponse(BaseModel):
+    quests: list[QuestInstance]
+    next_cursor: str | None = None
@@ -36,16 +36,14 @@ class RoutineSubmissionCreate(BaseModel):
         return ensure_aware_utc(value, field_name="completion_timestamp")
 
 
-class RoutineSubmissionRead(BaseModel):
+class RoutineSubmissionSummary(BaseModel):
+    id: UUID
     routine_id: Optional[UUID] = None
     user_id: UUID
     duration: float
     completion_timestamp: datetime
     status: str
     title: str
-    scenarios: List[RoutineScenarioSubmission] = Field(
-        ..., alias="scenario_submissions"
-    )
 
     model_config = {"from_attributes": True, "populate_by_name": True}
 
@@ -54,3 +52,9 @@ class RoutineSubmissionRead(BaseModel):
         return ensure_aware_utc(
             value, field_name="completion_timestamp", allow_naive=True
         )
+
+
+class RoutineSubmissionRead(RoutineSubmissionSummary):
+    scenarios: List[RoutineScenarioSubmission] = Field(
+        ..., alias="scenario_submissions"
+    )
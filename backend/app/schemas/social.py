@@ -1,5 +1,6 @@
 # backend/app/schemas/social.py
 
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel, FieldSerializationInfo, field_serializer
@@ -16,6 +17,8 @@ class SocialUser(BaseModel):
     is_followed_by: bool
     is_friend: bool
     is_self: bool
+    # When the listed user's edge was created; set on follower/following lists.
+    followed_at: datetime | None = None
 
     model_config = {"from_attributes": True}
 
@@ -32,3 +35,4 @@ class SocialListResponse(BaseModel):
     total: int
     offset: int
     next_offset: int | None = None
+    next_cursor: str | None = None
@@ -0,0 +1,31 @@
+# backend/app/schemas/training_volume.py
+
+"""Pydantic schemas for weekly training volume series."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from app.services.training_volume_service import VolumeDimension
+from app.utils.datetime import ensure_aware_utc
+
+
+class TrainingVolumeBucket(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    week_start: datetime
+    key: str
+    volume: float
+    sets: int
+
+    @field_validator("week_start", mode="after")
+    @classmethod
+    def _ensure_utc(cls, value: datetime) -> datetime:
+        return ensure_aware_utc(value, field_name="week_start", allow_naive=True)
+
+
+class TrainingVolumeResponse(BaseModel):
+    dimension: VolumeDimension
+    buckets: list[TrainingVolumeBucket]
@@ -0,0 +1,96 @@
+# backend/app/services/energy_series_service.py
+
+"""Chart-ready energy series built from the daily energy rollups."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.energy_rollup import DailyEnergyRollup
+from app.utils.datetime import ensure_aware_utc
+from app.utils.downsample import lttb
+
+
+class SeriesResolution(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+@dataclass
+class EnergySeriesPoint:
+    period_start: datetime
+    energy: float
+    min_energy: float
+    last_energy: float
+    samples: int
+
+
+def _period_start(day: datetime, resolution: SeriesResolution) -> datetime:
+    if resolution is SeriesResolution.WEEK:
+        return day - timedelta(days=day.weekday())
+    if resolution is SeriesResolution.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+async def get_energy_series(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    resolution: SeriesResolution = SeriesResolution.DAY,
+    points: int | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> list[EnergySeriesPoint]:
+    """Energy per period, oldest first, thinned to ``points`` with LTTB.
+
+    Reads one rollup row per active day rather than raw history. ``energy``
+    is the period's peak, matching ``/energy/daily``; ``min_energy`` and
+    ``last_energy`` let charts draw a band or a closing value.
+    """
+
+    query = select(DailyEnergyRollup).where(DailyEnergyRollup.user_id == user_id)
+    if since is not None:
+        query = query.where(DailyEnergyRollup.day >= since)
+    if until is not None:
+        query = query.where(DailyEnergyRollup.day < until)
+    result = await db.execute(query.order_by(DailyEnergyRollup.day))
+
+    series: list[EnergySeriesPoint] = []
+    for rollup in result.scalars():
+        day = ensure_aware_utc(rollup.day, field_name="day", allow_naive=True)
+        start = _period_start(day, resolution)
+        if series and series[-1].period_start == start:
+            point = series[-1]
+            point.energy = max(point.energy, rollup.max_energy)
+            point.min_energy = min(point.min_energy, rollup.min_energy)
+            point.last_energy = rollup.last_energy
+            point.samples += rollup.sample_count
+            continue
+        series.append(
+            EnergySeriesPoint(
+                period_start=start,
+                energy=rollup.max_energy,
+                min_energy=rollup.min_energy,
+                last_energy=rollup.last_energy,
+                samples=rollup.sample_count,
+            )
+        )
+
+    if points is not None and len(series) > points:
+        kept = lttb(
+            [(point.period_start.timestamp(), point.energy) for point in series],
+            points,
+        )
+        series = [series[index] for index in kept]
+    return series
+
+
+__all__ = ["EnergySeriesPoint", "SeriesResolution", "get_energy_series"]
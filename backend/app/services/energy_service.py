@@ -1,17 +1,23 @@
 # backend/app/services/energy_service.py
 
+from datetime import datetime, timedelta, timezone
 from typing import Tuple
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.functions import greatest, least
 from app.models import user as user_models
 from app.models.energy_history import EnergyHistory
+from app.models.energy_rollup import DailyEnergyRollup
 from app.models.score import Score
 from app.services.dots_service import DotsCalculator
+from app.services.histogram_service import ENERGY_KEY, HistogramKind, adjust_histogram
 from app.services.standards_service import LB_PER_KG, get_rounded_pack
 from app.services.user_service import get_user_by_id
+from app.utils.datetime import ensure_aware_utc
 
 SCENARIO_LIFT_MAP = {
     "back_squat": "squat",
@@ -19,6 +25,11 @@ SCENARIO_LIFT_MAP = {
     "deadlift": "deadlift",
 }
 
+# Users whose history one compaction pass reads before committing.
+COMPACT_USER_BATCH_SIZE = 200
+COMPACT_STREAM_BATCH_SIZE = 5000
+COMPACT_DELETE_CHUNK_SIZE = 1000
+
 RANK_ORDER = [
     "Iron",
     "Bronze",
@@ -63,6 +74,199 @@ async def get_latest_energy(db: AsyncSession, user_id: UUID) -> float:
     return latest.energy if latest else 0.0
 
 
+def start_of_day(ts: datetime) -> datetime:
+    return ensure_aware_utc(ts, field_name="timestamp", allow_naive=True).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+async def _apply_energy_to_daily_rollup(
+    db: AsyncSession, user_id: UUID, energy: float, recorded_at: datetime
+) -> None:
+    stmt = pg_insert(DailyEnergyRollup).values(
+        user_id=user_id,
+        day=start_of_day(recorded_at),
+        min_energy=energy,
+        max_energy=energy,
+        last_energy=energy,
+        sample_count=1,
+        updated_at=recorded_at,
+    )
+    current = DailyEnergyRollup.__table__.c
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[current.user_id, current.day],
+            set_={
+                "min_energy": least(current.min_energy, stmt.excluded.min_energy),
+                "max_energy": greatest(current.max_energy, stmt.excluded.max_energy),
+                "last_energy": stmt.excluded.last_energy,
+                "sample_count": current.sample_count + stmt.excluded.sample_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def record_energy(
+    db: AsyncSession,
+    user_id: UUID,
+    energy: float,
+    *,
+    recorded_at: datetime | None = None,
+    dedupe_window: timedelta | None = None,
+) -> bool:
+    """Append an energy sample and fold it into the user's daily rollup.
+
+    With ``dedupe_window``, the sample is dropped when the user's latest
+    sample inside that window already has the same value; the check and the
+    insert are a single ``INSERT ... SELECT``. Returns whether a row was
+    written. The caller owns the transaction; nothing is committed here.
+    """
+
+    recorded_at = recorded_at or datetime.now(timezone.utc)
+    energy = float(energy)
+    sample = select(
+        literal(uuid4(), EnergyHistory.id.type),
+        literal(user_id, EnergyHistory.user_id.type),
+        literal(energy, EnergyHistory.energy.type),
+        literal(recorded_at, EnergyHistory.created_at.type),
+    )
+    if dedupe_window:
+        latest = (
+            select(EnergyHistory.energy)
+            .where(EnergyHistory.user_id == user_id)
+            .where(EnergyHistory.created_at >= recorded_at - dedupe_window)
+            .order_by(EnergyHistory.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        sample = sample.where(latest.is_distinct_from(energy))
+    result = await db.execute(
+        insert(EnergyHistory)
+        .from_select(
+            [
+                EnergyHistory.id,
+                EnergyHistory.user_id,
+                EnergyHistory.energy,
+                EnergyHistory.created_at,
+            ],
+            sample,
+        )
+        .returning(EnergyHistory.id)
+    )
+    if result.first() is None:
+        return False
+    await _apply_energy_to_daily_rollup(db, user_id, energy, recorded_at)
+    return True
+
+
+async def compact_energy_history(
+    db: AsyncSession,
+    *,
+    window: timedelta,
+    user_id: UUID | None = None,
+    batch_size: int = COMPACT_USER_BATCH_SIZE,
+) -> int:
+    """Collapse repeated energy values recorded within ``window`` of each other.
+
+    A sample is removed when the one before it has the same value and is at
+    most ``window`` older, the same rule ``record_energy`` applies on write.
+    Users are processed in id-ordered batches, one commit each, reading only
+    that batch's history. Daily rollups touched by a removal are recomputed
+    from the samples that remain and dropped when none do. Returns the
+    number of history rows removed.
+    """
+
+    if window <= timedelta(0):
+        return 0
+    removed_total = 0
+    after: UUID | None = None
+    while True:
+        ids_stmt = (
+            select(user_models.User.id).order_by(user_models.User.id).limit(batch_size)
+        )
+        if user_id is not None:
+            ids_stmt = ids_stmt.where(user_models.User.id == user_id)
+        elif after is not None:
+            ids_stmt = ids_stmt.where(user_models.User.id > after)
+        ids = (await db.execute(ids_stmt)).scalars().all()
+        if not ids:
+            break
+
+        history = await db.stream(
+            select(
+                EnergyHistory.id,
+                EnergyHistory.user_id,
+                EnergyHistory.energy,
+                EnergyHistory.created_at,
+            )
+            .where(EnergyHistory.user_id.in_(ids))
+            .order_by(EnergyHistory.user_id, EnergyHistory.created_at, EnergyHistory.id)
+            .execution_options(yield_per=COMPACT_STREAM_BATCH_SIZE)
+        )
+        removed_ids: list[UUID] = []
+        touched: set[tuple[UUID, datetime]] = set()
+        # (user, day) -> [min, max, last, count] over the samples that remain.
+        kept: dict[tuple[UUID, datetime], list] = {}
+        previous = None
+        async for partition in history.partitions():
+            for row in partition:
+                recorded_at = ensure_aware_utc(
+                    row.created_at, field_name="created_at", allow_naive=True
+                )
+                key = (row.user_id, start_of_day(recorded_at))
+                if (
+                    previous is not None
+                    and previous[0] == row.user_id
+                    and previous[1] == row.energy
+                    and recorded_at - previous[2] <= window
+                ):
+                    removed_ids.append(row.id)
+                    touched.add(key)
+                else:
+                    stats = kept.setdefault(key, [row.energy, row.energy, row.energy, 0])
+                    stats[0] = min(stats[0], row.energy)
+                    stats[1] = max(stats[1], row.energy)
+                    stats[2] = row.energy
+                    stats[3] += 1
+                previous = (row.user_id, row.energy, recorded_at)
+
+        for offset in range(0, len(removed_ids), COMPACT_DELETE_CHUNK_SIZE):
+            await db.execute(
+                delete(EnergyHistory)
+                .where(
+                    EnergyHistory.id.in_(
+                        removed_ids[offset : offset + COMPACT_DELETE_CHUNK_SIZE]
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
+        for owner_id, day in touched:
+            rollup = (
+                (DailyEnergyRollup.user_id == owner_id) & (DailyEnergyRollup.day == day)
+            )
+            stats = kept.get((owner_id, day))
+            if stats is None:
+                await db.execute(delete(DailyEnergyRollup).where(rollup))
+            else:
+                await db.execute(
+                    update(DailyEnergyRollup)
+                    .where(rollup)
+                    .values(
+                        min_energy=stats[0],
+                        max_energy=stats[1],
+                        last_energy=stats[2],
+                        sample_count=stats[3],
+                    )
+                )
+        await db.commit()
+        removed_total += len(removed_ids)
+        if user_id is not None or len(ids) < batch_size:
+            break
+        after = ids[-1]
+    return removed_total
+
+
 def interpolate_energy(
     score: float, lower: float, upper: float, lower_energy: int, upper_energy: int
 ) -> float:
@@ -169,8 +373,7 @@ async def update_energy_if_personal_best(
     score_in_user_unit = new_score * (LB_PER_KG if preferred_unit == "lbs" else 1.0)
     energy = compute_energy_for_lift(score_in_user_unit, lift, standards)
 
-    db_entry = EnergyHistory(user_id=user_id, energy=energy)
-    db.add(db_entry)
+    await record_energy(db, user_id, energy)
     await db.commit()
 
 
@@ -203,7 +406,11 @@ async def recompute_for_user(
         if max_val is not None:
             best_scores_kg[scenario_id] = float(max_val)
 
+    previous_energy = current_user.energy
     if not best_scores_kg:
+        await adjust_histogram(
+            db, HistogramKind.ENERGY, ENERGY_KEY, old=previous_energy, new=None
+        )
         current_user.energy = 0.0
         current_user.rank = "Unranked"
         db.add(current_user)
@@ -230,6 +437,9 @@ async def recompute_for_user(
     rounded = round(avg_energy)
     overall = _overall_rank_from_energy(rounded)
 
+    await adjust_histogram(
+        db, HistogramKind.ENERGY, ENERGY_KEY, old=previous_energy, new=float(rounded)
+    )
     current_user.energy = float(rounded)
     current_user.rank = overall
     db.add(current_user)
@@ -0,0 +1,352 @@
+# backend/app/services/export_service.py
+
+"""Streaming exports of training history into chunked CSV or Parquet files."""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Callable, Iterable, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.energy_history import EnergyHistory
+from app.models.routine_submission import RoutineScenarioSubmission, RoutineSubmission
+from app.models.score import Score
+from app.models.xp_event import XPEvent
+
+try:  # pragma: no cover - optional dependency for Parquet output
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - CSV exports work without pyarrow
+    pa = None
+    pq = None
+
+# Rows fetched per server-side cursor round-trip.
+STREAM_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+@dataclass(frozen=True)
+class ExportProgress:
+    table: str
+    rows: int
+    files: int
+
+
+@dataclass
+class ExportManifest:
+    export_id: str
+    directory: str
+    format: ExportFormat
+    user_id: UUID | None
+    created_at: datetime
+    tables: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "export_id": self.export_id,
+            "directory": self.directory,
+            "format": self.format.value,
+            "user_id": str(self.user_id) if self.user_id else None,
+            "created_at": self.created_at.isoformat(),
+            "tables": self.tables,
+        }
+
+
+ProgressCallback = Callable[[ExportProgress], None]
+
+
+def _export_queries(user_id: UUID | None) -> dict[str, Any]:
+    """Column-level selects per exported table, ordered by primary key."""
+
+    queries = {
+        "scores": select(
+            Score.id,
+            Score.user_id,
+            Score.scenario_id,
+            Score.score_value,
+            Score.weight_lifted,
+            Score.reps,
+            Score.sets,
+            Score.is_bodyweight,
+            Score.created_at,
+        ).order_by(Score.id),
+        "routine_submissions": select(
+            RoutineSubmission.id,
+            RoutineSubmission.user_id,
+            RoutineSubmission.routine_id,
+            RoutineSubmission.title,
+            RoutineSubmission.status,
+            RoutineSubmission.duration,
+            RoutineSubmission.completion_timestamp,
+        ).order_by(RoutineSubmission.id),
+        "routine_scenario_submissions": select(
+            RoutineScenarioSubmission.id,
+            RoutineScenarioSubmission.routine_id,
+            RoutineSubmission.user_id,
+            RoutineScenarioSubmission.scenario_id,
+            RoutineScenarioSubmission.sets,
+            RoutineScenarioSubmission.reps,
+            RoutineScenarioSubmission.weight,
+            RoutineScenarioSubmission.total_volume,
+        )
+        .join(
+            RoutineSubmission,
+            RoutineSubmission.id == RoutineScenarioSubmission.routine_id,
+        )
+        .order_by(RoutineScenarioSubmission.id),
+        "energy_history": select(
+            EnergyHistory.id,
+            EnergyHistory.user_id,
+            EnergyHistory.energy,
+            EnergyHistory.created_at,
+        ).order_by(EnergyHistory.id),
+        "xp_events": select(
+            XPEvent.id,
+            XPEvent.user_id,
+            XPEvent.amount,
+            XPEvent.reason,
+            XPEvent.source_type,
+            XPEvent.source_id,
+            XPEvent.created_at,
+        ).order_by(XPEvent.id),
+    }
+    if user_id is not None:
+        owners = {
+            "scores": Score.user_id,
+            "routine_submissions": RoutineSubmission.user_id,
+            "routine_scenario_submissions": RoutineSubmission.user_id,
+            "energy_history": EnergyHistory.user_id,
+            "xp_events": XPEvent.user_id,
+        }
+        queries = {
+            name: query.where(owners[name] == user_id)
+            for name, query in queries.items()
+        }
+    return queries
+
+
+EXPORT_TABLES: tuple[str, ...] = tuple(_export_queries(None))
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _parquet_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _arrow_schema(columns: Sequence[Any]):
+    """Fixed schema so all-null batches do not change a file's column types."""
+
+    fields = []
+    for column in columns:
+        sql_type = column.type
+        if isinstance(sql_type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(sql_type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(sql_type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(sql_type, DateTime):
+            arrow_type = pa.timestamp("us", tz="UTC")
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.key, arrow_type))
+    return pa.schema(fields)
+
+
+class _ChunkedWriter:
+    """Write rows to ``<table>-NNNNN.<ext>`` files of at most ``chunk_rows`` rows."""
+
+    def __init__(
+        self,
+        directory: str,
+        table: str,
+        columns: Sequence[Any],
+        fmt: ExportFormat,
+        chunk_rows: int,
+    ) -> None:
+        self.directory = directory
+        self.table = table
+        self.columns = [column.key for column in columns]
+        self.schema = _arrow_schema(columns) if fmt is ExportFormat.PARQUET else None
+        self.fmt = fmt
+        self.chunk_rows = chunk_rows
+        self.files: list[str] = []
+        self.rows = 0
+        self._chunk_rows_written = 0
+        self._handle = None
+        self._writer = None
+
+    def _open(self) -> None:
+        name = f"{self.table}-{len(self.files) + 1:05d}.{self.fmt.value}"
+        path = os.path.join(self.directory, name)
+        if self.fmt is ExportFormat.CSV:
+            self._handle = open(path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._handle)
+            self._writer.writerow(self.columns)
+        self.files.append(name)
+        self._chunk_rows_written = 0
+
+    def _close_chunk(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        if self._writer is not None and self.fmt is ExportFormat.PARQUET:
+            self._writer.close()
+        self._handle = None
+        self._writer = None
+
+    def _write_parquet(self, rows: Sequence[Sequence[Any]]) -> None:
+        columns = list(zip(*rows))
+        batch = pa.table(
+            {
+                name: [_parquet_value(value) for value in values]
+                for name, values in zip(self.columns, columns)
+            },
+            schema=self.schema,
+        )
+        if self._writer is None:
+            path = os.path.join(self.directory, self.files[-1])
+            self._writer = pq.ParquetWriter(path, self.schema)
+        self._writer.write_table(batch)
+
+    def write(self, rows: Iterable[Sequence[Any]]) -> None:
+        pending = list(rows)
+        while pending:
+            if not self.files or self._chunk_rows_written >= self.chunk_rows:
+                self._close_chunk()
+                self._open()
+            room = self.chunk_rows - self._chunk_rows_written
+            head, pending = pending[:room], pending[room:]
+            if self.fmt is ExportFormat.CSV:
+                self._writer.writerows([_csv_value(v) for v in row] for row in head)
+            else:
+                self._write_parquet(head)
+            self._chunk_rows_written += len(head)
+            self.rows += len(head)
+
+    def close(self) -> None:
+        if not self.files and self.fmt is ExportFormat.CSV:
+            # Leave a header-only file so consumers see every table's columns.
+            self._open()
+        self._close_chunk()
+
+
+async def export_history(
+    db: AsyncSession,
+    *,
+    user_id: UUID | None = None,
+    fmt: ExportFormat = ExportFormat.CSV,
+    chunk_rows: int = 100_000,
+    tables: Sequence[str] | None = None,
+    directory: str | None = None,
+    progress: ProgressCallback | None = None,
+) -> ExportManifest:
+    """Export history for one user (or everyone) table by table.
+
+    Each table is read through a server-side cursor in batches of
+    ``STREAM_BATCH_SIZE`` rows and written straight to disk, so memory use
+    does not grow with history size. Files land in
+    ``EXPORT_STORAGE_DIR/<export_id>`` next to a ``manifest.json``; that
+    directory is not served over HTTP.
+    """
+
+    if fmt is ExportFormat.PARQUET and pa is None:
+        raise RuntimeError("Parquet export requires the optional pyarrow package")
+    queries = _export_queries(user_id)
+    selected = list(tables) if tables else list(queries)
+    unknown = sorted(set(selected) - set(queries))
+    if unknown:
+        raise ValueError(f"Unknown export tables: {', '.join(unknown)}")
+
+    export_id = uuid4().hex
+    directory = directory or os.path.join(settings.EXPORT_STORAGE_DIR, export_id)
+    os.makedirs(directory, exist_ok=True)
+    manifest = ExportManifest(
+        export_id=export_id,
+        directory=directory,
+        format=fmt,
+        user_id=user_id,
+        created_at=datetime.now(timezone.utc),
+    )
+
+    for table in selected:
+        query = queries[table].execution_options(yield_per=STREAM_BATCH_SIZE)
+        writer = _ChunkedWriter(
+            directory,
+            table,
+            list(query.selected_columns),
+            fmt,
+            max(1, chunk_rows),
+        )
+        try:
+            result = await db.stream(query)
+            async for partition in result.partitions():
+                writer.write(partition)
+                if progress is not None:
+                    progress(ExportProgress(table, writer.rows, len(writer.files)))
+        finally:
+            writer.close()
+        manifest.tables[table] = {"rows": writer.rows, "files": writer.files}
+        if progress is not None:
+            progress(ExportProgress(table, writer.rows, len(writer.files)))
+
+    with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as fh:
+        json.dump(manifest.as_dict(), fh, indent=2)
+    return manifest
+
+
+def purge_exports(
+    *,
+    older_than: timedelta,
+    root: str | None = None,
+    now: datetime | None = None,
+) -> int:
+    """Delete export directories last modified more than ``older_than`` ago.
+
+    Returns the number of exports removed.
+    """
+
+    root = root or settings.EXPORT_STORAGE_DIR
+    if not os.path.isdir(root):
+        return 0
+    cutoff = ((now or datetime.now(timezone.utc)) - older_than).timestamp()
+    removed = 0
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+__all__ = [
+    "EXPORT_TABLES",
+    "ExportFormat",
+    "ExportManifest",
+    "ExportProgress",
+    "export_history",
+    "purge_exports",
+]
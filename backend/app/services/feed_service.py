@@ -0,0 +1,254 @@
+# backend/app/services/feed_service.py
+
+"""Activity feed built by fan-out-on-write with a fan-out-on-read fallback.
+
+Each activity (a personal best, a logged workout) is stored once as a
+``FeedItem``. Its author's followers get an inbox pointer when the fan-out
+event is relayed. Authors with more than ``FEED_FANOUT_MAX_FOLLOWERS``
+followers are skipped at write time. Their recent items are merged in when
+the feed is read instead, so one post never writes hundreds of thousands of
+inbox rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Mapping
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, delete, func, or_, select, tuple_, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.feed import FeedInbox, FeedItem
+from app.models.social import SocialEdge
+from app.models.user import User
+
+ACTIVE_STATUS = "active"
+
+
+class FeedItemKind(str, Enum):
+    PERSONAL_BEST = "personal_best"
+    WORKOUT = "workout"
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    item: FeedItem
+    actor: User
+
+
+def add_feed_item(
+    db: AsyncSession,
+    *,
+    actor_id: UUID,
+    kind: FeedItemKind,
+    source_id: Any,
+    summary: Mapping[str, Any],
+    occurred_at: datetime | None = None,
+) -> FeedItem:
+    """Stage an activity on ``db``; it is persisted by the caller's commit.
+
+    The id is assigned client-side so the caller can reference the item in
+    an outbox event within the same transaction.
+    """
+
+    item = FeedItem(
+        id=uuid4(),
+        actor_id=actor_id,
+        kind=kind.value,
+        source_id=str(source_id),
+        summary=dict(summary),
+        created_at=occurred_at or datetime.now(timezone.utc),
+    )
+    db.add(item)
+    return item
+
+
+async def fan_out_item(
+    db: AsyncSession, item_id: UUID, *, max_followers: int | None = None
+) -> int:
+    """Copy ``item_id`` into the inbox of each active follower of its author.
+
+    Does nothing for authors above the fan-out threshold; readers pull their
+    items instead. Redelivery is harmless because existing pointers are kept.
+    Returns the number of inbox rows written.
+    """
+
+    threshold = settings.FEED_FANOUT_MAX_FOLLOWERS if max_followers is None else max_followers
+    result = await db.execute(
+        select(User.follower_count)
+        .join(FeedItem, FeedItem.actor_id == User.id)
+        .where(FeedItem.id == item_id)
+    )
+    follower_count = result.scalar_one_or_none()
+    if follower_count is None or follower_count > threshold:
+        return 0
+
+    followers = (
+        select(SocialEdge.follower_id, FeedItem.id, FeedItem.created_at)
+        .select_from(FeedItem)
+        .join(SocialEdge, SocialEdge.followee_id == FeedItem.actor_id)
+        .where(FeedItem.id == item_id, SocialEdge.status == ACTIVE_STATUS)
+    )
+    result = await db.execute(
+        pg_insert(FeedInbox)
+        .from_select(["owner_id", "item_id", "created_at"], followers)
+        .on_conflict_do_nothing(index_elements=["owner_id", "item_id"])
+    )
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+async def remove_actor_from_inbox(
+    db: AsyncSession, owner_id: UUID, actor_id: UUID
+) -> None:
+    """Drop ``actor_id``'s items from ``owner_id``'s inbox (after an unfollow).
+
+    Runs in the caller's transaction; the inbox is capped, so this is small.
+    """
+
+    await db.execute(
+        delete(FeedInbox)
+        .where(
+            FeedInbox.owner_id == owner_id,
+            FeedInbox.item_id.in_(select(FeedItem.id).where(FeedItem.actor_id == actor_id)),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _before(created_at: Any, item_id: Any, after: tuple[datetime, UUID] | None):
+    if after is None:
+        return None
+    last_created_at, last_id = after
+    return or_(
+        created_at < last_created_at,
+        and_(created_at == last_created_at, item_id < last_id),
+    )
+
+
+async def get_feed(
+    db: AsyncSession,
+    viewer_id: UUID,
+    *,
+    limit: int,
+    after: tuple[datetime, UUID] | None = None,
+    max_followers: int | None = None,
+) -> list[FeedEntry]:
+    """Newest-first page of activity from the accounts ``viewer_id`` follows.
+
+    The page merges the viewer's inbox with items pulled directly from
+    followed accounts above the fan-out threshold. Each side is limited
+    before the merge, after dropping items by deactivated accounts, so a
+    short page means the feed is exhausted. ``after`` is the
+    ``(created_at, id)`` of the last item of the previous page.
+    """
+
+    threshold = settings.FEED_FANOUT_MAX_FOLLOWERS if max_followers is None else max_followers
+
+    inbox = (
+        select(FeedInbox.item_id.label("id"), FeedInbox.created_at)
+        .join(FeedItem, FeedItem.id == FeedInbox.item_id)
+        .join(User, User.id == FeedItem.actor_id)
+        .where(FeedInbox.owner_id == viewer_id, User.is_active.is_(True))
+    )
+    inbox_before = _before(FeedInbox.created_at, FeedInbox.item_id, after)
+    if inbox_before is not None:
+        inbox = inbox.where(inbox_before)
+    inbox = (
+        inbox.order_by(FeedInbox.created_at.desc(), FeedInbox.item_id.desc())
+        .limit(limit)
+        .subquery()
+    )
+
+    celebrities = (
+        select(SocialEdge.followee_id)
+        .join(User, User.id == SocialEdge.followee_id)
+        .where(
+            SocialEdge.follower_id == viewer_id,
+            SocialEdge.status == ACTIVE_STATUS,
+            User.follower_count > threshold,
+            User.is_active.is_(True),
+        )
+    )
+    pulled = select(FeedItem.id, FeedItem.created_at).where(
+        FeedItem.actor_id.in_(celebrities)
+    )
+    pulled_before = _before(FeedItem.created_at, FeedItem.id, after)
+    if pulled_before is not None:
+        pulled = pulled.where(pulled_before)
+    pulled = (
+        pulled.order_by(FeedItem.created_at.desc(), FeedItem.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+
+    # ``union`` also drops items an author fanned out before crossing the
+    # threshold and that are now pulled as well.
+    candidates = union(
+        select(inbox.c.id, inbox.c.created_at),
+        select(pulled.c.id, pulled.c.created_at),
+    ).subquery()
+    page = (
+        select(FeedItem, User)
+        .join(candidates, candidates.c.id == FeedItem.id)
+        .join(User, User.id == FeedItem.actor_id)
+        .order_by(FeedItem.created_at.desc(), FeedItem.id.desc())
+        .limit(limit)
+    )
+    result = await db.execute(page)
+    return [FeedEntry(item=item, actor=actor) for item, actor in result.all()]
+
+
+async def trim_inboxes(db: AsyncSession, *, max_items: int | None = None) -> int:
+    """Delete inbox pointers beyond the newest ``max_items`` per owner.
+
+    Only owners over the cap are ranked. Returns the number of rows removed.
+    """
+
+    cap = settings.FEED_INBOX_MAX_ITEMS if max_items is None else max_items
+    over_cap = (
+        select(FeedInbox.owner_id)
+        .group_by(FeedInbox.owner_id)
+        .having(func.count() > cap)
+    )
+    ranked = (
+        select(
+            FeedInbox.owner_id,
+            FeedInbox.item_id,
+            func.row_number()
+            .over(
+                partition_by=FeedInbox.owner_id,
+                order_by=(FeedInbox.created_at.desc(), FeedInbox.item_id.desc()),
+            )
+            .label("position"),
+        )
+        .where(FeedInbox.owner_id.in_(over_cap))
+        .subquery()
+    )
+    result = await db.execute(
+        delete(FeedInbox)
+        .where(
+            tuple_(FeedInbox.owner_id, FeedInbox.item_id).in_(
+                select(ranked.c.owner_id, ranked.c.item_id).where(ranked.c.position > cap)
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+__all__ = [
+    "FeedEntry",
+    "FeedItemKind",
+    "add_feed_item",
+    "fan_out_item",
+    "get_feed",
+    "remove_actor_from_inbox",
+    "trim_inboxes",
+]
@@ -6,9 +6,10 @@ from sqlalchemy.future import select
 from app.models.guild import Guild
 from app.models.user import User
 from app.schemas.guild import GuildCreate
+from app.services.principal_cache import AuthenticatedUser
 
 
-async def create_guild(db: AsyncSession, guild_in: GuildCreate, owner: User) -> Guild:
+async def create_guild(db: AsyncSession, guild_in: GuildCreate, owner: User | AuthenticatedUser) -> Guild:
     guild = Guild(name=guild_in.name, icon_url=guild_in.icon_url, owner_id=owner.id)
     db.add(guild)
     await db.commit()
@@ -0,0 +1,239 @@
+# backend/app/services/histogram_service.py
+
+"""Incrementally maintained histograms for percentile and distribution reads.
+
+Each user contributes one entry per histogram: their best ``score_value`` for
+a scenario, or their current energy (users without energy are left out).
+Writers move that entry between buckets as it changes, so percentile and
+distribution queries touch at most a few hundred bucket rows instead of
+scanning ``scores`` or ``users``. :func:`rebuild_histograms` recomputes
+everything from source and is run periodically to absorb drift from cascaded
+deletes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+from sqlalchemy import Integer, case, cast, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rank_histogram import RankHistogramBucket
+from app.models.score import Score
+from app.models.user import User
+
+
+class HistogramKind(str, Enum):
+    SCENARIO = "scenario"
+    ENERGY = "energy"
+
+
+ENERGY_KEY = ""
+BUCKET_WIDTHS = {
+    HistogramKind.SCENARIO: 2.5,
+    HistogramKind.ENERGY: 10.0,
+}
+
+
+@dataclass(frozen=True)
+class HistogramBucket:
+    lower: float
+    upper: float
+    count: int
+
+
+@dataclass(frozen=True)
+class Percentile:
+    value: float
+    percentile: float
+    total: int
+
+
+def bucket_for(kind: HistogramKind, value: float) -> int:
+    return max(0, int(value // BUCKET_WIDTHS[kind]))
+
+
+def bucket_expression(kind: HistogramKind, value):
+    """SQL counterpart of :func:`bucket_for`.
+
+    ``floor`` comes first because casting to integer rounds on PostgreSQL,
+    which would put 4.9 in a different bucket than the incremental path.
+    """
+
+    return cast(func.floor(value / BUCKET_WIDTHS[kind]), Integer)
+
+
+def _tracked(kind: HistogramKind, value: float | None) -> bool:
+    if value is None:
+        return False
+    return value > 0 if kind is HistogramKind.ENERGY else True
+
+
+async def adjust_histogram(
+    db: AsyncSession,
+    kind: HistogramKind,
+    key: str,
+    *,
+    old: float | None,
+    new: float | None,
+) -> None:
+    """Move one user's entry from ``old``'s bucket to ``new``'s.
+
+    ``None`` means the user had (or now has) no entry. Runs inside the
+    caller's transaction; nothing is committed here.
+    """
+
+    old_bucket = bucket_for(kind, old) if _tracked(kind, old) else None
+    new_bucket = bucket_for(kind, new) if _tracked(kind, new) else None
+    if old_bucket == new_bucket:
+        return
+
+    if old_bucket is not None:
+        await db.execute(
+            update(RankHistogramBucket)
+            .where(RankHistogramBucket.kind == kind.value)
+            .where(RankHistogramBucket.key == key)
+            .where(RankHistogramBucket.bucket == old_bucket)
+            .where(RankHistogramBucket.count > 0)
+            .values(count=RankHistogramBucket.count - 1)
+        )
+    if new_bucket is not None:
+        stmt = pg_insert(RankHistogramBucket).values(
+            kind=kind.value, key=key, bucket=new_bucket, count=1
+        )
+        current = RankHistogramBucket.__table__.c
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[current.kind, current.key, current.bucket],
+                set_={"count": current.count + stmt.excluded.count},
+            )
+        )
+
+
+async def get_distribution(
+    db: AsyncSession, kind: HistogramKind, key: str
+) -> list[HistogramBucket]:
+    """Non-empty buckets in ascending order."""
+
+    width = BUCKET_WIDTHS[kind]
+    result = await db.execute(
+        select(RankHistogramBucket.bucket, RankHistogramBucket.count)
+        .where(RankHistogramBucket.kind == kind.value)
+        .where(RankHistogramBucket.key == key)
+        .where(RankHistogramBucket.count > 0)
+        .order_by(RankHistogramBucket.bucket)
+    )
+    return [
+        HistogramBucket(
+            lower=row.bucket * width,
+            upper=(row.bucket + 1) * width,
+            count=row.count,
+        )
+        for row in result
+    ]
+
+
+async def get_percentile(
+    db: AsyncSession, kind: HistogramKind, key: str, value: float
+) -> Percentile:
+    """Share of tracked users below ``value``, counting half of its own bucket."""
+
+    bucket = bucket_for(kind, value)
+    count = RankHistogramBucket.count
+    row = (
+        await db.execute(
+            select(
+                func.sum(case((RankHistogramBucket.bucket < bucket, count), else_=0)).label(
+                    "below"
+                ),
+                func.sum(case((RankHistogramBucket.bucket == bucket, count), else_=0)).label(
+                    "same"
+                ),
+                func.sum(count).label("total"),
+            )
+            .where(RankHistogramBucket.kind == kind.value)
+            .where(RankHistogramBucket.key == key)
+        )
+    ).one()
+    total = int(row.total or 0)
+    if total == 0:
+        return Percentile(value=value, percentile=0.0, total=0)
+    percentile = (int(row.below or 0) + int(row.same or 0) / 2) / total * 100
+    return Percentile(value=value, percentile=round(percentile, 2), total=total)
+
+
+async def rebuild_histograms(db: AsyncSession) -> int:
+    """Recompute every histogram from ``scores`` and ``users``.
+
+    Returns the number of bucket rows written.
+    """
+
+    best = (
+        select(
+            Score.scenario_id.label("key"),
+            func.max(Score.score_value).label("best"),
+        )
+        .group_by(Score.scenario_id, Score.user_id)
+        .subquery()
+    )
+    scenario_bucket = bucket_expression(HistogramKind.SCENARIO, best.c.best)
+    energy_bucket = bucket_expression(HistogramKind.ENERGY, User.energy)
+    columns = [
+        RankHistogramBucket.kind,
+        RankHistogramBucket.key,
+        RankHistogramBucket.bucket,
+        RankHistogramBucket.count,
+    ]
+
+    await db.execute(delete(RankHistogramBucket))
+    scenarios = await db.execute(
+        insert(RankHistogramBucket)
+        .from_select(
+            columns,
+            select(
+                literal(HistogramKind.SCENARIO.value),
+                best.c.key,
+                scenario_bucket,
+                func.count(),
+            )
+            .where(best.c.best >= 0)
+            .group_by(best.c.key, scenario_bucket),
+        )
+        .returning(RankHistogramBucket.bucket)
+    )
+    written = len(scenarios.all())
+    energy = await db.execute(
+        insert(RankHistogramBucket)
+        .from_select(
+            columns,
+            select(
+                literal(HistogramKind.ENERGY.value),
+                literal(ENERGY_KEY),
+                energy_bucket,
+                func.count(),
+            )
+            .where(User.energy > 0)
+            .group_by(energy_bucket),
+        )
+        .returning(RankHistogramBucket.bucket)
+    )
+    written += len(energy.all())
+    await db.commit()
+    return written
+
+
+__all__ = [
+    "BUCKET_WIDTHS",
+    "ENERGY_KEY",
+    "HistogramBucket",
+    "HistogramKind",
+    "Percentile",
+    "adjust_histogram",
+    "bucket_expression",
+    "bucket_for",
+    "get_distribution",
+    "get_percentile",
+    "rebuild_histograms",
+]
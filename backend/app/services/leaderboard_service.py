@@ -0,0 +1,253 @@
+# backend/app/services/leaderboard_service.py
+
+"""Time-windowed and friends-only leaderboards."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, literal, or_, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload
+
+from app.models.period_score_best import PeriodScoreBest
+from app.models.score import Score
+from app.models.social import SocialEdge
+from app.models.user import User
+from app.services.social_service import ACTIVE_STATUS
+from app.utils.datetime import ensure_aware_utc
+
+
+class LeaderboardWindow(str, Enum):
+    WEEK = "week"
+    MONTH = "month"
+    ALL = "all"
+
+
+PERIOD_WINDOWS = (LeaderboardWindow.WEEK, LeaderboardWindow.MONTH)
+
+
+def period_start(window: LeaderboardWindow, ts: datetime) -> datetime:
+    """Start of the week (Monday) or month containing ``ts``, at midnight UTC."""
+
+    day = ensure_aware_utc(ts, field_name="timestamp", allow_naive=True).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    if window is LeaderboardWindow.WEEK:
+        return day - timedelta(days=day.weekday())
+    if window is LeaderboardWindow.MONTH:
+        return day.replace(day=1)
+    raise ValueError("The all-time window has no periods")
+
+
+async def record_period_bests(db: AsyncSession, score: Score) -> None:
+    """Fold a new score into its week's and month's best-score rollups.
+
+    ``score`` must already be flushed so it has an id. The upsert only
+    replaces an existing row when the new score is strictly higher. Runs in
+    the caller's transaction.
+    """
+
+    achieved_at = ensure_aware_utc(
+        score.created_at or datetime.now(timezone.utc),
+        field_name="created_at",
+        allow_naive=True,
+    )
+    current = PeriodScoreBest.__table__.c
+    for window in PERIOD_WINDOWS:
+        stmt = pg_insert(PeriodScoreBest).values(
+            period=window.value,
+            period_start=period_start(window, achieved_at),
+            scenario_id=score.scenario_id,
+            user_id=score.user_id,
+            score_id=score.id,
+            score_value=score.score_value,
+            weight_lifted=score.weight_lifted,
+            achieved_at=achieved_at,
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    current.period,
+                    current.period_start,
+                    current.scenario_id,
+                    current.user_id,
+                ],
+                set_={
+                    "score_id": stmt.excluded.score_id,
+                    "score_value": stmt.excluded.score_value,
+                    "weight_lifted": stmt.excluded.weight_lifted,
+                    "achieved_at": stmt.excluded.achieved_at,
+                },
+                where=stmt.excluded.score_value > current.score_value,
+            )
+        )
+
+
+async def windowed_score_leaderboard(
+    db: AsyncSession,
+    scenario_id: str,
+    window: LeaderboardWindow,
+    *,
+    offset: int,
+    limit: int,
+    now: datetime | None = None,
+) -> list[PeriodScoreBest]:
+    """Per-user bests for the current week or month, read from the rollup."""
+
+    start = period_start(window, now or datetime.now(timezone.utc))
+    result = await db.execute(
+        select(PeriodScoreBest)
+        .options(selectinload(PeriodScoreBest.user))
+        .where(
+            PeriodScoreBest.period == window.value,
+            PeriodScoreBest.period_start == start,
+            PeriodScoreBest.scenario_id == scenario_id,
+        )
+        .order_by(
+            PeriodScoreBest.score_value.desc(),
+            PeriodScoreBest.achieved_at.desc(),
+            PeriodScoreBest.score_id.desc(),
+        )
+        .offset(offset)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def purge_expired_periods(
+    db: AsyncSession,
+    *,
+    older_than: timedelta,
+    now: datetime | None = None,
+) -> int:
+    """Drop period rollups whose period started before the retention cutoff."""
+
+    cutoff = (now or datetime.now(timezone.utc)) - older_than
+    result = await db.execute(
+        delete(PeriodScoreBest)
+        .where(PeriodScoreBest.period_start < cutoff)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+def following_circle(viewer_id: UUID):
+    """The viewer plus everyone they actively follow, as a ``user_id`` subquery.
+
+    The ``follower_id``/``status`` predicate is served by the partial
+    ``idx_social_following_active_created`` index.
+    """
+
+    return union(
+        select(SocialEdge.followee_id.label("user_id")).where(
+            SocialEdge.follower_id == viewer_id,
+            SocialEdge.status == ACTIVE_STATUS,
+        ),
+        select(literal(viewer_id, SocialEdge.follower_id.type).label("user_id")),
+    ).subquery("circle")
+
+
+async def following_score_leaderboard(
+    db: AsyncSession,
+    viewer_id: UUID,
+    scenario_id: str,
+    *,
+    limit: int,
+    after: tuple[float, datetime, int] | None = None,
+) -> list[Score]:
+    """Best score per followed user (and the viewer) for one scenario.
+
+    Rows are ordered by ``(score_value, created_at, id)`` descending; ``after``
+    is that key of the last row of the previous page.
+    """
+
+    circle = following_circle(viewer_id)
+    ranked = (
+        select(
+            Score,
+            func.row_number()
+            .over(
+                partition_by=Score.user_id,
+                order_by=(
+                    Score.score_value.desc(),
+                    Score.created_at.desc(),
+                    Score.id.desc(),
+                ),
+            )
+            .label("position"),
+        )
+        .join(circle, circle.c.user_id == Score.user_id)
+        .where(Score.scenario_id == scenario_id)
+        .subquery("ranked")
+    )
+    best = aliased(Score, ranked)
+    query = select(best).where(ranked.c.position == 1)
+    if after is not None:
+        score_value, created_at, score_id = after
+        query = query.where(
+            or_(
+                best.score_value < score_value,
+                and_(
+                    best.score_value == score_value,
+                    or_(
+                        best.created_at < created_at,
+                        and_(best.created_at == created_at, best.id < score_id),
+                    ),
+                ),
+            )
+        )
+    query = (
+        query.options(selectinload(best.user))
+        .order_by(best.score_value.desc(), best.created_at.desc(), best.id.desc())
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+async def following_energy_leaderboard(
+    db: AsyncSession,
+    viewer_id: UUID,
+    *,
+    limit: int,
+    after: tuple[float, UUID] | None = None,
+) -> list[User]:
+    """Active followed users (and the viewer) by energy, highest first.
+
+    Users without energy sort as zero; ties break on ``id``. ``after`` is the
+    ``(energy, id)`` of the last row of the previous page.
+    """
+
+    circle = following_circle(viewer_id)
+    energy = func.coalesce(User.energy, 0.0)
+    query = (
+        select(User)
+        .join(circle, circle.c.user_id == User.id)
+        .where(User.is_active.is_(True))
+    )
+    if after is not None:
+        last_energy, last_id = after
+        query = query.where(
+            or_(energy < last_energy, and_(energy == last_energy, User.id > last_id))
+        )
+    query = query.order_by(energy.desc(), User.id.asc()).limit(limit)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+__all__ = [
+    "LeaderboardWindow",
+    "PERIOD_WINDOWS",
+    "following_circle",
+    "following_energy_leaderboard",
+    "following_score_leaderboard",
+    "period_start",
+    "purge_expired_periods",
+    "record_period_bests",
+    "windowed_score_leaderboard",
+]
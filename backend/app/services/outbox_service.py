@@ -0,0 +1,137 @@
+# backend/app/services/outbox_service.py
+
+"""Transactional outbox: record events in the caller's transaction, relay them later."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Mapping
+from uuid import uuid4
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.outbox_event import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+OutboxHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+MAX_RETRY_DELAY = timedelta(minutes=15)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = 2 ** min(max(attempts, 1), 10)
+    return min(timedelta(seconds=seconds), MAX_RETRY_DELAY)
+
+
+def add_outbox_event(
+    db: AsyncSession,
+    *,
+    topic: str,
+    payload: Mapping[str, Any],
+    now: datetime | None = None,
+) -> OutboxEvent:
+    """Stage an event on ``db``; it is persisted by the caller's commit.
+
+    The outbox row id doubles as the payload ``event_id`` so consumers can
+    deduplicate redeliveries.
+    """
+
+    timestamp = now or _utc_now()
+    event_id = uuid4()
+    event = OutboxEvent(
+        id=event_id,
+        topic=topic,
+        payload={**payload, "event_id": str(event_id)},
+        attempts=0,
+        available_at=timestamp,
+        created_at=timestamp,
+    )
+    db.add(event)
+    return event
+
+
+async def relay_outbox_events(
+    db: AsyncSession,
+    handlers: Mapping[str, OutboxHandler],
+    *,
+    batch_size: int = 100,
+    now: datetime | None = None,
+) -> int:
+    """Publish one batch of pending events and return how many succeeded.
+
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` so several relays can
+    run concurrently without delivering the same event twice. Failed
+    deliveries stay pending and are retried with exponential backoff.
+    """
+
+    timestamp = now or _utc_now()
+    result = await db.execute(
+        select(OutboxEvent)
+        .where(
+            OutboxEvent.published_at.is_(None),
+            OutboxEvent.available_at <= timestamp,
+        )
+        .order_by(OutboxEvent.available_at, OutboxEvent.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    events = list(result.scalars().all())
+    if not events:
+        await db.rollback()
+        return 0
+
+    published = 0
+    for event in events:
+        event.attempts = (event.attempts or 0) + 1
+        handler = handlers.get(event.topic)
+        try:
+            if handler is None:
+                raise LookupError(f"no handler registered for topic {event.topic!r}")
+            await handler(dict(event.payload or {}))
+        except Exception as exc:
+            logger.exception(
+                "Failed to relay outbox event %s (topic=%s, attempt=%d)",
+                event.id,
+                event.topic,
+                event.attempts,
+            )
+            event.last_error = str(exc)[:255]
+            event.available_at = timestamp + _retry_delay(event.attempts)
+            continue
+        event.published_at = timestamp
+        event.last_error = None
+        published += 1
+
+    await db.commit()
+    return published
+
+
+async def purge_published_events(
+    db: AsyncSession, *, older_than: timedelta, now: datetime | None = None
+) -> int:
+    """Delete delivered events older than ``older_than``."""
+
+    cutoff = (now or _utc_now()) - older_than
+    result = await db.execute(
+        delete(OutboxEvent).where(
+            OutboxEvent.published_at.is_not(None),
+            OutboxEvent.published_at < cutoff,
+        )
+    )
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
+__all__ = [
+    "OutboxHandler",
+    "add_outbox_event",
+    "relay_outbox_events",
+    "purge_published_events",
+]
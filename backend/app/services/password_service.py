@@ -0,0 +1,143 @@
+# backend/app/services/password_service.py
+
+"""bcrypt hashing and verification off the event loop.
+
+A bcrypt call takes 100-300 ms of CPU at production cost factors. Run inline
+in a handler it stalls every other request on the worker. Here the calls go
+to a dedicated thread pool of ``PASSWORD_HASH_WORKERS`` threads; bcrypt
+releases the GIL, so they run in parallel with the loop. At most
+``PASSWORD_HASH_MAX_PENDING`` calls may be queued or running. Beyond that,
+callers get a 503 at once rather than waiting behind a login spike.
+Counters for the pool are served by ``/health/passwords``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.security import pwd_context
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class PasswordServiceStats:
+    """Counters kept on the event loop thread, so they need no locking."""
+
+    pending: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    stale_hashes: int = 0
+
+
+class PasswordService:
+    def __init__(
+        self,
+        *,
+        context: CryptContext = pwd_context,
+        max_workers: int,
+        max_pending: int,
+    ) -> None:
+        self.context = context
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.stats = PasswordServiceStats()
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def _submit(self, func: Callable[..., T], *args) -> T:
+        if self.stats.pending >= self.max_pending:
+            self.stats.rejected += 1
+            logger.warning(
+                "Password pool saturated (%d pending); rejecting request",
+                self.stats.pending,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password"
+            )
+        self.stats.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, func, *args)
+        except BaseException:
+            # Errors and cancelled callers alike.
+            self.stats.failed += 1
+            raise
+        finally:
+            self.stats.pending -= 1
+        self.stats.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._submit(self.context.verify, password, hashed_password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verify, and return a replacement hash when the stored cost is stale."""
+
+        verified, new_hash = await self._submit(
+            self.context.verify_and_update, password, hashed_password
+        )
+        if new_hash is not None:
+            self.stats.stale_hashes += 1
+        return verified, new_hash
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Whether ``hashed_password`` uses a stale cost, counted like
+        ``verify_and_update``. Only parses the hash, so it runs inline."""
+
+        stale = self.context.needs_update(hashed_password)
+        if stale:
+            self.stats.stale_hashes += 1
+        return stale
+
+    def snapshot(self) -> dict[str, int]:
+        pending = self.stats.pending
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "running": min(pending, self.max_workers),
+            "queue_depth": max(pending - self.max_workers, 0),
+            "completed": self.stats.completed,
+            "failed": self.stats.failed,
+            "rejected": self.stats.rejected,
+            "stale_hashes": self.stats.stale_hashes,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_service = PasswordService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+__all__ = [
+    "PasswordService",
+    "PasswordServiceStats",
+    "password_service",
+]
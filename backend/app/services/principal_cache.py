@@ -0,0 +1,126 @@
+# backend/app/services/principal_cache.py
+
+"""Short-lived cache of authenticated principals keyed by user id.
+
+``core.auth.get_current_principal`` resolves a JWT ``sub`` to an
+:class:`AuthenticatedUser` holding only the columns request handlers check
+(tier, active flag and the unit/body fields used for scoring). Entries
+expire after ``AUTH_PRINCIPAL_CACHE_TTL_SECONDS`` and the least recently
+used ones are evicted beyond ``AUTH_PRINCIPAL_CACHE_MAX_ENTRIES``.
+
+Each API process keeps its own cache. Writes that change a cached column
+call :func:`invalidate_principal`; writes made by other processes are
+picked up once the entry expires.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.user import User
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    id: UUID
+    subscription_level: str
+    is_active: bool
+    preferred_unit: str
+    weight: float | None
+    gender: str | None
+
+
+_PRINCIPAL_COLUMNS = (
+    User.id,
+    User.subscription_level,
+    User.is_active,
+    User.preferred_unit,
+    User.weight,
+    User.gender,
+)
+
+
+class PrincipalCache:
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[UUID, tuple[float, AuthenticatedUser]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: UUID) -> AuthenticatedUser | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def put(self, principal: AuthenticatedUser) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+)
+
+
+async def load_principal(db: AsyncSession, user_id: UUID) -> AuthenticatedUser | None:
+    """The cached principal for ``user_id``, read from ``users`` on a miss."""
+
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    row = (
+        await db.execute(select(*_PRINCIPAL_COLUMNS).where(User.id == user_id))
+    ).one_or_none()
+    if row is None:
+        return None
+    principal = AuthenticatedUser(
+        id=row.id,
+        subscription_level=row.subscription_level,
+        is_active=bool(row.is_active),
+        preferred_unit=row.preferred_unit,
+        weight=row.weight,
+        gender=row.gender,
+    )
+    principal_cache.put(principal)
+    return principal
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """Drop ``user_id`` after a write to any of the cached columns."""
+
+    principal_cache.invalidate(user_id)
+
+
+__all__ = [
+    "AuthenticatedUser",
+    "PrincipalCache",
+    "invalidate_principal",
+    "load_principal",
+    "principal_cache",
+]
@@ -8,7 +8,8 @@ from datetime import datetime, timedelta, timezone
 from typing import Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import DateTime, and_, delete, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -19,10 +20,13 @@ from app.models.quest import (
     QuestStatus,
     QuestTemplate,
     UserQuest,
+    UserQuestHistory,
 )
+from app.db.functions import greatest
 from app.models.daily_workout_aggregate import DailyWorkoutAggregate
 from app.models.routine_submission import RoutineSubmission
 from app.services.level_service import award_xp
+from app.services.streak_service import record_workout_day
 from app.utils.datetime import ensure_optional_aware_utc
 
 UTC = timezone.utc
@@ -34,6 +38,10 @@ WORKOUT_SINGLE_SESSION_CODES = {
     WEEKLY_WORKOUT_QUEST_CODE,
 }
 QUALIFYING_MINUTES = 30
+# Ended cycles stay in the main quest list this long before moving to history.
+RECENT_CYCLE_WINDOW = timedelta(days=7)
+EXPIRABLE_STATUSES = (QuestStatus.ACTIVE.value, QuestStatus.COMPLETED.value)
+ARCHIVABLE_STATUSES = (QuestStatus.CLAIMED.value, QuestStatus.EXPIRED.value)
 
 
 def _utc_now() -> datetime:
@@ -185,7 +193,11 @@ async def _claim_reward(
 
 
 async def _sync_quests(
-    db: AsyncSession, quests: Iterable[UserQuest], now: datetime
+    db: AsyncSession,
+    quests: Iterable[UserQuest],
+    now: datetime,
+    *,
+    expire: bool = True,
 ) -> None:
     pending_commit = False
     for quest in quests:
@@ -204,9 +216,10 @@ async def _sync_quests(
 
         expires_at = _as_utc(quest.expires_at)
         if expires_at and now >= expires_at:
-            quest.status = QuestStatus.EXPIRED.value
-            quest.updated_at = now
-            pending_commit = True
+            if expire:
+                quest.status = QuestStatus.EXPIRED.value
+                quest.updated_at = now
+                pending_commit = True
             continue
 
         if quest.required_value <= 0:
@@ -227,19 +240,182 @@ async def _sync_quests(
 async def get_user_quests(
     db: AsyncSession, user_id: UUID, *, now: datetime | None = None
 ) -> list[UserQuest]:
+    """Return the user's current quests plus those from recently ended cycles.
+
+    Expiry is left to :func:`expire_stale_quests`; readers derive the
+    effective status from ``expires_at`` instead of writing it here.
+    """
+
     timestamp = now or _utc_now()
     await _ensure_user_quests(db, user_id, timestamp)
+    recent_cutoff = timestamp - RECENT_CYCLE_WINDOW
     result = await db.execute(
         select(UserQuest)
         .options(selectinload(UserQuest.template))
-        .where(UserQuest.user_id == user_id)
-        .order_by(UserQuest.available_from.desc(), UserQuest.created_at.desc())
+        .where(
+            UserQuest.user_id == user_id,
+            or_(
+                UserQuest.cycle_end.is_(None),
+                UserQuest.cycle_end > recent_cutoff,
+            ),
+        )
+        # ``available_from`` always equals ``cycle_start``; sorting on the
+        # latter lets ``ix_user_quests_user_cycle_start`` serve the order.
+        .order_by(UserQuest.cycle_start.desc(), UserQuest.id.desc())
     )
     quests = list(result.scalars().all())
-    await _sync_quests(db, quests, timestamp)
+    await _sync_quests(db, quests, timestamp, expire=False)
     return quests
 
 
+def _before_cursor(model, before: tuple[datetime, UUID]):
+    cycle_start, quest_id = before
+    return or_(
+        model.cycle_start < cycle_start,
+        and_(model.cycle_start == cycle_start, model.id < quest_id),
+    )
+
+
+async def get_user_quest_history(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    limit: int,
+    before: tuple[datetime, UUID] | None = None,
+    now: datetime | None = None,
+) -> list[UserQuest | UserQuestHistory]:
+    """Return quests from ended cycles, newest first, keyset-paginated.
+
+    Rows still in ``user_quests`` and rows already archived to
+    ``user_quest_history`` are merged on ``(cycle_start, id)``; ``before`` is
+    that key for the last row on the previous page.
+    """
+
+    timestamp = now or _utc_now()
+    live_stmt = (
+        select(UserQuest)
+        .options(selectinload(UserQuest.template))
+        .where(
+            UserQuest.user_id == user_id,
+            UserQuest.cycle_end.is_not(None),
+            UserQuest.cycle_end <= timestamp,
+        )
+        .order_by(UserQuest.cycle_start.desc(), UserQuest.id.desc())
+        .limit(limit)
+    )
+    archived_stmt = (
+        select(UserQuestHistory)
+        .options(selectinload(UserQuestHistory.template))
+        .where(UserQuestHistory.user_id == user_id)
+        .order_by(UserQuestHistory.cycle_start.desc(), UserQuestHistory.id.desc())
+        .limit(limit)
+    )
+    if before is not None:
+        live_stmt = live_stmt.where(_before_cursor(UserQuest, before))
+        archived_stmt = archived_stmt.where(_before_cursor(UserQuestHistory, before))
+
+    live = list((await db.execute(live_stmt)).scalars().all())
+    archived = list((await db.execute(archived_stmt)).scalars().all())
+    merged: list[UserQuest | UserQuestHistory] = [*live, *archived]
+    merged.sort(key=lambda quest: (_as_utc(quest.cycle_start), quest.id), reverse=True)
+    return merged[:limit]
+
+
+async def archive_finished_quests(
+    db: AsyncSession,
+    *,
+    older_than: timedelta,
+    batch_size: int = 1000,
+    now: datetime | None = None,
+) -> int:
+    """Move claimed/expired quests whose cycle ended before the cutoff to history.
+
+    Works in bounded batches (copy then delete, one commit per batch) so the
+    job never holds long locks on ``user_quests``.
+    """
+
+    timestamp = now or _utc_now()
+    cutoff = timestamp - older_than
+    archived = 0
+    while True:
+        result = await db.execute(
+            select(UserQuest.id)
+            .where(
+                UserQuest.status.in_(ARCHIVABLE_STATUSES),
+                UserQuest.cycle_end.is_not(None),
+                UserQuest.cycle_end < cutoff,
+            )
+            .order_by(UserQuest.cycle_end)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        ids = list(result.scalars().all())
+        if not ids:
+            await db.rollback()
+            break
+
+        await db.execute(
+            insert(UserQuestHistory).from_select(
+                [
+                    UserQuestHistory.id,
+                    UserQuestHistory.user_id,
+                    UserQuestHistory.template_id,
+                    UserQuestHistory.status,
+                    UserQuestHistory.progress_value,
+                    UserQuestHistory.required_value,
+                    UserQuestHistory.cycle_start,
+                    UserQuestHistory.cycle_end,
+                    UserQuestHistory.completed_at,
+                    UserQuestHistory.reward_claimed_at,
+                    UserQuestHistory.archived_at,
+                ],
+                select(
+                    UserQuest.id,
+                    UserQuest.user_id,
+                    UserQuest.template_id,
+                    UserQuest.status,
+                    UserQuest.progress_value,
+                    UserQuest.required_value,
+                    UserQuest.cycle_start,
+                    UserQuest.cycle_end,
+                    UserQuest.completed_at,
+                    UserQuest.reward_claimed_at,
+                    literal(timestamp, DateTime(timezone=True)),
+                ).where(UserQuest.id.in_(ids)),
+            )
+        )
+        await db.execute(
+            delete(UserQuest)
+            .where(UserQuest.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        archived += len(ids)
+        if len(ids) < batch_size:
+            break
+    return archived
+
+
+async def expire_stale_quests(
+    db: AsyncSession, *, now: datetime | None = None
+) -> int:
+    """Mark every unclaimed quest past its expiry as expired in one statement."""
+
+    timestamp = now or _utc_now()
+    result = await db.execute(
+        update(UserQuest)
+        .where(
+            UserQuest.expires_at.is_not(None),
+            UserQuest.expires_at <= timestamp,
+            UserQuest.status.in_(EXPIRABLE_STATUSES),
+        )
+        .values(status=QuestStatus.EXPIRED.value, updated_at=timestamp)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return int(result.rowcount or 0)
+
+
 async def _get_daily_aggregate(
     db: AsyncSession, user_id: UUID, day_start: datetime
 ) -> DailyWorkoutAggregate | None:
@@ -254,75 +430,101 @@ async def _get_daily_aggregate(
     return result.scalars().first()
 
 
-async def _upsert_daily_aggregate(
+async def _claim_submission_for_aggregate(
+    db: AsyncSession, submission_id: UUID, timestamp: datetime
+) -> tuple[UUID, float, datetime] | None:
+    """Mark a submission as aggregated, returning it only on the first claim.
+
+    Events are delivered at least once, so the aggregate counters must not be
+    bumped twice for the same submission.
+    """
+
+    result = await db.execute(
+        update(RoutineSubmission)
+        .where(
+            RoutineSubmission.id == submission_id,
+            RoutineSubmission.aggregated_at.is_(None),
+        )
+        .values(aggregated_at=timestamp)
+        .returning(
+            RoutineSubmission.user_id,
+            RoutineSubmission.duration,
+            RoutineSubmission.completion_timestamp,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    user_id, duration, completed_at = row
+    return user_id, float(duration or 0.0), completed_at
+
+
+async def _apply_submission_to_daily_aggregate(
     db: AsyncSession,
     user_id: UUID,
     *,
     day_start: datetime,
-    longest_session_minutes: int,
-    qualified: bool,
+    duration_minutes: float,
     timestamp: datetime,
 ) -> DailyWorkoutAggregate:
-    aggregate = await _get_daily_aggregate(db, user_id, day_start)
-    if aggregate is None:
-        aggregate = DailyWorkoutAggregate(
-            user_id=user_id,
-            day=day_start,
-            longest_session_minutes=longest_session_minutes,
-            qualified_30=qualified,
-            created_at=timestamp,
-            updated_at=timestamp,
+    minutes = max(0.0, float(duration_minutes or 0.0))
+    longest_minutes = int(round(minutes))
+    stmt = pg_insert(DailyWorkoutAggregate).values(
+        user_id=user_id,
+        day=day_start,
+        longest_session_minutes=longest_minutes,
+        qualified_30=longest_minutes >= QUALIFYING_MINUTES,
+        total_minutes=minutes,
+        workout_count=1,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+    current = DailyWorkoutAggregate.__table__.c
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=[current.user_id, current.day],
+            set_={
+                "longest_session_minutes": greatest(
+                    current.longest_session_minutes,
+                    stmt.excluded.longest_session_minutes,
+                ),
+                "qualified_30": or_(current.qualified_30, stmt.excluded.qualified_30),
+                "total_minutes": current.total_minutes + stmt.excluded.total_minutes,
+                "workout_count": current.workout_count + stmt.excluded.workout_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
         )
-        db.add(aggregate)
-    else:
-        if (
-            aggregate.longest_session_minutes != longest_session_minutes
-            or aggregate.qualified_30 != qualified
-        ):
-            aggregate.longest_session_minutes = longest_session_minutes
-            aggregate.qualified_30 = qualified
-            aggregate.updated_at = timestamp
-    await db.flush()
-    return aggregate
+        .returning(DailyWorkoutAggregate)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    return result.scalars().one()
 
 
-async def _recalculate_daily_aggregate(
+async def _sum_submissions(
     db: AsyncSession,
     user_id: UUID,
     *,
-    day_start: datetime,
-    timestamp: datetime,
-) -> DailyWorkoutAggregate | None:
-    day_end = day_start + timedelta(days=1)
+    start: datetime,
+    end: datetime | None,
+) -> tuple[int, float]:
     query = (
         select(
-            func.coalesce(func.max(RoutineSubmission.duration), 0.0),
-            func.max(
-                case(
-                    (RoutineSubmission.duration >= QUALIFYING_MINUTES, 1),
-                    else_=0,
-                )
-            ),
+            func.coalesce(func.count(RoutineSubmission.id), 0),
+            func.coalesce(func.sum(RoutineSubmission.duration), 0.0),
         )
         .where(RoutineSubmission.user_id == user_id)
-        .where(RoutineSubmission.completion_timestamp >= day_start)
-        .where(RoutineSubmission.completion_timestamp < day_end)
+        .where(RoutineSubmission.completion_timestamp >= start)
     )
+    if end is not None:
+        query = query.where(RoutineSubmission.completion_timestamp < end)
     result = await db.execute(query)
     row = result.first()
     if row is None:
-        return await _get_daily_aggregate(db, user_id, day_start)
-    max_duration, qualified_flag = row
-    longest_minutes = int(round(float(max_duration or 0.0)))
-    qualified = bool(qualified_flag) or longest_minutes >= QUALIFYING_MINUTES
-    return await _upsert_daily_aggregate(
-        db,
-        user_id,
-        day_start=day_start,
-        longest_session_minutes=longest_minutes,
-        qualified=qualified,
-        timestamp=timestamp,
-    )
+        return 0, 0.0
+    count, total_minutes = row
+    return int(count or 0), float(total_minutes or 0.0)
 
 
 async def _aggregate_submission_metrics(
@@ -332,22 +534,49 @@ async def _aggregate_submission_metrics(
     start: datetime,
     end: datetime | None,
 ) -> tuple[int, int]:
+    """Workout count and minutes in ``[start, end)`` read from daily aggregates.
+
+    Whole days are summed from ``daily_workout_aggregates``; a window edge that
+    falls mid-day (limited quests) is topped up from that day's submissions.
+    """
+
+    start = _as_utc(start)
+    end = _as_utc(end)
+    first_day = _start_of_day(start)
+    if first_day < start:
+        first_day += timedelta(days=1)
+    last_day = _start_of_day(end) if end is not None else None
+
+    if last_day is not None and first_day >= last_day:
+        count, minutes = await _sum_submissions(db, user_id, start=start, end=end)
+        return count, int(round(minutes))
+
     query = (
         select(
-            func.coalesce(func.count(RoutineSubmission.id), 0),
-            func.coalesce(func.sum(RoutineSubmission.duration), 0.0),
+            func.coalesce(func.sum(DailyWorkoutAggregate.workout_count), 0),
+            func.coalesce(func.sum(DailyWorkoutAggregate.total_minutes), 0.0),
         )
-        .where(RoutineSubmission.user_id == user_id)
-        .where(RoutineSubmission.completion_timestamp >= start)
+        .where(DailyWorkoutAggregate.user_id == user_id)
+        .where(DailyWorkoutAggregate.day >= first_day)
     )
-    if end is not None:
-        query = query.where(RoutineSubmission.completion_timestamp < end)
-    result = await db.execute(query)
-    row = result.first()
-    if row is None:
-        return 0, 0
-    count, total_minutes = row
-    return int(count or 0), int(round(float(total_minutes or 0.0)))
+    if last_day is not None:
+        query = query.where(DailyWorkoutAggregate.day < last_day)
+    row = (await db.execute(query)).first()
+    count = int(row[0] or 0) if row else 0
+    minutes = float(row[1] or 0.0) if row else 0.0
+
+    edges: list[tuple[datetime, datetime]] = []
+    if start < first_day:
+        edges.append((start, first_day))
+    if end is not None and last_day is not None and last_day < end:
+        edges.append((last_day, end))
+    for edge_start, edge_end in edges:
+        edge_count, edge_minutes = await _sum_submissions(
+            db, user_id, start=edge_start, end=edge_end
+        )
+        count += edge_count
+        minutes += edge_minutes
+    return count, int(round(minutes))
 
 
 async def _refresh_metric_quests_from_history(
@@ -355,6 +584,8 @@ async def _refresh_metric_quests_from_history(
     user_id: UUID,
     metric: QuestMetric,
     now: datetime,
+    *,
+    completed_at: datetime,
 ) -> None:
     await _ensure_user_quests(db, user_id, now)
     result = await db.execute(
@@ -365,6 +596,12 @@ async def _refresh_metric_quests_from_history(
             and_(
                 UserQuest.user_id == user_id,
                 QuestTemplate.metric == metric.value,
+                UserQuest.status.in_(EXPIRABLE_STATUSES),
+                UserQuest.cycle_start <= completed_at,
+                or_(
+                    UserQuest.cycle_end.is_(None),
+                    UserQuest.cycle_end > completed_at,
+                ),
             )
         )
     )
@@ -413,9 +650,11 @@ async def _refresh_workout_quests(
     *,
     completed_at: datetime,
     now: datetime,
+    aggregate: DailyWorkoutAggregate | None = None,
 ) -> None:
     day_start = _start_of_day(completed_at)
-    aggregate = await _get_daily_aggregate(db, user_id, day_start)
+    if aggregate is None:
+        aggregate = await _get_daily_aggregate(db, user_id, day_start)
     if aggregate is None:
         return
 
@@ -438,16 +677,16 @@ async def _refresh_workout_quests(
     week_start = _start_of_week(completed_at)
     week_end = week_start + timedelta(days=7)
     result = await db.execute(
-        select(DailyWorkoutAggregate).where(
+        select(func.count()).where(
             and_(
                 DailyWorkoutAggregate.user_id == user_id,
                 DailyWorkoutAggregate.day >= week_start,
                 DailyWorkoutAggregate.day < week_end,
+                DailyWorkoutAggregate.qualified_30.is_(True),
             )
         )
     )
-    weekly_rows = list(result.scalars().all())
-    qualified_days = sum(1 for row in weekly_rows if row.qualified_30)
+    qualified_days = int(result.scalar_one() or 0)
 
     changed = False
     for quest in quests:
@@ -485,47 +724,60 @@ async def process_routine_submission_event(
     user_id: UUID | None = None,
     now: datetime | None = None,
 ) -> None:
-    """Recompute quest state for a workout submission."""
+    """Fold a workout submission into the daily aggregate and refresh quests."""
 
     timestamp = now or _utc_now()
-    result = await db.execute(
-        select(RoutineSubmission).where(RoutineSubmission.id == submission_id)
-    )
-    submission = result.scalars().first()
-    if submission is None:
-        return
-
-    submission_user_id = submission.user_id
-    if user_id and user_id != submission_user_id:
-        submission_user_id = submission.user_id
-
-    completion_ts = _as_utc(submission.completion_timestamp) or timestamp
-    day_start = _start_of_day(completion_ts)
+    aggregate: DailyWorkoutAggregate | None = None
+    claimed = await _claim_submission_for_aggregate(db, submission_id, timestamp)
+    if claimed is not None:
+        submission_user_id, duration, completed_at = claimed
+        completion_ts = _as_utc(completed_at) or timestamp
+        day_start = _start_of_day(completion_ts)
+        aggregate = await _apply_submission_to_daily_aggregate(
+            db,
+            submission_user_id,
+            day_start=day_start,
+            duration_minutes=duration,
+            timestamp=timestamp,
+        )
+        await record_workout_day(
+            db,
+            submission_user_id,
+            day=day_start,
+            duration_minutes=duration,
+            new_day=aggregate.workout_count == 1,
+            now=timestamp,
+        )
+        await db.commit()
+    else:
+        # Redelivered event: the aggregate already counts this submission.
+        result = await db.execute(
+            select(
+                RoutineSubmission.user_id,
+                RoutineSubmission.completion_timestamp,
+            ).where(RoutineSubmission.id == submission_id)
+        )
+        row = result.first()
+        if row is None:
+            return
+        submission_user_id, completed_at = row
+        completion_ts = _as_utc(completed_at) or timestamp
 
     await _ensure_user_quests(db, submission_user_id, timestamp)
-    await _recalculate_daily_aggregate(
-        db,
-        submission_user_id,
-        day_start=day_start,
-        timestamp=timestamp,
-    )
-    await _refresh_metric_quests_from_history(
-        db,
-        submission_user_id,
-        QuestMetric.WORKOUTS_COMPLETED,
-        timestamp,
-    )
-    await _refresh_metric_quests_from_history(
-        db,
-        submission_user_id,
-        QuestMetric.ACTIVE_MINUTES,
-        timestamp,
-    )
+    for metric in (QuestMetric.WORKOUTS_COMPLETED, QuestMetric.ACTIVE_MINUTES):
+        await _refresh_metric_quests_from_history(
+            db,
+            submission_user_id,
+            metric,
+            timestamp,
+            completed_at=completion_ts,
+        )
     await _refresh_workout_quests(
         db,
         submission_user_id,
         completed_at=completion_ts,
         now=timestamp,
+        aggregate=aggregate,
     )
     await db.commit()
 
@@ -576,6 +828,9 @@ __all__ = [
     "QuestTemplate",
     "UserQuest",
     "get_user_quests",
+    "get_user_quest_history",
+    "archive_finished_quests",
+    "expire_stale_quests",
     "process_routine_submission_event",
     "claim_user_quest",
 ]
@@ -1,57 +1,365 @@
 # backend/app/services/rate_limiter.py
 
+"""Per-user action rate limiting with pluggable storage backends.
+
+``RATE_LIMIT_BACKEND`` selects where limiter state lives:
+
+* ``memory``: a GCRA state per key in this process. No I/O at all, but every
+  worker enforces its own budget, so use it only for single-process
+  deployments.
+* ``redis``: a sliding-window estimate over atomic per-window counters in a
+  shared store (``RATE_LIMIT_REDIS_URL``); needs the optional ``redis``
+  package.
+* ``database``: the original ``rate_limit_events`` table. It is exact but
+  costs a write per check, which commits with the caller's transaction.
+  Old rows are removed by the ``rate_limits.purge_events`` task, not by the
+  check itself.
+* ``auto`` (the default): ``redis`` when a URL is configured and the client
+  is installed, otherwise ``database``.
+
+A limiter may pin its own backend instead, e.g. read-only endpoints that
+must not write per request.
+"""
+
 from __future__ import annotations
 
+import logging
+import math
 from datetime import datetime, timedelta, timezone
+from typing import Protocol
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.config import settings
 from app.models.rate_limit_event import RateLimitEvent
 
+try:  # pragma: no cover - optional dependency for the shared-store backend
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - the other backends work without redis
+    aioredis = None
 
-class DistributedRateLimiter:
-    """Database-backed rate limiter that coordinates across workers."""
+logger = logging.getLogger(__name__)
 
-    def __init__(self, action: str, *, limit: int, window: timedelta) -> None:
-        self.action = action
-        self.limit = limit
-        self.window = window
 
-    async def check(self, db: AsyncSession, user_id: UUID) -> None:
-        now = datetime.now(timezone.utc)
-        cutoff = now - self.window
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class RateLimitBackend(Protocol):
+    async def acquire(
+        self,
+        db: AsyncSession,
+        action: str,
+        user_id: UUID,
+        *,
+        limit: int,
+        window: timedelta,
+        now: datetime | None = None,
+    ) -> bool:
+        """Record one attempt; ``False`` when it exceeds ``limit`` per ``window``."""
+
+
+class DatabaseRateLimitBackend:
+    """Counts ``rate_limit_events`` rows; exact across workers, one write per check."""
+
+    async def acquire(
+        self,
+        db: AsyncSession,
+        action: str,
+        user_id: UUID,
+        *,
+        limit: int,
+        window: timedelta,
+        now: datetime | None = None,
+    ) -> bool:
+        now = now or _utc_now()
+        cutoff = now - window
 
         count_stmt = (
             select(func.count())
             .select_from(RateLimitEvent)
             .where(
                 RateLimitEvent.user_id == user_id,
-                RateLimitEvent.action == self.action,
+                RateLimitEvent.action == action,
                 RateLimitEvent.occurred_at >= cutoff,
             )
         )
-        current_count = await db.scalar(count_stmt)
-        if (current_count or 0) >= self.limit:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded",
-            )
+        current_count = (await db.execute(count_stmt)).scalar_one()
+        if (current_count or 0) >= limit:
+            return False
 
         db.add(
             RateLimitEvent(
                 user_id=user_id,
-                action=self.action,
+                action=action,
                 occurred_at=now,
             )
         )
+        # Flushed only: the event commits with the caller's unit of work, so
+        # an attempt that fails and rolls back keeps its budget. Expired rows
+        # are left to ``purge_rate_limit_events``.
         await db.flush()
+        return True
+
+
+def _distinct_actions():
+    """The distinct ``action`` values, by a loose index scan.
+
+    ``SELECT DISTINCT`` would read the whole ``(action, occurred_at)`` index
+    to find a handful of values. This recursive query seeks to the next
+    larger action once per value instead.
+    """
+
+    actions = select(func.min(RateLimitEvent.action).label("action")).cte(
+        "actions", recursive=True
+    )
+    later = aliased(RateLimitEvent)
+    next_action = (
+        select(func.min(later.action))
+        .where(later.action > actions.c.action)
+        .scalar_subquery()
+    )
+    actions = actions.union_all(
+        select(next_action).where(actions.c.action.is_not(None))
+    )
+    return select(actions.c.action).where(actions.c.action.is_not(None))
+
+
+async def purge_rate_limit_events(
+    db: AsyncSession,
+    *,
+    older_than: timedelta,
+    batch_size: int = 5000,
+    now: datetime | None = None,
+) -> int:
+    """Delete ``rate_limit_events`` rows older than ``older_than``.
+
+    Works one action at a time in chunks of ``batch_size`` rows, each in its
+    own short transaction. Chunks are picked from the
+    ``(action, occurred_at)`` index with ``SKIP LOCKED``, so the reaper never
+    waits on, or deadlocks with, request-path inserts. ``older_than`` must
+    exceed every limiter's window. Returns the number of rows removed.
+    """
+
+    cutoff = (now or _utc_now()) - older_than
+    actions = (await db.execute(_distinct_actions())).scalars().all()
+    removed = 0
+    for action in actions:
+        while True:
+            chunk = (
+                select(RateLimitEvent.id)
+                .where(
+                    RateLimitEvent.action == action,
+                    RateLimitEvent.occurred_at < cutoff,
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                delete(RateLimitEvent)
+                .where(RateLimitEvent.id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            deleted = int(result.rowcount or 0)
+            removed += deleted
+            if deleted < batch_size:
+                break
+    return removed
+
+
+class InMemoryRateLimitBackend:
+    """Generic cell rate algorithm (GCRA) with one timestamp per key.
+
+    Requests are spaced ``window / limit`` apart with a burst allowance of
+    ``limit``, which behaves like a sliding window without storing events.
+    Expired keys are swept once more than ``max_keys`` are tracked.
+    """
+
+    def __init__(self, *, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._arrivals: dict[tuple[str, UUID], datetime] = {}
+
+    def _sweep(self, now: datetime) -> None:
+        self._arrivals = {
+            key: arrival for key, arrival in self._arrivals.items() if arrival > now
+        }
+
+    async def acquire(
+        self,
+        db: AsyncSession,
+        action: str,
+        user_id: UUID,
+        *,
+        limit: int,
+        window: timedelta,
+        now: datetime | None = None,
+    ) -> bool:
+        now = now or _utc_now()
+        if limit < 1:
+            return False
+        interval = window / limit
+        key = (action, user_id)
+        arrival = max(self._arrivals.get(key, now), now)
+        if arrival - (window - interval) > now:
+            return False
+        if len(self._arrivals) >= self.max_keys and key not in self._arrivals:
+            self._sweep(now)
+        self._arrivals[key] = arrival + interval
+        return True
+
+
+class CounterStore(Protocol):
+    """Atomic integer counters with expiry, e.g. Redis ``INCRBY``/``EXPIRE``."""
+
+    async def incr(self, key: str, amount: int, ttl_seconds: int) -> int: ...
 
-        cleanup_stmt = (
-            delete(RateLimitEvent)
-            .where(RateLimitEvent.occurred_at < cutoff - timedelta(minutes=5))
-            .where(RateLimitEvent.action == self.action)
+    async def get(self, key: str) -> int: ...
+
+
+class InMemoryCounterStore:
+    """Process-local :class:`CounterStore`, for tests and local development."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[int, datetime]] = {}
+
+    async def incr(self, key: str, amount: int, ttl_seconds: int) -> int:
+        now = _utc_now()
+        value, expires_at = self._values.get(key, (0, now))
+        if expires_at <= now:
+            value = 0
+        value += amount
+        self._values[key] = (value, now + timedelta(seconds=ttl_seconds))
+        return value
+
+    async def get(self, key: str) -> int:
+        value, expires_at = self._values.get(key, (0, _utc_now()))
+        return value if expires_at > _utc_now() else 0
+
+
+class RedisCounterStore:
+    """:class:`CounterStore` backed by a Redis server shared by all workers."""
+
+    def __init__(self, url: str) -> None:
+        if aioredis is None:
+            raise RuntimeError("The redis rate limit backend requires the redis package")
+        self._client = aioredis.from_url(url)
+
+    async def incr(self, key: str, amount: int, ttl_seconds: int) -> int:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.incrby(key, amount)
+            pipe.expire(key, ttl_seconds)
+            value, _ = await pipe.execute()
+        return int(value)
+
+    async def get(self, key: str) -> int:
+        value = await self._client.get(key)
+        return int(value or 0)
+
+
+class CounterRateLimitBackend:
+    """Sliding-window estimate over two fixed-window counters in a shared store.
+
+    The previous window's count is weighted by how much of it still overlaps
+    the sliding window. The attempt is counted with an atomic increment
+    first, and handed back if it pushed the estimate over the limit.
+    """
+
+    def __init__(self, store: CounterStore, *, prefix: str = "ratelimit") -> None:
+        self.store = store
+        self.prefix = prefix
+
+    async def acquire(
+        self,
+        db: AsyncSession,
+        action: str,
+        user_id: UUID,
+        *,
+        limit: int,
+        window: timedelta,
+        now: datetime | None = None,
+    ) -> bool:
+        now = now or _utc_now()
+        window_seconds = max(window.total_seconds(), 1.0)
+        position = now.timestamp() / window_seconds
+        index = math.floor(position)
+        elapsed = position - index
+        ttl = math.ceil(window_seconds * 2)
+
+        base = f"{self.prefix}:{action}:{user_id}"
+        current = await self.store.incr(f"{base}:{index}", 1, ttl)
+        previous = await self.store.get(f"{base}:{index - 1}")
+        if previous * (1 - elapsed) + current > limit:
+            await self.store.incr(f"{base}:{index}", -1, ttl)
+            return False
+        return True
+
+
+_default_backend: RateLimitBackend | None = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """The process-wide backend selected by ``RATE_LIMIT_BACKEND``."""
+
+    global _default_backend
+    if _default_backend is None:
+        choice = settings.RATE_LIMIT_BACKEND
+        redis_url = settings.RATE_LIMIT_REDIS_URL
+        if choice == "auto":
+            choice = "redis" if redis_url and aioredis is not None else "database"
+        if choice == "memory":
+            _default_backend = InMemoryRateLimitBackend()
+        elif choice == "redis":
+            if not redis_url:
+                raise RuntimeError("RATE_LIMIT_REDIS_URL must be set for the redis backend")
+            _default_backend = CounterRateLimitBackend(RedisCounterStore(redis_url))
+        else:
+            _default_backend = DatabaseRateLimitBackend()
+        logger.info("Rate limiting with the %s backend", choice)
+    return _default_backend
+
+
+class DistributedRateLimiter:
+    """Per-user limit of ``limit`` attempts at ``action`` per ``window``."""
+
+    def __init__(
+        self,
+        action: str,
+        *,
+        limit: int,
+        window: timedelta,
+        backend: RateLimitBackend | None = None,
+    ) -> None:
+        self.action = action
+        self.limit = limit
+        self.window = window
+        self.backend = backend
+
+    async def check(self, db: AsyncSession, user_id: UUID) -> None:
+        backend = self.backend or get_rate_limit_backend()
+        allowed = await backend.acquire(
+            db, self.action, user_id, limit=self.limit, window=self.window
         )
-        await db.execute(cleanup_stmt)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+            )
+
+
+__all__ = [
+    "CounterRateLimitBackend",
+    "CounterStore",
+    "DatabaseRateLimitBackend",
+    "DistributedRateLimiter",
+    "InMemoryCounterStore",
+    "InMemoryRateLimitBackend",
+    "RateLimitBackend",
+    "RedisCounterStore",
+    "get_rate_limit_backend",
+    "purge_rate_limit_events",
+]
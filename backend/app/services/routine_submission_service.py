@@ -2,24 +2,97 @@
 
 from datetime import datetime, timezone
 from typing import List
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 
 from app.models.routine import Routine
 from app.models.routine_submission import RoutineScenarioSubmission, RoutineSubmission
 from app.models.user import User
 from app.schemas.routine_submission import RoutineSubmissionCreate
-from app.tasks.quest_tasks import enqueue_routine_submission_event
+from app.services.feed_service import FeedItemKind, add_feed_item
+from app.services.outbox_service import add_outbox_event
+from app.services.principal_cache import AuthenticatedUser
+from app.tasks.analytics_tasks import (
+    TRAINING_VOLUME_TOPIC,
+    build_training_volume_payload,
+)
+from app.tasks.feed_tasks import FEED_FANOUT_TOPIC, build_feed_fanout_payload
+from app.tasks.quest_tasks import (
+    ROUTINE_SUBMISSION_TOPIC,
+    build_routine_submission_payload,
+)
 from app.utils.datetime import ensure_aware_utc
 
 
+def user_submissions_query(
+    user_id: str | UUID,
+    *,
+    limit: int | None = None,
+    before: tuple[datetime, UUID] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    include_scenarios: bool = False,
+):
+    """Select a user's submissions, newest first.
+
+    ``before`` is the ``(completion_timestamp, id)`` of the last row of the
+    previous page; ``since``/``until`` bound ``completion_timestamp`` as a
+    half-open ``[since, until)`` range.
+    """
+
+    query = select(RoutineSubmission).where(RoutineSubmission.user_id == user_id)
+    if since is not None:
+        query = query.where(RoutineSubmission.completion_timestamp >= since)
+    if until is not None:
+        query = query.where(RoutineSubmission.completion_timestamp < until)
+    if before is not None:
+        completed_at, submission_id = before
+        query = query.where(
+            or_(
+                RoutineSubmission.completion_timestamp < completed_at,
+                and_(
+                    RoutineSubmission.completion_timestamp == completed_at,
+                    RoutineSubmission.id < submission_id,
+                ),
+            )
+        )
+    if include_scenarios:
+        query = query.options(selectinload(RoutineSubmission.scenario_submissions))
+    query = query.order_by(
+        RoutineSubmission.completion_timestamp.desc(),
+        RoutineSubmission.id.desc(),
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
 async def get_user_submissions(
-    db: AsyncSession, user_id: str
+    db: AsyncSession,
+    user_id: str | UUID,
+    *,
+    limit: int | None = None,
+    before: tuple[datetime, UUID] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    include_scenarios: bool = False,
 ) -> List[RoutineSubmission]:
+    """Return a user's submissions; see :func:`user_submissions_query`."""
+
     result = await db.execute(
-        select(RoutineSubmission).where(RoutineSubmission.user_id == user_id)
+        user_submissions_query(
+            user_id,
+            limit=limit,
+            before=before,
+            since=since,
+            until=until,
+            include_scenarios=include_scenarios,
+        )
     )
     return result.scalars().all()
 
@@ -46,7 +119,7 @@ def generate_strava_title(scenarios: List[dict], timestamp: datetime) -> str:
 async def create_routine_submission(
     db: AsyncSession,
     routine_submission_data: RoutineSubmissionCreate,
-    current_user: User,
+    current_user: User | AuthenticatedUser,
 ) -> RoutineSubmission:
     routine = None
     if routine_submission_data.routine_id:
@@ -73,6 +146,7 @@ async def create_routine_submission(
         )
 
     routine_submission = RoutineSubmission(
+        id=uuid4(),
         routine_id=routine_submission_data.routine_id,
         user_id=current_user.id,
         duration=routine_submission_data.duration,
@@ -92,11 +166,43 @@ async def create_routine_submission(
         routine_submission.scenario_submissions.append(scenario_submission)
 
     db.add(routine_submission)
-    await db.commit()
-    await db.refresh(routine_submission)
-    enqueue_routine_submission_event(
-        user_id=current_user.id,
-        submission_id=routine_submission.id,
+    # Quest processing is driven by the outbox relay, committed atomically with the submission.
+    add_outbox_event(
+        db,
+        topic=ROUTINE_SUBMISSION_TOPIC,
+        payload=build_routine_submission_payload(
+            user_id=current_user.id,
+            submission_id=routine_submission.id,
+            occurred_at=completion_ts,
+        ),
+    )
+    add_outbox_event(
+        db,
+        topic=TRAINING_VOLUME_TOPIC,
+        payload=build_training_volume_payload(
+            user_id=current_user.id,
+            completed_at=completion_ts,
+        ),
+    )
+    feed_item = add_feed_item(
+        db,
+        actor_id=current_user.id,
+        kind=FeedItemKind.WORKOUT,
+        source_id=routine_submission.id,
+        summary={
+            "title": title,
+            "duration": routine_submission.duration,
+            "status": routine_submission.status,
+            "scenario_count": len(routine_submission_data.scenarios),
+        },
         occurred_at=completion_ts,
     )
+    add_outbox_event(
+        db,
+        topic=FEED_FANOUT_TOPIC,
+        payload=build_feed_fanout_payload(item_id=feed_item.id),
+    )
+    await db.commit()
+    # Every column is set client-side and the session keeps objects loaded
+    # across commit, so the in-memory graph is already the persisted state.
     return routine_submission
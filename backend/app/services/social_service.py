@@ -2,69 +2,168 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, case, delete, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
+from app.db.functions import greatest
 from app.models.social import SocialEdge
 from app.models.user import User
+from app.services.feed_service import remove_actor_from_inbox
+from app.services.user_search_index import user_search_index
 
 ACTIVE_STATUS = "active"
+# Upper bound on the match count reported by ``search_users``.
+SEARCH_COUNT_CAP = 1000
+# Users whose counters are recomputed per ``reconcile_follow_counts`` commit.
+RECONCILE_BATCH_SIZE = 1000
 
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-async def _with_relationship_flags(
-    db: AsyncSession, users: Sequence[User], viewer_id: UUID | None
-) -> list[dict[str, Any]]:
-    if not users:
-        return []
+@dataclass(frozen=True)
+class Relationship:
+    """How a viewer and one target user are connected."""
 
-    target_ids = [user.id for user in users]
-    following_ids: set[UUID] = set()
-    followed_by_ids: set[UUID] = set()
+    is_following: bool = False
+    is_followed_by: bool = False
 
-    if viewer_id and target_ids:
-        following_stmt = (
-            select(SocialEdge.followee_id)
-            .where(
-                SocialEdge.follower_id == viewer_id,
-                SocialEdge.followee_id.in_(target_ids),
-                SocialEdge.status == ACTIVE_STATUS,
-            )
+    @property
+    def is_friend(self) -> bool:
+        return self.is_following and self.is_followed_by
+
+
+_NO_RELATIONSHIP = Relationship()
+
+
+def relationship_flag_columns(viewer_id: UUID | None, user_id: Any) -> tuple[Any, Any]:
+    """Labeled ``is_following``/``is_followed_by`` columns for a list query.
+
+    Each is an ``EXISTS`` probe on the ``social_edges`` primary key correlated
+    to ``user_id``, so the flags come back with the page's rows instead of in
+    follow-up queries.
+    """
+
+    if viewer_id is None:
+        return (
+            literal(False).label("is_following"),
+            literal(False).label("is_followed_by"),
+        )
+    # Aliased so the probes never correlate to a ``social_edges`` join in the
+    # outer query.
+    outgoing = aliased(SocialEdge)
+    incoming = aliased(SocialEdge)
+    following = (
+        select(outgoing.followee_id)
+        .where(
+            outgoing.follower_id == viewer_id,
+            outgoing.followee_id == user_id,
+            outgoing.status == ACTIVE_STATUS,
+        )
+        .correlate_except(outgoing)
+        .exists()
+        .label("is_following")
+    )
+    followed_by = (
+        select(incoming.follower_id)
+        .where(
+            incoming.follower_id == user_id,
+            incoming.followee_id == viewer_id,
+            incoming.status == ACTIVE_STATUS,
         )
-        following_result = await db.execute(following_stmt)
-        following_ids = set(following_result.scalars().all())
+        .correlate_except(incoming)
+        .exists()
+        .label("is_followed_by")
+    )
+    return following, followed_by
 
-        followed_stmt = (
-            select(SocialEdge.follower_id)
-            .where(
-                SocialEdge.followee_id == viewer_id,
-                SocialEdge.follower_id.in_(target_ids),
-                SocialEdge.status == ACTIVE_STATUS,
-            )
+
+async def get_relationships(
+    db: AsyncSession, viewer_id: UUID | None, target_ids: Sequence[UUID]
+) -> dict[UUID, Relationship]:
+    """Batch-resolve ``viewer_id``'s relationship to every id in ``target_ids``.
+
+    One query over the active edges in either direction; targets without an
+    edge map to an empty :class:`Relationship`.
+    """
+
+    relationships = {target_id: _NO_RELATIONSHIP for target_id in target_ids}
+    if viewer_id is None or not relationships:
+        return relationships
+
+    ids = list(relationships)
+    result = await db.execute(
+        select(SocialEdge.follower_id, SocialEdge.followee_id).where(
+            SocialEdge.status == ACTIVE_STATUS,
+            or_(
+                and_(SocialEdge.follower_id == viewer_id, SocialEdge.followee_id.in_(ids)),
+                and_(SocialEdge.followee_id == viewer_id, SocialEdge.follower_id.in_(ids)),
+            ),
+        )
+    )
+    following: set[UUID] = set()
+    followed_by: set[UUID] = set()
+    for follower_id, followee_id in result:
+        if follower_id == viewer_id:
+            following.add(followee_id)
+        if followee_id == viewer_id:
+            followed_by.add(follower_id)
+    return {
+        target_id: Relationship(
+            is_following=target_id in following,
+            is_followed_by=target_id in followed_by,
+        )
+        for target_id in ids
+    }
+
+
+def _social_entry(
+    user: Any, relationship: Relationship, viewer_id: UUID | None
+) -> dict[str, Any]:
+    return {
+        "id": user.id,
+        "username": user.username,
+        "display_name": user.display_name,
+        "avatar_url": user.avatar_url,
+        "is_following": relationship.is_following,
+        "is_followed_by": relationship.is_followed_by,
+        "is_friend": relationship.is_friend,
+        "is_self": bool(viewer_id and user.id == viewer_id),
+    }
+
+
+def _entries_from_rows(rows: Sequence[Any], viewer_id: UUID | None) -> list[dict[str, Any]]:
+    """Build entries from ``(User, ..., is_following, is_followed_by)`` rows."""
+
+    return [
+        _social_entry(
+            row[0],
+            Relationship(
+                is_following=bool(row.is_following),
+                is_followed_by=bool(row.is_followed_by),
+            ),
+            viewer_id,
         )
-        followed_result = await db.execute(followed_stmt)
-        followed_by_ids = set(followed_result.scalars().all())
+        for row in rows
+    ]
+
 
+async def _with_relationship_flags(
+    db: AsyncSession, users: Sequence[Any], viewer_id: UUID | None
+) -> list[dict[str, Any]]:
+    if not users:
+        return []
+    relationships = await get_relationships(db, viewer_id, [user.id for user in users])
     return [
-        {
-            "id": user.id,
-            "username": user.username,
-            "display_name": user.display_name,
-            "avatar_url": user.avatar_url,
-            "is_following": user.id in following_ids,
-            "is_followed_by": user.id in followed_by_ids,
-            "is_friend": user.id in following_ids and user.id in followed_by_ids,
-            "is_self": bool(viewer_id and user.id == viewer_id),
-        }
-        for user in users
+        _social_entry(user, relationships[user.id], viewer_id) for user in users
     ]
 
 
@@ -73,69 +172,252 @@ async def get_user_relationship(
 ) -> dict[str, Any]:
     """Return relationship metadata for ``target`` from ``viewer_id``'s perspective."""
 
-    annotated = await _with_relationship_flags(db, [target], viewer_id)
-    if annotated:
-        return annotated[0]
+    relationships = await get_relationships(db, viewer_id, [target.id])
+    return _social_entry(target, relationships[target.id], viewer_id)
 
-    return {
-        "id": target.id,
-        "username": target.username,
-        "display_name": target.display_name,
-        "avatar_url": target.avatar_url,
-        "is_following": False,
-        "is_followed_by": False,
-        "is_friend": False,
-        "is_self": bool(viewer_id and target.id == viewer_id),
-    }
 
+async def _lock_pair(db: AsyncSession, first_id: UUID, second_id: UUID) -> None:
+    # Row locks in id order serialize follow changes between the same two
+    # users, so the reverse-edge check below always sees committed state.
+    await db.execute(
+        select(User.id)
+        .where(User.id.in_([first_id, second_id]))
+        .order_by(User.id)
+        .with_for_update()
+    )
 
-async def follow(db: AsyncSession, me_id: UUID, target_id: UUID) -> None:
-    """Create (or reactivate) a follow edge from ``me_id`` to ``target_id``."""
+
+async def _has_active_edge(db: AsyncSession, follower_id: UUID, followee_id: UUID) -> bool:
     result = await db.execute(
-        select(SocialEdge).where(
-            SocialEdge.follower_id == me_id,
-            SocialEdge.followee_id == target_id,
+        select(SocialEdge.follower_id).where(
+            SocialEdge.follower_id == follower_id,
+            SocialEdge.followee_id == followee_id,
+            SocialEdge.status == ACTIVE_STATUS,
         )
     )
-    edge = result.scalars().first()
-    if edge:
-        if edge.status != ACTIVE_STATUS:
-            edge.status = ACTIVE_STATUS
-            edge.created_at = _utcnow()
-    else:
-        db.add(
-            SocialEdge(
-                follower_id=me_id,
-                followee_id=target_id,
-                status=ACTIVE_STATUS,
-                created_at=_utcnow(),
-            )
+    return result.first() is not None
+
+
+async def _adjust_follow_counts(
+    db: AsyncSession, follower_id: UUID, followee_id: UUID, delta: int
+) -> None:
+    mutual_delta = delta if await _has_active_edge(db, followee_id, follower_id) else 0
+    await db.execute(
+        update(User)
+        .where(User.id == follower_id)
+        .values(
+            following_count=greatest(User.following_count + delta, 0),
+            mutual_count=greatest(User.mutual_count + mutual_delta, 0),
+        )
+    )
+    await db.execute(
+        update(User)
+        .where(User.id == followee_id)
+        .values(
+            follower_count=greatest(User.follower_count + delta, 0),
+            mutual_count=greatest(User.mutual_count + mutual_delta, 0),
+        )
+    )
+
+
+async def follow(db: AsyncSession, me_id: UUID, target_id: UUID) -> None:
+    """Create (or reactivate) a follow edge from ``me_id`` to ``target_id``.
+
+    Both users' counters are bumped in the same transaction, but only when
+    the edge actually became active, so repeated follows are no-ops.
+    """
+
+    await _lock_pair(db, me_id, target_id)
+    now = _utcnow()
+    result = await db.execute(
+        pg_insert(SocialEdge)
+        .values(
+            follower_id=me_id,
+            followee_id=target_id,
+            status=ACTIVE_STATUS,
+            created_at=now,
+        )
+        .on_conflict_do_update(
+            index_elements=[SocialEdge.follower_id, SocialEdge.followee_id],
+            set_={"status": ACTIVE_STATUS, "created_at": now},
+            where=SocialEdge.status != ACTIVE_STATUS,
         )
+        .returning(SocialEdge.follower_id)
+    )
+    if result.first() is not None:
+        await _adjust_follow_counts(db, me_id, target_id, 1)
     await db.commit()
 
 
 async def unfollow(db: AsyncSession, me_id: UUID, target_id: UUID) -> None:
     """Remove the follow edge from ``me_id`` to ``target_id`` if present."""
+
+    await _lock_pair(db, me_id, target_id)
     result = await db.execute(
-        select(SocialEdge).where(
+        delete(SocialEdge)
+        .where(
             SocialEdge.follower_id == me_id,
             SocialEdge.followee_id == target_id,
         )
+        .returning(SocialEdge.status)
+        .execution_options(synchronize_session=False)
     )
-    edge = result.scalars().first()
-    if edge:
-        await db.delete(edge)
+    if result.scalar_one_or_none() == ACTIVE_STATUS:
+        await _adjust_follow_counts(db, me_id, target_id, -1)
+        await remove_actor_from_inbox(db, me_id, target_id)
     await db.commit()
 
 
+async def _follow_counter(db: AsyncSession, column: Any, user_id: UUID) -> int:
+    total = await db.scalar(select(column).where(User.id == user_id))
+    return int(total or 0)
+
+
+async def reconcile_follow_counts(
+    db: AsyncSession,
+    *,
+    user_id: UUID | None = None,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+) -> int:
+    """Recompute the denormalized follow counters from ``social_edges``.
+
+    Repairs drift from cascaded edge deletes and direct SQL edits. Users are
+    processed in id-ordered batches, one commit each. Returns the number of
+    users whose counters changed.
+    """
+
+    followers = (
+        select(func.count())
+        .select_from(SocialEdge)
+        .where(SocialEdge.followee_id == User.id, SocialEdge.status == ACTIVE_STATUS)
+        .correlate(User)
+        .scalar_subquery()
+    )
+    following = (
+        select(func.count())
+        .select_from(SocialEdge)
+        .where(SocialEdge.follower_id == User.id, SocialEdge.status == ACTIVE_STATUS)
+        .correlate(User)
+        .scalar_subquery()
+    )
+    forward_edges = aliased(SocialEdge)
+    reverse_edges = aliased(SocialEdge)
+    mutuals = (
+        select(func.count())
+        .select_from(forward_edges)
+        .join(
+            reverse_edges,
+            and_(
+                reverse_edges.follower_id == forward_edges.followee_id,
+                reverse_edges.followee_id == forward_edges.follower_id,
+            ),
+        )
+        .where(
+            forward_edges.follower_id == User.id,
+            forward_edges.status == ACTIVE_STATUS,
+            reverse_edges.status == ACTIVE_STATUS,
+        )
+        .correlate(User)
+        .scalar_subquery()
+    )
+
+    corrected = 0
+    after: UUID | None = None
+    while True:
+        ids_stmt = select(User.id).order_by(User.id).limit(batch_size)
+        if user_id is not None:
+            ids_stmt = ids_stmt.where(User.id == user_id)
+        elif after is not None:
+            ids_stmt = ids_stmt.where(User.id > after)
+        ids = (await db.execute(ids_stmt)).scalars().all()
+        if not ids:
+            break
+        result = await db.execute(
+            update(User)
+            .where(
+                User.id.in_(ids),
+                or_(
+                    User.follower_count != followers,
+                    User.following_count != following,
+                    User.mutual_count != mutuals,
+                ),
+            )
+            .values(
+                follower_count=followers,
+                following_count=following,
+                mutual_count=mutuals,
+            )
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        corrected += len(result.all())
+        await db.commit()
+        if len(ids) < batch_size:
+            break
+        after = ids[-1]
+    return corrected
+
+
+async def _edge_page(
+    db: AsyncSession,
+    stmt: Any,
+    followed_at: Any,
+    other_id: Any,
+    viewer_id: UUID | None,
+    *,
+    offset: int,
+    limit: int,
+    after: tuple[datetime, UUID] | None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Run a ``select(User)`` joined to an edge, newest edge first.
+
+    ``followed_at`` and ``other_id`` are the edge's ``created_at`` and the
+    column joined to ``User.id``; ordering on edge columns lets the
+    ``idx_social_*_active_created`` partial indexes serve the sort. ``after`` is the
+    ``(followed_at, id)`` of the last row of the previous page; without it
+    the page is addressed by ``offset``. Each entry carries ``followed_at``
+    so callers can build the next cursor; one extra row is fetched to tell
+    whether another page follows, which the denormalized totals cannot.
+    """
+
+    if after is not None:
+        last_followed_at, last_id = after
+        stmt = stmt.where(
+            or_(
+                followed_at < last_followed_at,
+                and_(followed_at == last_followed_at, other_id < last_id),
+            )
+        )
+    else:
+        stmt = stmt.offset(offset)
+    stmt = (
+        stmt.add_columns(
+            followed_at.label("followed_at"),
+            *relationship_flag_columns(viewer_id, User.id),
+        )
+        .order_by(followed_at.desc(), other_id.desc())
+        .limit(limit + 1)
+    )
+    rows = (await db.execute(stmt)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    annotated = _entries_from_rows(rows, viewer_id)
+    for entry, row in zip(annotated, rows):
+        entry["followed_at"] = row.followed_at
+    return annotated, has_more
+
+
 async def get_followers(
     db: AsyncSession,
     user_id: UUID,
     viewer_id: UUID | None,
     offset: int,
     limit: int,
-) -> tuple[list[dict[str, Any]], int]:
-    """Return the active followers for ``user_id``."""
+    *,
+    after: tuple[datetime, UUID] | None = None,
+) -> tuple[list[dict[str, Any]], int, bool]:
+    """Return the active followers for ``user_id``, the total (``follower_count``)
+    and whether another page follows."""
     stmt = (
         select(User)
         .join(SocialEdge, SocialEdge.follower_id == User.id)
@@ -144,24 +426,19 @@ async def get_followers(
             SocialEdge.status == ACTIVE_STATUS,
             User.is_active.is_(True),
         )
-        .order_by(SocialEdge.created_at.desc())
-        .offset(offset)
-        .limit(limit)
     )
-    result = await db.execute(stmt)
-    users = result.scalars().all()
-
-    count_stmt = (
-        select(func.count())
-        .select_from(SocialEdge)
-        .where(
-            SocialEdge.followee_id == user_id,
-            SocialEdge.status == ACTIVE_STATUS,
-        )
+    annotated, has_more = await _edge_page(
+        db,
+        stmt,
+        SocialEdge.created_at,
+        SocialEdge.follower_id,
+        viewer_id,
+        offset=offset,
+        limit=limit,
+        after=after,
     )
-    total = await db.scalar(count_stmt)
-    annotated = await _with_relationship_flags(db, users, viewer_id)
-    return annotated, int(total or 0)
+    total = await _follow_counter(db, User.follower_count, user_id)
+    return annotated, total, has_more
 
 
 async def get_following(
@@ -170,8 +447,11 @@ async def get_following(
     viewer_id: UUID | None,
     offset: int,
     limit: int,
-) -> tuple[list[dict[str, Any]], int]:
-    """Return the active followees for ``user_id``."""
+    *,
+    after: tuple[datetime, UUID] | None = None,
+) -> tuple[list[dict[str, Any]], int, bool]:
+    """Return the active followees for ``user_id``, the total (``following_count``)
+    and whether another page follows."""
     stmt = (
         select(User)
         .join(SocialEdge, SocialEdge.followee_id == User.id)
@@ -180,24 +460,19 @@ async def get_following(
             SocialEdge.status == ACTIVE_STATUS,
             User.is_active.is_(True),
         )
-        .order_by(SocialEdge.created_at.desc())
-        .offset(offset)
-        .limit(limit)
     )
-    result = await db.execute(stmt)
-    users = result.scalars().all()
-
-    count_stmt = (
-        select(func.count())
-        .select_from(SocialEdge)
-        .where(
-            SocialEdge.follower_id == user_id,
-            SocialEdge.status == ACTIVE_STATUS,
-        )
+    annotated, has_more = await _edge_page(
+        db,
+        stmt,
+        SocialEdge.created_at,
+        SocialEdge.followee_id,
+        viewer_id,
+        offset=offset,
+        limit=limit,
+        after=after,
     )
-    total = await db.scalar(count_stmt)
-    annotated = await _with_relationship_flags(db, users, viewer_id)
-    return annotated, int(total or 0)
+    total = await _follow_counter(db, User.following_count, user_id)
+    return annotated, total, has_more
 
 
 async def get_mutuals(
@@ -206,8 +481,14 @@ async def get_mutuals(
     viewer_id: UUID | None,
     offset: int,
     limit: int,
-) -> tuple[list[dict[str, Any]], int]:
-    """Return the users that share mutual follows with ``user_id``."""
+    *,
+    after: tuple[datetime, UUID] | None = None,
+) -> tuple[list[dict[str, Any]], int, bool]:
+    """Return the users that share mutual follows with ``user_id``.
+
+    Ordered by when ``user_id`` followed them; the total is the denormalized
+    ``mutual_count``, returned with whether another page follows.
+    """
     forward_edges = aliased(SocialEdge)
     reverse_edges = aliased(SocialEdge)
 
@@ -227,34 +508,58 @@ async def get_mutuals(
             reverse_edges.status == ACTIVE_STATUS,
             User.is_active.is_(True),
         )
-        .order_by(forward_edges.created_at.desc())
-        .offset(offset)
-        .limit(limit)
     )
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+    annotated, has_more = await _edge_page(
+        db,
+        stmt,
+        forward_edges.created_at,
+        forward_edges.followee_id,
+        viewer_id,
+        offset=offset,
+        limit=limit,
+        after=after,
+    )
+    total = await _follow_counter(db, User.mutual_count, user_id)
+    return annotated, total, has_more
 
-    count_forward = aliased(SocialEdge)
-    count_reverse = aliased(SocialEdge)
-    count_stmt = (
-        select(func.count())
-        .select_from(count_forward)
-        .join(
-            count_reverse,
-            and_(
-                count_forward.followee_id == count_reverse.follower_id,
-                count_forward.follower_id == count_reverse.followee_id,
-            ),
-        )
-        .where(
-            count_forward.follower_id == user_id,
-            count_forward.status == ACTIVE_STATUS,
-            count_reverse.status == ACTIVE_STATUS,
-        )
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_statements(
+    needle: str, viewer_id: UUID | None, *, offset: int, limit: int
+) -> tuple[Any, Any]:
+    """The ranked page query and capped count query for a lowercased needle."""
+
+    escaped = _escape_like(needle)
+    username = func.lower(User.username)
+    display_name = func.lower(func.coalesce(User.display_name, ""))
+    filters = [
+        User.is_active.is_(True),
+        or_(
+            username.like(f"%{escaped}%", escape="\\"),
+            display_name.like(f"%{escaped}%", escape="\\"),
+        ),
+    ]
+    if viewer_id:
+        filters.append(User.id != viewer_id)
+    relevance = case(
+        (username == needle, 0),
+        (username.like(f"{escaped}%", escape="\\"), 1),
+        (display_name.like(f"{escaped}%", escape="\\"), 2),
+        else_=3,
     )
-    total = await db.scalar(count_stmt)
-    annotated = await _with_relationship_flags(db, users, viewer_id)
-    return annotated, int(total or 0)
+
+    page = (
+        select(User)
+        .where(*filters)
+        .order_by(relevance, username, User.id)
+        .offset(offset)
+        .limit(limit)
+    )
+    capped = select(User.id).where(*filters).limit(SEARCH_COUNT_CAP).subquery()
+    return page, select(func.count()).select_from(capped)
 
 
 async def search_users(
@@ -264,35 +569,43 @@ async def search_users(
     offset: int,
     limit: int,
 ) -> tuple[list[dict[str, Any]], int]:
-    """Search active users by username or display name."""
+    """Search active users by username or display name.
+
+    Matches rank an exact username first, then username prefixes, then
+    display-name prefixes, then other substring matches, alphabetically
+    within each tier. The substring predicates are served by the pg_trgm
+    GIN indexes on ``users``. The returned total is capped at
+    ``SEARCH_COUNT_CAP`` so short queries never count the whole table.
+
+    First pages that leave more prefix matches for the next page come from
+    the in-process ``user_search_index``; only the viewer's relationship
+    flags are read from the database for them. Their total counts prefix
+    matches, so it can grow by the substring-only matches once SQL serves
+    the next page.
+    """
 
     trimmed = query.strip()
     if not trimmed:
         return [], 0
 
-    pattern = f"%{trimmed.lower()}%"
-    username_match = func.lower(User.username).like(pattern)
-    display_match = func.lower(func.coalesce(User.display_name, "")).like(pattern)
-
-    base_filters = [User.is_active.is_(True), or_(username_match, display_match)]
+    needle = trimmed.lower()
+    if offset == 0:
+        hit = user_search_index.first_page(
+            needle, exclude=viewer_id, limit=limit, count_cap=SEARCH_COUNT_CAP
+        )
+        if hit is not None:
+            entries, total = hit
+            annotated = await _with_relationship_flags(db, entries, viewer_id)
+            return annotated, total
 
-    stmt = (
-        select(User)
-        .where(*base_filters)
-        .order_by(func.lower(User.username))
-        .offset(offset)
-        .limit(limit)
+    stmt, count_stmt = _search_statements(
+        needle, viewer_id, offset=offset, limit=limit
     )
-    count_stmt = select(func.count()).select_from(User).where(*base_filters)
-
-    if viewer_id:
-        stmt = stmt.where(User.id != viewer_id)
-        count_stmt = count_stmt.where(User.id != viewer_id)
-
-    result = await db.execute(stmt)
-    users = result.scalars().all()
+    result = await db.execute(
+        stmt.add_columns(*relationship_flag_columns(viewer_id, User.id))
+    )
+    annotated = _entries_from_rows(result.all(), viewer_id)
     total = await db.scalar(count_stmt)
-    annotated = await _with_relationship_flags(db, users, viewer_id)
     return annotated, int(total or 0)
 
 
@@ -0,0 +1,210 @@
+# backend/app/services/streak_service.py
+
+"""Workout streaks and rolling activity counters kept in one row per user."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.daily_workout_aggregate import DailyWorkoutAggregate
+from app.models.user import User
+from app.models.user_activity_summary import UserActivitySummary
+from app.utils.datetime import ensure_optional_aware_utc
+
+UTC = timezone.utc
+
+ROLLING_WINDOW_DAYS = 28
+SHORT_WINDOW_DAYS = 7
+
+
+@dataclass(frozen=True)
+class ActivitySummary:
+    user_id: UUID
+    current_streak: int
+    longest_streak: int
+    last_active_day: datetime | None
+    workouts_7d: int
+    minutes_7d: int
+    active_days_7d: int
+    workouts_28d: int
+    minutes_28d: int
+    active_days_28d: int
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _as_utc(dt: datetime | None) -> datetime | None:
+    return ensure_optional_aware_utc(dt, field_name="timestamp", allow_naive=True)
+
+
+def _start_of_day(ts: datetime) -> datetime:
+    return ts.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _shifted(values: list, anchor: datetime | None, new_anchor: datetime) -> list:
+    """Return ``values`` re-indexed so that index 0 is ``new_anchor``."""
+
+    padded = list(values or []) + [0] * (ROLLING_WINDOW_DAYS - len(values or []))
+    if anchor is None:
+        return [0] * ROLLING_WINDOW_DAYS
+    shift = (new_anchor - anchor).days
+    if shift <= 0:
+        return padded[:ROLLING_WINDOW_DAYS]
+    if shift >= ROLLING_WINDOW_DAYS:
+        return [0] * ROLLING_WINDOW_DAYS
+    return ([0] * shift + padded)[:ROLLING_WINDOW_DAYS]
+
+
+async def _lock_summary(db: AsyncSession, user_id: UUID) -> UserActivitySummary:
+    await db.execute(
+        pg_insert(UserActivitySummary)
+        .values(
+            user_id=user_id,
+            current_streak=0,
+            longest_streak=0,
+            recent_workouts=[],
+            recent_minutes=[],
+            updated_at=_utc_now(),
+        )
+        .on_conflict_do_nothing(index_elements=[UserActivitySummary.user_id])
+    )
+    result = await db.execute(
+        select(UserActivitySummary)
+        .where(UserActivitySummary.user_id == user_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().one()
+
+
+async def _recompute_streaks(db: AsyncSession, summary: UserActivitySummary) -> None:
+    result = await db.execute(
+        select(DailyWorkoutAggregate.day)
+        .where(
+            DailyWorkoutAggregate.user_id == summary.user_id,
+            DailyWorkoutAggregate.workout_count > 0,
+        )
+        .order_by(DailyWorkoutAggregate.day)
+    )
+    longest = run = 0
+    previous: datetime | None = None
+    for (raw_day,) in result:
+        day = _as_utc(raw_day)
+        run = run + 1 if previous is not None and day - previous == timedelta(days=1) else 1
+        longest = max(longest, run)
+        previous = day
+    summary.current_streak = run
+    summary.longest_streak = longest
+    summary.last_active_day = previous
+
+
+async def record_workout_day(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    day: datetime,
+    duration_minutes: float,
+    new_day: bool,
+    now: datetime | None = None,
+) -> UserActivitySummary:
+    """Fold one aggregated workout into the user's summary row.
+
+    ``new_day`` is true when this workout created the day's aggregate, which
+    is the only case where the streak can change. The caller commits.
+    """
+
+    timestamp = now or _utc_now()
+    day = _start_of_day(day)
+    summary = await _lock_summary(db, user_id)
+
+    last_active = _as_utc(summary.last_active_day)
+    if new_day:
+        if last_active is None or day - last_active > timedelta(days=1):
+            summary.current_streak = 1
+            summary.last_active_day = day
+        elif day - last_active == timedelta(days=1):
+            summary.current_streak += 1
+            summary.last_active_day = day
+        elif day < last_active:
+            # A backdated workout may bridge an older gap; rebuild from aggregates.
+            await _recompute_streaks(db, summary)
+        summary.longest_streak = max(summary.longest_streak, summary.current_streak)
+
+    anchor = _as_utc(summary.recent_anchor_day)
+    new_anchor = day if anchor is None or day > anchor else anchor
+    workouts = _shifted(summary.recent_workouts, anchor, new_anchor)
+    minutes = _shifted(summary.recent_minutes, anchor, new_anchor)
+    index = (new_anchor - day).days
+    if index < ROLLING_WINDOW_DAYS:
+        workouts[index] += 1
+        minutes[index] = round(minutes[index] + max(0.0, float(duration_minutes or 0.0)), 2)
+    summary.recent_anchor_day = new_anchor
+    summary.recent_workouts = workouts
+    summary.recent_minutes = minutes
+    summary.updated_at = timestamp
+    await db.flush()
+    return summary
+
+
+def summarize(
+    user_id: UUID, summary: UserActivitySummary | None, *, now: datetime | None = None
+) -> ActivitySummary:
+    """Project a stored summary row onto the windows ending today."""
+
+    if summary is None:
+        return ActivitySummary(user_id, 0, 0, None, 0, 0, 0, 0, 0, 0)
+
+    today = _start_of_day(now or _utc_now())
+    last_active = _as_utc(summary.last_active_day)
+    current = summary.current_streak
+    if last_active is None or today - last_active > timedelta(days=1):
+        current = 0
+
+    workouts = _shifted(summary.recent_workouts, _as_utc(summary.recent_anchor_day), today)
+    minutes = _shifted(summary.recent_minutes, _as_utc(summary.recent_anchor_day), today)
+    short_workouts = workouts[:SHORT_WINDOW_DAYS]
+    return ActivitySummary(
+        user_id=user_id,
+        current_streak=current,
+        longest_streak=summary.longest_streak,
+        last_active_day=last_active,
+        workouts_7d=sum(short_workouts),
+        minutes_7d=int(round(sum(minutes[:SHORT_WINDOW_DAYS]))),
+        active_days_7d=sum(1 for count in short_workouts if count),
+        workouts_28d=sum(workouts),
+        minutes_28d=int(round(sum(minutes))),
+        active_days_28d=sum(1 for count in workouts if count),
+    )
+
+
+async def get_activity_summary(
+    db: AsyncSession, user_id: UUID, *, now: datetime | None = None
+) -> ActivitySummary | None:
+    """Return the user's summary, or ``None`` if the user does not exist."""
+
+    result = await db.execute(
+        select(User.id, UserActivitySummary)
+        .outerjoin(UserActivitySummary, UserActivitySummary.user_id == User.id)
+        .where(User.id == user_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return summarize(row[0], row[1], now=now)
+
+
+__all__ = [
+    "ActivitySummary",
+    "ROLLING_WINDOW_DAYS",
+    "get_activity_summary",
+    "record_workout_day",
+    "summarize",
+]
@@ -0,0 +1,200 @@
+# backend/app/services/training_volume_service.py
+
+"""Weekly training volume per muscle group and per scenario."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.functions import advisory_lock_key, advisory_xact_lock, utc_week_start
+from app.models.associations import ScenarioPrimaryMuscleAssociation
+from app.models.routine_submission import RoutineScenarioSubmission, RoutineSubmission
+from app.models.training_volume import WeeklyTrainingVolume
+from app.utils.datetime import ensure_aware_utc
+
+UTC = timezone.utc
+
+
+class VolumeDimension(str, Enum):
+    MUSCLE = "muscle"
+    SCENARIO = "scenario"
+
+
+@dataclass(frozen=True)
+class VolumeBucket:
+    week_start: datetime
+    key: str
+    volume: float
+    sets: int
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+def start_of_week(ts: datetime) -> datetime:
+    day = ensure_aware_utc(ts, field_name="timestamp", allow_naive=True).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return day - timedelta(days=day.weekday())
+
+
+def _volume_query(
+    user_id: UUID,
+    dimension: VolumeDimension,
+    *,
+    start: datetime,
+    end: datetime,
+):
+    week = utc_week_start(RoutineSubmission.completion_timestamp)
+    if dimension is VolumeDimension.MUSCLE:
+        key = ScenarioPrimaryMuscleAssociation.muscle_id
+    else:
+        key = RoutineScenarioSubmission.scenario_id
+
+    query = (
+        select(
+            week.label("week_start"),
+            key.label("key"),
+            func.sum(RoutineScenarioSubmission.total_volume).label("volume"),
+            func.sum(RoutineScenarioSubmission.sets).label("sets"),
+        )
+        .select_from(RoutineScenarioSubmission)
+        .join(
+            RoutineSubmission,
+            RoutineSubmission.id == RoutineScenarioSubmission.routine_id,
+        )
+    )
+    if dimension is VolumeDimension.MUSCLE:
+        # A scenario with several primary muscles credits its volume to each.
+        query = query.join(
+            ScenarioPrimaryMuscleAssociation,
+            ScenarioPrimaryMuscleAssociation.scenario_id
+            == RoutineScenarioSubmission.scenario_id,
+        )
+    return (
+        query.where(RoutineSubmission.user_id == user_id)
+        .where(RoutineSubmission.completion_timestamp >= start)
+        .where(RoutineSubmission.completion_timestamp < end)
+        .group_by(week, key)
+        .order_by(week, key)
+    )
+
+
+async def compute_volume_series(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    dimension: VolumeDimension,
+    start: datetime,
+    end: datetime,
+) -> list[VolumeBucket]:
+    """Weekly volume buckets for ``[start, end)`` straight from submissions."""
+
+    result = await db.execute(
+        _volume_query(user_id, dimension, start=start, end=end)
+    )
+    return [
+        VolumeBucket(
+            week_start=ensure_aware_utc(
+                row.week_start, field_name="week_start", allow_naive=True
+            ),
+            key=row.key,
+            volume=float(row.volume or 0.0),
+            sets=int(row.sets or 0),
+        )
+        for row in result
+    ]
+
+
+async def refresh_weekly_volume(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    week_start: datetime,
+    now: datetime | None = None,
+) -> int:
+    """Rebuild the rollup rows of one user-week from its submissions.
+
+    Recomputing the whole week keeps the refresh idempotent, so redelivered
+    events are harmless. Refreshes of the same user-week are serialized by an
+    advisory lock; otherwise each one's delete would miss the other's new
+    rows and one insert would hit the primary key. Returns the number of
+    rollup rows written.
+    """
+
+    timestamp = now or _utc_now()
+    week_start = start_of_week(week_start)
+    week_end = week_start + timedelta(days=7)
+
+    await db.execute(
+        select(
+            advisory_xact_lock(
+                advisory_lock_key("weekly_volume", user_id, week_start.isoformat())
+            )
+        )
+    )
+
+    rows: list[dict] = []
+    for dimension in VolumeDimension:
+        for bucket in await compute_volume_series(
+            db, user_id, dimension=dimension, start=week_start, end=week_end
+        ):
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "week_start": week_start,
+                    "dimension": dimension.value,
+                    "key": bucket.key,
+                    "volume": bucket.volume,
+                    "sets": bucket.sets,
+                    "updated_at": timestamp,
+                }
+            )
+
+    await db.execute(
+        delete(WeeklyTrainingVolume)
+        .where(WeeklyTrainingVolume.user_id == user_id)
+        .where(WeeklyTrainingVolume.week_start == week_start)
+    )
+    if rows:
+        await db.execute(insert(WeeklyTrainingVolume).values(rows))
+    await db.commit()
+    return len(rows)
+
+
+async def get_weekly_volume(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    dimension: VolumeDimension,
+    weeks: int,
+    now: datetime | None = None,
+) -> list[WeeklyTrainingVolume]:
+    """Rollup rows for the last ``weeks`` weeks, including the current one."""
+
+    since = start_of_week(now or _utc_now()) - timedelta(weeks=max(weeks, 1) - 1)
+    result = await db.execute(
+        select(WeeklyTrainingVolume)
+        .where(WeeklyTrainingVolume.user_id == user_id)
+        .where(WeeklyTrainingVolume.dimension == dimension.value)
+        .where(WeeklyTrainingVolume.week_start >= since)
+        .order_by(WeeklyTrainingVolume.week_start, WeeklyTrainingVolume.key)
+    )
+    return list(result.scalars().all())
+
+
+__all__ = [
+    "VolumeBucket",
+    "VolumeDimension",
+    "compute_volume_series",
+    "get_weekly_volume",
+    "refresh_weekly_volume",
+    "start_of_week",
+]
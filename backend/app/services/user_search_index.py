@@ -0,0 +1,302 @@
+# backend/app/services/user_search_index.py
+
+"""In-process prefix index that answers the first page of user lookups.
+
+Lowercased usernames and display names of active users are kept in two
+sorted arrays, so a prefix range is two bisections and counting it is free.
+The first page of ``search_users`` is served from here whenever it can be
+filled entirely with prefix matches. That is the common case for one- or
+two-letter typeahead queries, which are the ones trigram indexes handle
+worst. Deeper pages, and queries that need substring-only matches, fall
+back to SQL; both paths use the same ordering.
+
+Each API process keeps its own copy. Local writes through ``user_service``
+update it immediately, and a periodic rebuild picks up writes made by other
+processes. The rebuild sorts in a worker thread and replays local writes
+made while it was reading, so neither the event loop nor recent signups pay
+for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Above this many display-name prefix matches the page is left to SQL, which
+# would otherwise mean sorting a large slice per keystroke.
+DISPLAY_SCAN_LIMIT = 2000
+LOAD_BATCH_SIZE = 5000
+_RANGE_END = "\U0010ffff"
+
+
+@dataclass(slots=True)
+class IndexedUser:
+    id: UUID
+    username: str
+    display_name: str | None
+    avatar_url: str | None
+
+    @property
+    def sort_key(self) -> tuple[str, str]:
+        return self.username.lower(), str(self.id)
+
+
+@dataclass(slots=True)
+class IndexSnapshot:
+    users: dict[UUID, IndexedUser]
+    usernames: list[tuple[str, str, UUID]]
+    display_names: list[tuple[str, str, UUID]]
+
+
+class UserPrefixIndex:
+    def __init__(self) -> None:
+        self._users: dict[UUID, IndexedUser] = {}
+        self._usernames: list[tuple[str, str, UUID]] = []
+        self._display_names: list[tuple[str, str, UUID]] = []
+        # Writes seen while a rebuild reads the table; ``None`` marks a removal.
+        self._pending: dict[UUID, IndexedUser | None] | None = None
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    @property
+    def loading(self) -> bool:
+        return self._pending is not None
+
+    @staticmethod
+    def _display_key(user: IndexedUser) -> tuple[str, str, UUID] | None:
+        if not user.display_name:
+            return None
+        return user.display_name.lower(), str(user.id), user.id
+
+    @staticmethod
+    def _username_key(user: IndexedUser) -> tuple[str, str, UUID]:
+        return user.username.lower(), str(user.id), user.id
+
+    @classmethod
+    def build(cls, users: Iterable[IndexedUser]) -> IndexSnapshot:
+        """Sort ``users`` into a snapshot; touches no index state, so it can
+        run off the event loop."""
+
+        by_id = {user.id: user for user in users}
+        usernames = sorted(cls._username_key(user) for user in by_id.values())
+        display_names = sorted(
+            key for key in map(cls._display_key, by_id.values()) if key is not None
+        )
+        return IndexSnapshot(by_id, usernames, display_names)
+
+    def begin_load(self) -> None:
+        """Start recording writes so ``install`` can replay them."""
+
+        self._pending = {}
+
+    def cancel_load(self) -> None:
+        self._pending = None
+
+    def install(self, snapshot: IndexSnapshot) -> None:
+        """Swap in ``snapshot``, then replay writes made since ``begin_load``."""
+
+        pending, self._pending = self._pending or {}, None
+        self._users = snapshot.users
+        self._usernames = snapshot.usernames
+        self._display_names = snapshot.display_names
+        for user_id, entry in pending.items():
+            if entry is None:
+                self.remove(user_id)
+            else:
+                self.upsert(entry)
+        self.ready = True
+
+    def load(self, users: Iterable[IndexedUser]) -> None:
+        """Replace the whole index with ``users``."""
+
+        self.install(self.build(users))
+
+    def clear(self) -> None:
+        """Drop every entry and stop answering queries until the next load."""
+
+        self._users, self._usernames, self._display_names = {}, [], []
+        self._pending = None
+        self.ready = False
+
+    def _discard(self, array: list, key) -> None:
+        if key is None:
+            return
+        position = bisect_left(array, key)
+        if position < len(array) and array[position] == key:
+            del array[position]
+
+    def remove(self, user_id: UUID) -> None:
+        if self._pending is not None:
+            self._pending[user_id] = None
+        existing = self._users.pop(user_id, None)
+        if existing is None:
+            return
+        self._discard(self._usernames, self._username_key(existing))
+        self._discard(self._display_names, self._display_key(existing))
+
+    def upsert(self, user: User | IndexedUser) -> None:
+        """Index ``user``'s current handles; inactive users are dropped."""
+
+        self.remove(user.id)
+        if getattr(user, "is_active", True) is False:
+            return
+        entry = IndexedUser(
+            id=user.id,
+            username=user.username,
+            display_name=user.display_name,
+            avatar_url=user.avatar_url,
+        )
+        if self._pending is not None:
+            self._pending[entry.id] = entry
+        self._users[entry.id] = entry
+        insort(self._usernames, self._username_key(entry))
+        display_key = self._display_key(entry)
+        if display_key is not None:
+            insort(self._display_names, display_key)
+
+    @staticmethod
+    def _prefix_range(array: list, needle: str) -> tuple[int, int]:
+        return bisect_left(array, (needle,)), bisect_left(array, (needle + _RANGE_END,))
+
+    def first_page(
+        self, needle: str, *, exclude: UUID | None, limit: int, count_cap: int
+    ) -> tuple[list[IndexedUser], int] | None:
+        """The first ``limit`` prefix matches for a lowercased ``needle``.
+
+        Matches are ordered like the SQL search: username prefixes first (an
+        exact username sorts first among them), then display-name prefixes,
+        alphabetically by username within each group. The total counts each
+        matching user once, capped at ``count_cap`` like the SQL count.
+
+        Returns ``None`` unless more prefix matches remain after the page, so
+        a served page always has a next page. When every prefix match fits,
+        substring-only matches may follow, and only SQL can rank and count
+        them.
+        """
+
+        if not self.ready or not needle:
+            return None
+
+        def username_matches(user_id: UUID) -> bool:
+            return self._users[user_id].username.lower().startswith(needle)
+
+        user_lo, user_hi = self._prefix_range(self._usernames, needle)
+        page: list[IndexedUser] = []
+        for _, _, user_id in self._usernames[user_lo:user_hi]:
+            if user_id == exclude:
+                continue
+            page.append(self._users[user_id])
+            if len(page) == limit:
+                break
+        user_count = user_hi - user_lo
+        if exclude in self._users and username_matches(exclude):
+            user_count -= 1
+
+        display_lo, display_hi = self._prefix_range(self._display_names, needle)
+        display_only: list[IndexedUser] | None = None
+
+        def scan_display_only() -> list[IndexedUser]:
+            # Users whose username also matches are already counted above.
+            return [
+                self._users[user_id]
+                for _, _, user_id in self._display_names[display_lo:display_hi]
+                if user_id != exclude and not username_matches(user_id)
+            ]
+
+        if len(page) < limit:
+            if display_hi - display_lo > DISPLAY_SCAN_LIMIT:
+                return None
+            display_only = scan_display_only()
+            extra = sorted(display_only, key=lambda user: user.sort_key)
+            page.extend(extra[: limit - len(page)])
+
+        # Display-name keys are one per user, so a range longer than the cap
+        # already means at least ``count_cap`` distinct matches.
+        if user_count >= count_cap or display_hi - display_lo > count_cap:
+            total = count_cap
+        else:
+            if display_only is None:
+                display_only = scan_display_only()
+            total = min(user_count + len(display_only), count_cap)
+        if total <= len(page):
+            return None
+        return page, total
+
+
+user_search_index = UserPrefixIndex()
+
+
+async def load_user_search_index(
+    db: AsyncSession, index: UserPrefixIndex = user_search_index
+) -> int:
+    """Rebuild ``index`` from the active rows of ``users``.
+
+    The old arrays keep serving until the new ones are sorted in a worker
+    thread; local writes made meanwhile are replayed on top before the swap.
+    """
+
+    index.begin_load()
+    try:
+        result = await db.stream(
+            select(User.id, User.username, User.display_name, User.avatar_url)
+            .where(User.is_active.is_(True))
+            .execution_options(yield_per=LOAD_BATCH_SIZE)
+        )
+        users: list[IndexedUser] = []
+        async for partition in result.partitions():
+            users.extend(
+                IndexedUser(
+                    id=row.id,
+                    username=row.username,
+                    display_name=row.display_name,
+                    avatar_url=row.avatar_url,
+                )
+                for row in partition
+            )
+        snapshot = await asyncio.to_thread(index.build, users)
+    except BaseException:
+        index.cancel_load()
+        raise
+    index.install(snapshot)
+    return len(users)
+
+
+async def run_refresh_loop(stop: asyncio.Event, interval: float) -> None:
+    """Rebuild the process-wide index every ``interval`` seconds until ``stop``."""
+
+    from app.db.session import async_session
+
+    while not stop.is_set():
+        try:
+            async with async_session() as session:
+                loaded = await load_user_search_index(session)
+            logger.info("User search index loaded with %d users", loaded)
+        except Exception:
+            logger.exception("User search index refresh failed")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+__all__ = [
+    "IndexSnapshot",
+    "IndexedUser",
+    "UserPrefixIndex",
+    "load_user_search_index",
+    "run_refresh_loop",
+    "user_search_index",
+]
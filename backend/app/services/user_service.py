@@ -5,17 +5,37 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.core.security import hash_password, verify_password
+from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.services.level_service import ensure_user_xp
+from app.services.password_service import password_service
+from app.services.principal_cache import invalidate_principal
+from app.services.user_search_index import user_search_index
 
 
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> User | None:
     user = await get_user_by_email(db, email)
-    if user and verify_password(password, user.hashed_password):
+    if user is None:
+        return None
+    if not settings.PASSWORD_REHASH_ON_LOGIN:
+        # ``verify_and_update`` would pay for a second bcrypt run to build a
+        # hash that is then thrown away; a stale hash is only counted.
+        if not await password_service.verify(password, user.hashed_password):
+            return None
+        password_service.needs_update(user.hashed_password)
         return user
-    return None
+    verified, new_hash = await password_service.verify_and_update(
+        password, user.hashed_password
+    )
+    if not verified:
+        return None
+    if new_hash is not None:
+        # The stored hash uses an old cost factor; replace it while the
+        # plaintext is at hand.
+        user.hashed_password = new_hash
+        await db.commit()
+    return user
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
@@ -37,7 +57,7 @@ async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
     user = User(
         username=user_in.username,
         email=user_in.email,
-        hashed_password=hash_password(user_in.password),
+        hashed_password=await password_service.hash(user_in.password),
         avatar_url=user_in.avatar_url,
         display_name=user_in.display_name or user_in.username,
         subscription_level="free",
@@ -49,6 +69,8 @@ async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
     await db.commit()
     await db.refresh(user)
     await ensure_user_xp(db, user.id)
+    if user_search_index.ready or user_search_index.loading:
+        user_search_index.upsert(user)
     return user
 
 
@@ -56,15 +78,21 @@ async def update_user(db: AsyncSession, user: User, updates: UserUpdate) -> User
     update_data = updates.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         if field == "password" and value is not None:
-            setattr(user, "hashed_password", hash_password(value))
+            setattr(user, "hashed_password", await password_service.hash(value))
         else:
             setattr(user, field, value)
     await db.commit()
     await db.refresh(user)
+    invalidate_principal(user.id)
+    if user_search_index.ready or user_search_index.loading:
+        user_search_index.upsert(user)
     return user
 
 
 async def delete_user(db: AsyncSession, user_to_delete: User) -> None:
+    user_id = user_to_delete.id
     await db.delete(user_to_delete)
     await db.commit()
+    invalidate_principal(user_id)
+    user_search_index.remove(user_id)
     return None
@@ -0,0 +1,120 @@
+"""Celery tasks that keep training analytics rollups current."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Mapping
+from uuid import UUID
+
+try:  # pragma: no cover - use Celery logger when available
+    from celery.utils.log import get_task_logger  # type: ignore
+except ImportError:  # pragma: no cover - fallback for environments without Celery
+    import logging
+
+    def get_task_logger(name: str):
+        return logging.getLogger(name)
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.db.session import async_session
+from app.services import histogram_service, leaderboard_service, training_volume_service
+from app.utils.datetime import ensure_aware_utc
+
+logger = get_task_logger(__name__)
+
+TRAINING_VOLUME_TOPIC = "analytics.training_volume"
+
+
+def build_training_volume_payload(
+    *, user_id: UUID, completed_at: datetime
+) -> dict[str, str]:
+    """Serialize the user-week whose volume rollup needs refreshing."""
+
+    return {
+        "user_id": str(user_id),
+        "completed_at": ensure_aware_utc(
+            completed_at, field_name="completed_at", allow_naive=True
+        ).isoformat(),
+    }
+
+
+async def _refresh_training_volume(payload: Mapping[str, Any]) -> int:
+    try:
+        user_id = UUID(str(payload.get("user_id")))
+        completed_at = ensure_aware_utc(
+            datetime.fromisoformat(str(payload.get("completed_at"))),
+            field_name="completed_at",
+            allow_naive=True,
+        )
+    except (ValueError, TypeError):
+        logger.exception("Invalid training volume event: %s", payload)
+        return 0
+
+    async with async_session() as session:
+        return await training_volume_service.refresh_weekly_volume(
+            session, user_id, week_start=completed_at
+        )
+
+
+@celery_app.task(
+    name="analytics.refresh_training_volume",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    acks_late=True,
+)
+def refresh_training_volume(payload: Mapping[str, Any]) -> int:
+    """Rebuild one user-week of the weekly training volume rollup."""
+
+    return asyncio.run(_refresh_training_volume(payload))
+
+
+async def publish_training_volume_event(payload: Mapping[str, Any]) -> None:
+    """Outbox handler: refresh inline in eager mode, otherwise enqueue."""
+
+    if getattr(celery_app.conf, "task_always_eager", False):
+        await _refresh_training_volume(payload)
+        return
+    refresh_training_volume.delay(dict(payload))
+
+
+async def _rebuild_rank_histograms() -> int:
+    async with async_session() as session:
+        return await histogram_service.rebuild_histograms(session)
+
+
+@celery_app.task(name="analytics.rebuild_rank_histograms")
+def rebuild_rank_histograms() -> int:
+    """Recompute score and energy histograms to absorb incremental drift."""
+
+    written = asyncio.run(_rebuild_rank_histograms())
+    logger.info("Rebuilt rank histograms with %d buckets", written)
+    return written
+
+
+async def _purge_leaderboard_periods() -> int:
+    async with async_session() as session:
+        return await leaderboard_service.purge_expired_periods(
+            session,
+            older_than=timedelta(days=settings.LEADERBOARD_PERIOD_RETENTION_DAYS),
+        )
+
+
+@celery_app.task(name="analytics.purge_leaderboard_periods")
+def purge_leaderboard_periods() -> int:
+    """Drop weekly/monthly leaderboard rollups past the retention window."""
+
+    removed = asyncio.run(_purge_leaderboard_periods())
+    logger.info("Purged %d expired leaderboard period rows", removed)
+    return removed
+
+
+__all__ = [
+    "TRAINING_VOLUME_TOPIC",
+    "build_training_volume_payload",
+    "publish_training_volume_event",
+    "purge_leaderboard_periods",
+    "rebuild_rank_histograms",
+    "refresh_training_volume",
+]
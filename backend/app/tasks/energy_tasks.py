@@ -0,0 +1,41 @@
+"""Celery tasks that maintain energy history."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+try:  # pragma: no cover - use Celery logger when available
+    from celery.utils.log import get_task_logger  # type: ignore
+except ImportError:  # pragma: no cover - fallback for environments without Celery
+    import logging
+
+    def get_task_logger(name: str):
+        return logging.getLogger(name)
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.db.session import async_session
+from app.services import energy_service
+
+logger = get_task_logger(__name__)
+
+
+async def _compact_energy_history() -> int:
+    async with async_session() as session:
+        return await energy_service.compact_energy_history(
+            session,
+            window=timedelta(seconds=settings.ENERGY_DEDUPE_WINDOW_SECONDS),
+        )
+
+
+@celery_app.task(name="energy.compact_history")
+def compact_energy_history() -> int:
+    """Collapse repeated energy values left by client resubmits."""
+
+    removed = asyncio.run(_compact_energy_history())
+    logger.info("Compacted %d repeated energy history rows", removed)
+    return removed
+
+
+__all__ = ["compact_energy_history"]
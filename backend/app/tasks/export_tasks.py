@@ -0,0 +1,76 @@
+"""Celery tasks for bulk history exports."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+try:  # pragma: no cover - use Celery logger when available
+    from celery.utils.log import get_task_logger  # type: ignore
+except ImportError:  # pragma: no cover - fallback for environments without Celery
+    import logging
+
+    def get_task_logger(name: str):
+        return logging.getLogger(name)
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.db.session import async_session
+from app.services import export_service
+
+logger = get_task_logger(__name__)
+
+
+async def _export_history(
+    user_id: UUID | None,
+    fmt: export_service.ExportFormat,
+    progress: export_service.ProgressCallback,
+) -> dict[str, Any]:
+    async with async_session() as session:
+        manifest = await export_service.export_history(
+            session,
+            user_id=user_id,
+            fmt=fmt,
+            chunk_rows=settings.EXPORT_CHUNK_ROWS,
+            progress=progress,
+        )
+    return manifest.as_dict()
+
+
+@celery_app.task(name="exports.export_history", bind=True)
+def export_history(self, user_id: str | None = None, fmt: str = "csv") -> dict[str, Any]:
+    """Export one user's (or every user's) history; progress is reported as task state."""
+
+    def report(progress: export_service.ExportProgress) -> None:
+        meta = {"table": progress.table, "rows": progress.rows, "files": progress.files}
+        logger.info("Export progress %s", meta)
+        try:
+            self.update_state(state="PROGRESS", meta=meta)
+        except Exception:  # pragma: no cover - no result backend configured
+            pass
+
+    manifest = asyncio.run(
+        _export_history(
+            UUID(user_id) if user_id else None,
+            export_service.ExportFormat(fmt),
+            report,
+        )
+    )
+    logger.info("Export %s finished: %s", manifest["export_id"], manifest["tables"])
+    return manifest
+
+
+@celery_app.task(name="exports.purge_expired")
+def purge_expired() -> int:
+    """Delete exports older than ``EXPORT_RETENTION_DAYS``."""
+
+    removed = export_service.purge_exports(
+        older_than=timedelta(days=settings.EXPORT_RETENTION_DAYS)
+    )
+    logger.info("Purged %d expired exports", removed)
+    return removed
+
+
+__all__ = ["export_history", "purge_expired"]
@@ -0,0 +1,85 @@
+"""Celery tasks that fan activity out to follower inboxes and trim them."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Mapping
+from uuid import UUID
+
+try:  # pragma: no cover - use Celery logger when available
+    from celery.utils.log import get_task_logger  # type: ignore
+except ImportError:  # pragma: no cover - fallback for environments without Celery
+    import logging
+
+    def get_task_logger(name: str):
+        return logging.getLogger(name)
+
+from app.core.celery_app import celery_app
+from app.db.session import async_session
+from app.services import feed_service
+
+logger = get_task_logger(__name__)
+
+FEED_FANOUT_TOPIC = "feed.fan_out"
+
+
+def build_feed_fanout_payload(*, item_id: UUID) -> dict[str, str]:
+    """Serialize the feed item that needs copying into follower inboxes."""
+
+    return {"item_id": str(item_id)}
+
+
+async def _fan_out_item(payload: Mapping[str, Any]) -> int:
+    try:
+        item_id = UUID(str(payload.get("item_id")))
+    except (ValueError, TypeError):
+        logger.exception("Invalid feed fan-out event: %s", payload)
+        return 0
+
+    async with async_session() as session:
+        return await feed_service.fan_out_item(session, item_id)
+
+
+@celery_app.task(
+    name="feed.fan_out_item",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    acks_late=True,
+)
+def fan_out_item(payload: Mapping[str, Any]) -> int:
+    """Write inbox pointers for one feed item."""
+
+    return asyncio.run(_fan_out_item(payload))
+
+
+async def publish_feed_fanout_event(payload: Mapping[str, Any]) -> None:
+    """Outbox handler: fan out inline in eager mode, otherwise enqueue."""
+
+    if getattr(celery_app.conf, "task_always_eager", False):
+        await _fan_out_item(payload)
+        return
+    fan_out_item.delay(dict(payload))
+
+
+async def _trim_inboxes() -> int:
+    async with async_session() as session:
+        return await feed_service.trim_inboxes(session)
+
+
+@celery_app.task(name="feed.trim_inboxes")
+def trim_inboxes() -> int:
+    """Cap every feed inbox at ``FEED_INBOX_MAX_ITEMS`` pointers."""
+
+    removed = asyncio.run(_trim_inboxes())
+    logger.info("Trimmed %d feed inbox rows", removed)
+    return removed
+
+
+__all__ = [
+    "FEED_FANOUT_TOPIC",
+    "build_feed_fanout_payload",
+    "fan_out_item",
+    "publish_feed_fanout_event",
+    "trim_inboxes",
+]
@@ -0,0 +1,98 @@
+"""Celery tasks and in-process loop that relay transactional outbox events."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+try:  # pragma: no cover - use Celery logger when available
+    from celery.utils.log import get_task_logger  # type: ignore
+except ImportError:  # pragma: no cover - fallback for environments without Celery
+    import logging
+
+    def get_task_logger(name: str):
+        return logging.getLogger(name)
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.db.session import async_session
+from app.services import outbox_service
+from app.tasks.analytics_tasks import (
+    TRAINING_VOLUME_TOPIC,
+    publish_training_volume_event,
+)
+from app.tasks.feed_tasks import FEED_FANOUT_TOPIC, publish_feed_fanout_event
+from app.tasks.quest_tasks import (
+    ROUTINE_SUBMISSION_TOPIC,
+    publish_routine_submission_event,
+)
+
+logger = get_task_logger(__name__)
+
+OUTBOX_HANDLERS: dict[str, outbox_service.OutboxHandler] = {
+    ROUTINE_SUBMISSION_TOPIC: publish_routine_submission_event,
+    TRAINING_VOLUME_TOPIC: publish_training_volume_event,
+    FEED_FANOUT_TOPIC: publish_feed_fanout_event,
+}
+
+
+async def relay_once(batch_size: int | None = None) -> int:
+    """Relay a single batch of pending outbox events."""
+
+    async with async_session() as session:
+        return await outbox_service.relay_outbox_events(
+            session,
+            OUTBOX_HANDLERS,
+            batch_size=batch_size or settings.OUTBOX_RELAY_BATCH_SIZE,
+        )
+
+
+async def run_relay_loop(stop: asyncio.Event) -> None:
+    """Poll the outbox until ``stop`` is set, draining full batches back-to-back."""
+
+    batch_size = settings.OUTBOX_RELAY_BATCH_SIZE
+    interval = settings.OUTBOX_RELAY_INTERVAL_SECONDS
+    while not stop.is_set():
+        try:
+            published = await relay_once(batch_size)
+        except Exception:
+            logger.exception("Outbox relay iteration failed")
+            published = 0
+        if published >= batch_size:
+            continue
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+@celery_app.task(name="outbox.relay_events")
+def relay_outbox_events() -> int:
+    """Relay pending outbox events; scheduled by celery beat in broker mode."""
+
+    return asyncio.run(relay_once())
+
+
+async def _purge_published() -> int:
+    async with async_session() as session:
+        return await outbox_service.purge_published_events(
+            session, older_than=timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+        )
+
+
+@celery_app.task(name="outbox.purge_published")
+def purge_published_outbox_events() -> int:
+    """Drop delivered outbox rows past the retention window."""
+
+    removed = asyncio.run(_purge_published())
+    logger.info("Purged %d published outbox events", removed)
+    return removed
+
+
+__all__ = [
+    "OUTBOX_HANDLERS",
+    "relay_once",
+    "run_relay_loop",
+    "relay_outbox_events",
+    "purge_published_outbox_events",
+]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Mapping
 from uuid import UUID, uuid4
 
@@ -16,6 +16,7 @@ except ImportError:  # pragma: no cover - fallback for environments without Cele
         return logging.getLogger(name)
 
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.db.session import async_session
 from app.services import quest_service
 from app.utils.datetime import ensure_optional_aware_utc
@@ -85,16 +86,49 @@ def process_routine_submission(self, payload: Mapping[str, Any]) -> str:
     return event_id
 
 
-def enqueue_routine_submission_event(
+async def _expire_stale_quests() -> int:
+    async with async_session() as session:
+        return await quest_service.expire_stale_quests(session)
+
+
+@celery_app.task(name="quests.expire_stale")
+def expire_stale_quests() -> int:
+    """Bulk-expire quests whose cycle has ended; scheduled by celery beat."""
+
+    expired = asyncio.run(_expire_stale_quests())
+    logger.info("Expired %d stale quests", expired)
+    return expired
+
+
+async def _archive_finished_quests() -> int:
+    async with async_session() as session:
+        return await quest_service.archive_finished_quests(
+            session, older_than=timedelta(days=settings.QUEST_ARCHIVE_AFTER_DAYS)
+        )
+
+
+@celery_app.task(name="quests.archive_history")
+def archive_finished_quests() -> int:
+    """Move old claimed/expired quests into ``user_quest_history``."""
+
+    archived = asyncio.run(_archive_finished_quests())
+    logger.info("Archived %d finished quests", archived)
+    return archived
+
+
+ROUTINE_SUBMISSION_TOPIC = "quests.routine_submission"
+
+
+def build_routine_submission_payload(
     *,
     user_id: UUID,
     submission_id: UUID,
     occurred_at: datetime | None = None,
     event_id: UUID | None = None,
-) -> str:
-    """Publish a quest submission event to the queue."""
+) -> dict[str, str]:
+    """Serialize a submission event into the task payload shape."""
 
-    payload = {
+    return {
         "event_id": str(event_id or uuid4()),
         "user_id": str(user_id),
         "submission_id": str(submission_id),
@@ -103,8 +137,46 @@ def enqueue_routine_submission_event(
             or datetime.now(timezone.utc)
         ).isoformat(),
     }
+
+
+async def publish_routine_submission_event(payload: Mapping[str, Any]) -> None:
+    """Outbox handler: hand a submission event to the quest pipeline.
+
+    In eager mode the relay already runs outside the request, so the event is
+    processed inline on the current loop instead of nesting ``asyncio.run``.
+    """
+
+    if getattr(celery_app.conf, "task_always_eager", False):
+        await _process_submission_event(payload)
+        return
+    process_routine_submission.delay(dict(payload))
+
+
+def enqueue_routine_submission_event(
+    *,
+    user_id: UUID,
+    submission_id: UUID,
+    occurred_at: datetime | None = None,
+    event_id: UUID | None = None,
+) -> str:
+    """Publish a quest submission event to the queue."""
+
+    payload = build_routine_submission_payload(
+        user_id=user_id,
+        submission_id=submission_id,
+        occurred_at=occurred_at,
+        event_id=event_id,
+    )
     process_routine_submission.delay(payload)
     return payload["event_id"]
 
 
-__all__ = ["process_routine_submission", "enqueue_routine_submission_event"]
+__all__ = [
+    "ROUTINE_SUBMISSION_TOPIC",
+    "build_routine_submission_payload",
+    "process_routine_submission",
+    "expire_stale_quests",
+    "archive_finished_quests",
+    "publish_routine_submission_event",
+    "enqueue_routine_submission_event",
+]
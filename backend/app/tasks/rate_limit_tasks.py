@@ -0,0 +1,41 @@
+"""Celery tasks that reap expired rate limit events."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+try:  # pragma: no cover - use Celery logger when available
+    from celery.utils.log import get_task_logger  # type: ignore
+except ImportError:  # pragma: no cover - fallback for environments without Celery
+    import logging
+
+    def get_task_logger(name: str):
+        return logging.getLogger(name)
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.db.session import async_session
+from app.services import rate_limiter
+
+logger = get_task_logger(__name__)
+
+
+async def _purge_events() -> int:
+    async with async_session() as session:
+        return await rate_limiter.purge_rate_limit_events(
+            session,
+            older_than=timedelta(hours=settings.RATE_LIMIT_EVENT_RETENTION_HOURS),
+        )
+
+
+@celery_app.task(name="rate_limits.purge_events")
+def purge_events() -> int:
+    """Delete rate limit events past the retention window in bounded chunks."""
+
+    removed = asyncio.run(_purge_events())
+    logger.info("Purged %d expired rate limit events", removed)
+    return removed
+
+
+__all__ = ["purge_events"]
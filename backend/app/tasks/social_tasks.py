@@ -0,0 +1,36 @@
+"""Celery tasks that maintain denormalized social data."""
+
+from __future__ import annotations
+
+import asyncio
+
+try:  # pragma: no cover - use Celery logger when available
+    from celery.utils.log import get_task_logger  # type: ignore
+except ImportError:  # pragma: no cover - fallback for environments without Celery
+    import logging
+
+    def get_task_logger(name: str):
+        return logging.getLogger(name)
+
+from app.core.celery_app import celery_app
+from app.db.session import async_session
+from app.services import social_service
+
+logger = get_task_logger(__name__)
+
+
+async def _reconcile_follow_counts() -> int:
+    async with async_session() as session:
+        return await social_service.reconcile_follow_counts(session)
+
+
+@celery_app.task(name="social.reconcile_follow_counts")
+def reconcile_follow_counts() -> int:
+    """Recompute follower/following/mutual counters that drifted from the edges."""
+
+    corrected = asyncio.run(_reconcile_follow_counts())
+    logger.info("Reconciled follow counters for %d users", corrected)
+    return corrected
+
+
+__all__ = ["reconcile_follow_counts"]
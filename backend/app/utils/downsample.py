@@ -0,0 +1,46 @@
+"""Downsampling helpers for chart series."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+
+def lttb(points: Sequence[tuple[float, float]], threshold: int) -> list[int]:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    ``points`` must be sorted by x. The first and last points are always
+    kept; each bucket in between contributes the point forming the largest
+    triangle with the previous pick and the next bucket's average, which
+    preserves peaks and troughs far better than striding.
+    """
+
+    size = len(points)
+    if threshold >= size or threshold < 3:
+        return list(range(size))
+
+    every = (size - 2) / (threshold - 2)
+    kept = [0]
+    anchor = 0
+    for bucket in range(threshold - 2):
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, size)
+        span = avg_end - avg_start
+        avg_x = sum(points[i][0] for i in range(avg_start, avg_end)) / span
+        avg_y = sum(points[i][1] for i in range(avg_start, avg_end)) / span
+
+        ax, ay = points[anchor]
+        best_area = -1.0
+        best = avg_start - 1
+        for i in range(int(bucket * every) + 1, avg_start):
+            x, y = points[i]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = i
+        kept.append(best)
+        anchor = best
+    kept.append(size - 1)
+    return kept
+
+
+__all__ = ["lttb"]
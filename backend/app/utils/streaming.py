@@ -0,0 +1,69 @@
+"""Newline-delimited JSON responses streamed from server-side cursors."""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Rows fetched per cursor round-trip; also the size of each written chunk.
+STREAM_BATCH_SIZE = 500
+
+
+def wants_ndjson(request: Request, requested: str | None = None) -> bool:
+    """True when the client asked for NDJSON via ``?format=`` or ``Accept``.
+
+    ``requested`` is the ``format`` query parameter, which wins when given.
+    """
+
+    if requested is not None:
+        return requested == "ndjson"
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _ndjson_lines(
+    session_factory: Callable[[], AsyncSession],
+    statement: Any,
+    schema: type[BaseModel],
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    # The body is sent after the request's ``get_db`` session has been closed,
+    # so the cursor gets a session of its own for exactly as long as it runs.
+    async with session_factory() as session:
+        result = await session.stream_scalars(
+            statement.execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield "".join(
+                schema.model_validate(row).model_dump_json(by_alias=True) + "\n"
+                for row in partition
+            ).encode("utf-8")
+
+
+def ndjson_response(
+    session_factory: Callable[[], AsyncSession],
+    statement: Any,
+    schema: type[BaseModel],
+    *,
+    batch_size: int = STREAM_BATCH_SIZE,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Stream ``statement``'s rows as one ``schema`` JSON document per line.
+
+    Rows are read in ``batch_size`` partitions, so neither the result list nor
+    its serialized form is ever held in memory as a whole. ``session_factory``
+    is normally the ``get_session_factory`` dependency.
+    """
+
+    return StreamingResponse(
+        _ndjson_lines(session_factory, statement, schema, batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+__all__ = ["NDJSON_MEDIA_TYPE", "ndjson_response", "wants_ndjson"]
@@ -0,0 +1,129 @@
+"""Benchmark the database rate limit check with and without inline cleanup.
+
+Copies the ``rate_limit_events`` table definition into a scratch schema,
+fills it with ``--events`` synthetic rows (2,000,000 by default, most of
+them past any window) spread over ``--users`` users and a few actions, and
+times one check as the request path used to run it (count, insert and the
+per-action ``DELETE`` of expired rows) against the current check (count and
+insert only). Each sample runs in its own transaction that is rolled back,
+so the table stays the same between samples; the inline variant therefore
+pays for a full backlog of expired rows every time, as a check did whenever
+an action had been idle for a while. The scratch schema is dropped
+afterwards unless ``--keep`` is given.
+
+Usage:
+    python -m scripts.benchmark_rate_limiter [--events N] [--users U] [--repeat R] [--keep]
+
+Environment:
+    - DATABASE_URL must point at a PostgreSQL database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from statistics import median
+from typing import Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from scripts.quest_table_report import make_sync_engine
+
+SCHEMA = "rate_limit_bench"
+ACTIONS = ("score_submit", "user_search", "routine_submit")
+
+SEED_SQL = f"""
+INSERT INTO {SCHEMA}.rate_limit_events (user_id, action, occurred_at)
+SELECT md5((i % :users)::text)::uuid,
+       (ARRAY['score_submit', 'user_search', 'routine_submit'])[1 + i % 3],
+       now() - (i % 172800) * interval '1 second'
+FROM generate_series(1, :count) AS i
+"""
+
+COUNT_SQL = f"""
+SELECT count(*) FROM {SCHEMA}.rate_limit_events
+WHERE user_id = :user_id AND action = :action
+  AND occurred_at >= now() - interval '1 minute'
+"""
+
+INSERT_SQL = f"""
+INSERT INTO {SCHEMA}.rate_limit_events (user_id, action, occurred_at)
+VALUES (:user_id, :action, now())
+"""
+
+CLEANUP_SQL = f"""
+DELETE FROM {SCHEMA}.rate_limit_events
+WHERE occurred_at < now() - interval '6 minutes' AND action = :action
+"""
+
+
+def seed(conn: Connection, count: int, users: int) -> None:
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(
+        text(
+            f"CREATE TABLE {SCHEMA}.rate_limit_events "
+            "(LIKE public.rate_limit_events INCLUDING DEFAULTS INCLUDING INDEXES)"
+        )
+    )
+    started = time.perf_counter()
+    conn.execute(text(SEED_SQL), {"count": count, "users": users})
+    conn.execute(text(f"ANALYZE {SCHEMA}.rate_limit_events"))
+    print(f"seeded {count} events in {time.perf_counter() - started:.1f}s")
+
+
+def _timed(engine: Engine, statements: Sequence[str], repeat: int) -> float:
+    samples = []
+    for index in range(repeat):
+        params = {
+            "user_id": f"{index:032x}",
+            "action": ACTIONS[index % len(ACTIONS)],
+        }
+        with engine.connect() as conn:
+            transaction = conn.begin()
+            started = time.perf_counter()
+            for statement in statements:
+                conn.execute(text(statement), params)
+            samples.append((time.perf_counter() - started) * 1000)
+            transaction.rollback()
+    return median(samples)
+
+
+def run(engine: Engine, repeat: int) -> None:
+    inline_ms = _timed(engine, [COUNT_SQL, INSERT_SQL, CLEANUP_SQL], repeat)
+    current_ms = _timed(engine, [COUNT_SQL, INSERT_SQL], repeat)
+    print(f"{'check':<24}{'median ms':>12}")
+    print(f"{'inline cleanup':<24}{inline_ms:>12.2f}")
+    print(f"{'count + insert':<24}{current_ms:>12.2f}")
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the rate limit check.")
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--keep", action="store_true", help="Leave the scratch schema in place"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv or sys.argv[1:])
+    engine = make_sync_engine()
+    try:
+        with engine.begin() as conn:
+            seed(conn, args.events, args.users)
+        run(engine, args.repeat)
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+"""Benchmark the user lookup query against a synthetic population.
+
+Copies the ``users`` table definition into a scratch schema, fills it with
+``--users`` synthetic rows (1,000,000 by default), builds the pg_trgm
+indexes and times the legacy ``lower(...) LIKE`` + exact ``count(*)`` pair
+against the current ranked search with its capped count. The plan of the
+ranked query is printed for each term. The scratch schema is dropped
+afterwards unless ``--keep`` is given.
+
+Usage:
+    python -m scripts.benchmark_user_search [--users N] [--repeat R] [--keep]
+
+Environment:
+    - DATABASE_URL must point at a PostgreSQL database where the pg_trgm
+      extension can be created.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from statistics import median
+from typing import Any, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+import app.db.base  # noqa: F401 - ensure all model mappers are configured
+from app.services.social_service import _search_statements
+from scripts.quest_table_report import make_sync_engine
+
+SCHEMA = "user_search_bench"
+TERMS = ("a", "jo", "lift", "user12345", "zzzz")
+PAGE_SIZE = 20
+
+SEED_SQL = f"""
+INSERT INTO {SCHEMA}.users
+    (id, username, email, hashed_password, display_name, is_active,
+     energy, preferred_unit, weight_multiplier)
+SELECT md5(i::text)::uuid,
+       'user' || i,
+       'user' || i || '@bench.invalid',
+       'x',
+       CASE WHEN i % 3 = 0 THEN initcap(md5(i::text)) END,
+       i % 50 <> 0,
+       0,
+       'kg',
+       1.0
+FROM generate_series(1, :count) AS i
+"""
+
+LEGACY_SQL = f"""
+SELECT id FROM {SCHEMA}.users
+WHERE is_active AND (lower(username) LIKE :pattern
+                     OR lower(coalesce(display_name, '')) LIKE :pattern)
+ORDER BY lower(username) LIMIT {PAGE_SIZE};
+SELECT count(*) FROM {SCHEMA}.users
+WHERE is_active AND (lower(username) LIKE :pattern
+                     OR lower(coalesce(display_name, '')) LIKE :pattern)
+"""
+
+
+def _timed(conn: Connection, statements: Sequence[Any], repeat: int, **params) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for statement in statements:
+            conn.execute(statement, params).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return median(samples)
+
+
+def _explain(conn: Connection, statement: Any) -> list[str]:
+    compiled = statement.compile(dialect=conn.dialect)
+    plan = conn.exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS) {compiled}", compiled.params
+    )
+    return [line for (line,) in plan]
+
+
+def seed(conn: Connection, count: int) -> None:
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn.execute(
+        text(f"CREATE TABLE {SCHEMA}.users (LIKE public.users INCLUDING DEFAULTS)")
+    )
+    started = time.perf_counter()
+    conn.execute(text(SEED_SQL), {"count": count})
+    conn.execute(
+        text(
+            f"CREATE INDEX ON {SCHEMA}.users USING gin (lower(username) gin_trgm_ops)"
+        )
+    )
+    conn.execute(
+        text(
+            f"CREATE INDEX ON {SCHEMA}.users "
+            "USING gin (lower(coalesce(display_name, '')) gin_trgm_ops)"
+        )
+    )
+    conn.execute(text(f"ANALYZE {SCHEMA}.users"))
+    print(f"seeded {count} users in {time.perf_counter() - started:.1f}s")
+
+
+def run(conn: Connection, repeat: int) -> None:
+    conn.execute(text(f"SET search_path TO {SCHEMA}, public"))
+    legacy = [text(statement) for statement in LEGACY_SQL.split(";")]
+    print(f"{'term':<12}{'legacy ms':>12}{'ranked ms':>12}")
+    for term in TERMS:
+        page, count = _search_statements(term.lower(), None, offset=0, limit=PAGE_SIZE)
+        legacy_ms = _timed(conn, legacy, repeat, pattern=f"%{term.lower()}%")
+        ranked_ms = _timed(conn, [page, count], repeat)
+        print(f"{term:<12}{legacy_ms:>12.2f}{ranked_ms:>12.2f}")
+        for line in _explain(conn, page):
+            print(f"    {line}")
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the user lookup query.")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--keep", action="store_true", help="Leave the scratch schema in place"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv or sys.argv[1:])
+    engine = make_sync_engine()
+    try:
+        with engine.begin() as conn:
+            seed(conn, args.users)
+        with engine.connect() as conn:
+            run(conn, args.repeat)
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
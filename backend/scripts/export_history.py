@@ -0,0 +1,75 @@
+"""Export training history to chunked CSV/Parquet files.
+
+Streams scores, routine submissions (and their scenario rows), energy
+history and XP events through server-side cursors into
+``EXPORT_STORAGE_DIR/<export_id>/`` and prints progress as it goes.
+
+Usage:
+    python -m scripts.export_history [--user-id UUID] [--format csv|parquet]
+                                     [--chunk-rows N] [--tables scores,xp_events]
+
+Environment:
+    - DATABASE_URL must be set (defaults to the app's env configuration).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import Sequence
+from uuid import UUID
+
+import app.db.base  # noqa: F401 - ensure all model mappers are configured
+from app.core.config import settings
+from app.db.session import async_session
+from app.services.export_service import (
+    EXPORT_TABLES,
+    ExportFormat,
+    ExportProgress,
+    export_history,
+)
+
+
+def _print_progress(progress: ExportProgress) -> None:
+    print(f"{progress.table}: {progress.rows} rows in {progress.files} file(s)", flush=True)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        manifest = await export_history(
+            session,
+            user_id=args.user_id,
+            fmt=ExportFormat(args.format),
+            chunk_rows=args.chunk_rows,
+            tables=args.tables,
+            progress=_print_progress,
+        )
+    print(f"export {manifest.export_id} written to {manifest.directory}")
+    return 0
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export training history.")
+    parser.add_argument("--user-id", type=UUID, default=None, help="Export a single user")
+    parser.add_argument(
+        "--format",
+        choices=[fmt.value for fmt in ExportFormat],
+        default=ExportFormat.CSV.value,
+    )
+    parser.add_argument("--chunk-rows", type=int, default=settings.EXPORT_CHUNK_ROWS)
+    parser.add_argument(
+        "--tables",
+        type=lambda raw: [name.strip() for name in raw.split(",") if name.strip()],
+        default=None,
+        help=f"Comma-separated subset of: {', '.join(EXPORT_TABLES)}",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    return asyncio.run(_run(parse_args(argv or sys.argv[1:])))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Report user_quests size and the hot-read query plan, optionally around an archive run.
+
+Prints row counts for ``user_quests``/``user_quest_history`` and
+``EXPLAIN (ANALYZE, BUFFERS)`` for the ``GET /quests/me`` read of the user
+with the most quests. With ``--archive`` the archival job runs in between so
+the before/after numbers can be compared directly.
+
+Usage:
+    python -m scripts.quest_table_report [--archive] [--older-than-days N]
+
+Environment:
+    - DATABASE_URL must be set (defaults to the app's env configuration).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL, Connection, Engine, make_url
+
+import app.db.base  # noqa: F401 - ensure all model mappers are configured
+from app.core.config import settings
+from app.db.session import async_session
+from app.services.quest_service import RECENT_CYCLE_WINDOW, archive_finished_quests
+
+HOT_READ_SQL = """
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM user_quests
+WHERE user_id = :user_id
+  AND (cycle_end IS NULL OR cycle_end > :recent_cutoff)
+ORDER BY available_from DESC, created_at DESC
+"""
+
+
+def make_sync_engine() -> Engine:
+    url: URL = make_url(str(settings.DATABASE_URL))
+    if "+asyncpg" in url.drivername:
+        url = url.set(drivername=url.drivername.replace("+asyncpg", ""))
+    return create_engine(url, future=True)
+
+
+def report(conn: Connection, label: str) -> None:
+    live = conn.execute(text("SELECT count(*) FROM user_quests")).scalar_one()
+    archived = conn.execute(text("SELECT count(*) FROM user_quest_history")).scalar_one()
+    print(f"== {label}")
+    print(f"user_quests rows:        {live}")
+    print(f"user_quest_history rows: {archived}")
+
+    heaviest = conn.execute(
+        text(
+            "SELECT user_id FROM user_quests GROUP BY user_id "
+            "ORDER BY count(*) DESC LIMIT 1"
+        )
+    ).scalar_one_or_none()
+    if heaviest is None:
+        print("(no quests to plan)")
+        return
+    recent_cutoff = datetime.now(timezone.utc) - RECENT_CYCLE_WINDOW
+    plan = conn.execute(
+        text(HOT_READ_SQL), {"user_id": heaviest, "recent_cutoff": recent_cutoff}
+    )
+    print(f"plan for user {heaviest}:")
+    for (line,) in plan:
+        print(f"  {line}")
+
+
+async def _archive(older_than: timedelta) -> int:
+    async with async_session() as session:
+        return await archive_finished_quests(session, older_than=older_than)
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report quest table size and read plan.")
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Run the archival job and report again afterwards",
+    )
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.QUEST_ARCHIVE_AFTER_DAYS,
+        help="Archive claimed/expired quests whose cycle ended this many days ago",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv or sys.argv[1:])
+    engine = make_sync_engine()
+    try:
+        with engine.connect() as conn:
+            report(conn, "before")
+        if args.archive:
+            moved = asyncio.run(_archive(timedelta(days=args.older_than_days)))
+            print(f"archived {moved} quests")
+            with engine.connect() as conn:
+                report(conn, "after")
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
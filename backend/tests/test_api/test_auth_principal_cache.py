@@ -0,0 +1,110 @@
+# backend/tests/test_api/test_auth_principal_cache.py
+
+import asyncio
+from uuid import uuid4
+
+from tests.test_support.app_setup import (
+    api_client,
+    setup_test_app,
+    teardown_test_app,
+)
+from tests.test_support.queries import query_counter
+from app.core.security import create_access_token
+from app.models.hidden_routine import HiddenRoutine
+from app.models.personal_best_event import PersonalBestEvent
+from app.models.training_volume import WeeklyTrainingVolume
+from app.models.user import User
+from app.schemas.user import UserUpdate
+from app.services.principal_cache import principal_cache
+from app.services.user_service import update_user
+
+
+def test_principal_is_cached_until_the_user_is_updated() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(
+            [User.__table__, PersonalBestEvent.__table__]
+        )
+        principal_cache.clear()
+        try:
+            async with session_maker() as session:
+                user = User(
+                    id=uuid4(),
+                    username="cached",
+                    email="cached@example.com",
+                    hashed_password="hashed",
+                )
+                session.add(user)
+                await session.commit()
+
+            url = f"/api/v1/personal_best_events/user/{user.id}"
+            headers = {
+                "Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"
+            }
+
+            def user_selects(stats) -> int:
+                return sum("FROM users" in sql for sql in stats["statements"])
+
+            async with api_client() as client:
+                with query_counter(engine) as first:
+                    assert (await client.get(url, headers=headers)).status_code == 200
+                with query_counter(engine) as second:
+                    assert (await client.get(url, headers=headers)).status_code == 200
+                assert (user_selects(first), user_selects(second)) == (1, 0)
+                assert principal_cache.get(user.id).subscription_level == "free"
+
+                async with session_maker() as session:
+                    stored = await session.get(User, user.id)
+                    await update_user(
+                        session, stored, UserUpdate(subscription_level="gold")
+                    )
+                assert principal_cache.get(user.id) is None
+
+                with query_counter(engine) as third:
+                    assert (await client.get(url, headers=headers)).status_code == 200
+                assert user_selects(third) == 1
+                assert principal_cache.get(user.id).subscription_level == "gold"
+
+                bad = {"Authorization": "Bearer not-a-token"}
+                assert (await client.get(url, headers=bad)).status_code == 401
+        finally:
+            principal_cache.clear()
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_read_only_user_routes_use_the_cached_principal() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(
+            [User.__table__, HiddenRoutine.__table__, WeeklyTrainingVolume.__table__]
+        )
+        principal_cache.clear()
+        try:
+            async with session_maker() as session:
+                user = User(
+                    id=uuid4(),
+                    username="reader",
+                    email="reader@example.com",
+                    hashed_password="hashed",
+                )
+                session.add(user)
+                await session.commit()
+
+            headers = {
+                "Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"
+            }
+            urls = [
+                "/api/v1/users/me/hidden-routines",
+                f"/api/v1/users/{user.id}/training-volume",
+            ]
+            async with api_client() as client:
+                await client.get(urls[0], headers=headers)
+                with query_counter(engine) as stats:
+                    for url in urls:
+                        assert (await client.get(url, headers=headers)).status_code == 200
+            assert not any("FROM users" in sql for sql in stats["statements"])
+        finally:
+            principal_cache.clear()
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
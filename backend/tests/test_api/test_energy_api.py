@@ -0,0 +1,185 @@
+# backend/tests/test_api/test_energy_api.py
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from tests.test_support.app_setup import (
+    api_client,
+    setup_test_app,
+    teardown_test_app,
+)
+from app.models.energy_history import EnergyHistory
+from app.models.energy_rollup import DailyEnergyRollup
+from app.models.rank_histogram import RankHistogramBucket
+from app.models.user import User
+from app.services.energy_service import record_energy
+
+
+def _tables():
+    return [
+        User.__table__,
+        EnergyHistory.__table__,
+        DailyEnergyRollup.__table__,
+        RankHistogramBucket.__table__,
+    ]
+
+
+async def _create_user(session_maker) -> User:
+    async with session_maker() as session:
+        user = User(
+            id=uuid4(),
+            username="charger",
+            email="charger@example.com",
+            hashed_password="hashed",
+        )
+        session.add(user)
+        await session.commit()
+    return user
+
+
+def test_energy_series_reads_daily_rollups() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_tables())
+        # Monday 2025-03-03.
+        start = datetime(2025, 3, 3, 9, tzinfo=timezone.utc)
+        try:
+            user = await _create_user(session_maker)
+            async with session_maker() as session:
+                for day in range(14):
+                    for hour, energy in ((0, 100.0 + day * 10), (5, 95.0 + day * 10)):
+                        await record_energy(
+                            session,
+                            user.id,
+                            energy,
+                            recorded_at=start + timedelta(days=day, hours=hour),
+                        )
+                await session.commit()
+
+                rollups = (
+                    await session.execute(
+                        select(DailyEnergyRollup).order_by(DailyEnergyRollup.day)
+                    )
+                ).scalars().all()
+                assert len(rollups) == 14
+                assert (rollups[0].min_energy, rollups[0].max_energy) == (95.0, 100.0)
+                assert rollups[0].last_energy == 95.0
+                assert rollups[0].sample_count == 2
+
+            url = f"/api/v1/energy/series/{user.id}"
+            async with api_client() as client:
+                daily = await client.get(url)
+                weekly = await client.get(url, params={"resolution": "week"})
+                thinned = await client.get(url, params={"points": 5})
+                by_day = await client.get(f"/api/v1/energy/daily/{user.id}")
+
+            assert daily.status_code == 200
+            assert len(daily.json()["points"]) == 14
+
+            weeks = weekly.json()["points"]
+            assert [point["energy"] for point in weeks] == [160.0, 230.0]
+            assert [point["min_energy"] for point in weeks] == [95.0, 165.0]
+            assert [point["samples"] for point in weeks] == [14, 14]
+            assert weeks[1]["period_start"].startswith("2025-03-10")
+
+            points = thinned.json()["points"]
+            assert len(points) == 5
+            assert points[0] == daily.json()["points"][0]
+            assert points[-1] == daily.json()["points"][-1]
+
+            assert by_day.json()[0] == {"date": "2025-03-03", "total_energy": 100.0}
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_submit_energy_skips_unchanged_values_in_window() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_tables())
+        try:
+            user = await _create_user(session_maker)
+            async with api_client() as client:
+                responses = [
+                    await client.post(
+                        "/api/v1/energy/submit",
+                        json={"user_id": str(user.id), "energy": energy, "rank": rank},
+                    )
+                    for energy, rank in [
+                        (420.0, "Gold"),
+                        (420.0, "Gold"),
+                        (510.0, "Platinum"),
+                        (510.0, "Platinum"),
+                    ]
+                ]
+                missing = await client.post(
+                    "/api/v1/energy/submit",
+                    json={"user_id": str(uuid4()), "energy": 1.0, "rank": "Iron"},
+                )
+
+            assert [r.json()["recorded"] for r in responses] == [True, False, True, False]
+            assert missing.status_code == 404
+
+            async with session_maker() as session:
+                history = (
+                    await session.execute(
+                        select(EnergyHistory.energy).order_by(EnergyHistory.created_at)
+                    )
+                ).scalars().all()
+                assert history == [420.0, 510.0]
+                rollup = (await session.execute(select(DailyEnergyRollup))).scalar_one()
+                assert rollup.sample_count == 2
+                stored = await session.get(User, user.id)
+                assert (stored.energy, stored.rank) == (510.0, "Platinum")
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_energy_distribution_and_percentile_follow_submissions() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_tables())
+        try:
+            async with session_maker() as session:
+                user_ids = [uuid4() for _ in range(4)]
+                for index, user_id in enumerate(user_ids):
+                    session.add(
+                        User(
+                            id=user_id,
+                            username=f"tier{index}",
+                            email=f"tier{index}@example.com",
+                            hashed_password="hashed",
+                            energy=0.0,
+                        )
+                    )
+                await session.commit()
+
+            async with api_client() as client:
+                for user_id, energy in zip(user_ids, (150.0, 250.0, 420.0, 480.0)):
+                    await client.post(
+                        "/api/v1/energy/submit",
+                        json={"user_id": str(user_id), "energy": energy, "rank": "x"},
+                    )
+                # Moving from Bronze to Silver shifts one entry between tiers.
+                await client.post(
+                    "/api/v1/energy/submit",
+                    json={"user_id": str(user_ids[1]), "energy": 310.0, "rank": "x"},
+                )
+                distribution = await client.get("/api/v1/energy/distribution")
+                percentile = await client.get(f"/api/v1/energy/percentile/{user_ids[2]}")
+
+            body = distribution.json()
+            assert body["total"] == 4
+            assert body["tiers"] == [
+                {"rank": "Iron", "count": 1},
+                {"rank": "Silver", "count": 1},
+                {"rank": "Gold", "count": 2},
+            ]
+            assert percentile.json() == {"value": 420.0, "percentile": 62.5, "total": 4}
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
@@ -0,0 +1,190 @@
+# backend/tests/test_api/test_feed_api.py
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import func, select
+
+from tests.test_support.app_setup import (
+    api_client,
+    setup_test_app,
+    teardown_test_app,
+)
+from app.api.v1.auth import get_current_principal
+from app.core.config import settings
+from app.main import app
+from app.models.feed import FeedInbox, FeedItem
+from app.models.social import SocialEdge
+from app.models.user import User
+from app.services import feed_service
+from app.services.feed_service import FeedItemKind
+
+
+def _tables():
+    return [
+        User.__table__,
+        SocialEdge.__table__,
+        FeedItem.__table__,
+        FeedInbox.__table__,
+    ]
+
+
+def test_feed_merges_inbox_with_pulled_celebrity_items() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_tables())
+        previous_threshold = settings.FEED_FANOUT_MAX_FOLLOWERS
+        settings.FEED_FANOUT_MAX_FOLLOWERS = 1
+        start = datetime(2025, 4, 1, 12, tzinfo=timezone.utc)
+        try:
+            async with session_maker() as session:
+                users = {
+                    name: User(
+                        id=uuid4(),
+                        username=name,
+                        email=f"{name}@example.com",
+                        hashed_password="hashed",
+                    )
+                    for name in ("viewer", "friend", "celeb", "fan", "stranger")
+                }
+                session.add_all(users.values())
+                for follower, followee in (
+                    ("viewer", "friend"),
+                    ("viewer", "celeb"),
+                    ("fan", "celeb"),
+                ):
+                    session.add(
+                        SocialEdge(
+                            follower_id=users[follower].id,
+                            followee_id=users[followee].id,
+                            status="active",
+                        )
+                    )
+                users["friend"].follower_count = 1
+                users["celeb"].follower_count = 2
+                await session.commit()
+
+                items = []
+                for minute, author in enumerate(
+                    ["friend", "celeb", "stranger", "friend", "celeb"]
+                ):
+                    items.append(
+                        feed_service.add_feed_item(
+                            session,
+                            actor_id=users[author].id,
+                            kind=FeedItemKind.WORKOUT,
+                            source_id=minute,
+                            summary={"title": f"{author} {minute}"},
+                            occurred_at=start + timedelta(minutes=minute),
+                        )
+                    )
+                await session.commit()
+                written = [await feed_service.fan_out_item(session, item.id) for item in items]
+                # Only the friend's items are pushed; the celebrity's are pulled.
+                assert written == [1, 0, 0, 1, 0]
+                assert await feed_service.fan_out_item(session, items[0].id) == 0
+
+            app.dependency_overrides[get_current_principal] = lambda: users["viewer"]
+            async with api_client() as client:
+                first = await client.get("/api/v1/feed", params={"limit": 3})
+                second = await client.get(
+                    "/api/v1/feed",
+                    params={"limit": 3, "cursor": first.headers["X-Next-Cursor"]},
+                )
+
+            assert first.status_code == 200
+            assert [entry["summary"]["title"] for entry in first.json()] == [
+                "celeb 4",
+                "friend 3",
+                "celeb 1",
+            ]
+            assert first.json()[0]["actor"]["username"] == "celeb"
+            assert [entry["summary"]["title"] for entry in second.json()] == ["friend 0"]
+            assert "X-Next-Cursor" not in second.headers
+
+            async with session_maker() as session:
+                assert await feed_service.trim_inboxes(session, max_items=1) == 1
+                remaining = (
+                    await session.execute(select(func.count()).select_from(FeedInbox))
+                ).scalar_one()
+                assert remaining == 1
+
+                await feed_service.remove_actor_from_inbox(
+                    session, users["viewer"].id, users["friend"].id
+                )
+                await session.commit()
+                remaining = (
+                    await session.execute(select(func.count()).select_from(FeedInbox))
+                ).scalar_one()
+                assert remaining == 0
+        finally:
+            settings.FEED_FANOUT_MAX_FOLLOWERS = previous_threshold
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_feed_pages_stay_full_past_deactivated_authors() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_tables())
+        start = datetime(2025, 4, 1, 12, tzinfo=timezone.utc)
+        try:
+            async with session_maker() as session:
+                users = {
+                    name: User(
+                        id=uuid4(),
+                        username=name,
+                        email=f"{name}@example.com",
+                        hashed_password="hashed",
+                    )
+                    for name in ("viewer", "friend", "gone")
+                }
+                session.add_all(users.values())
+                for followee in ("friend", "gone"):
+                    session.add(
+                        SocialEdge(
+                            follower_id=users["viewer"].id,
+                            followee_id=users[followee].id,
+                            status="active",
+                        )
+                    )
+                await session.commit()
+
+                items = [
+                    feed_service.add_feed_item(
+                        session,
+                        actor_id=users[author].id,
+                        kind=FeedItemKind.WORKOUT,
+                        source_id=minute,
+                        summary={"title": f"{author} {minute}"},
+                        occurred_at=start + timedelta(minutes=minute),
+                    )
+                    for minute, author in enumerate(
+                        ["friend", "friend", "friend", "gone", "gone"]
+                    )
+                ]
+                await session.commit()
+                for item in items:
+                    await feed_service.fan_out_item(session, item.id)
+                users["gone"].is_active = False
+                await session.commit()
+
+            app.dependency_overrides[get_current_principal] = lambda: users["viewer"]
+            async with api_client() as client:
+                first = await client.get("/api/v1/feed", params={"limit": 2})
+                second = await client.get(
+                    "/api/v1/feed",
+                    params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+                )
+
+            # The two newest inbox items belong to the deactivated account.
+            assert [entry["summary"]["title"] for entry in first.json()] == [
+                "friend 2",
+                "friend 1",
+            ]
+            assert [entry["summary"]["title"] for entry in second.json()] == ["friend 0"]
+            assert "X-Next-Cursor" not in second.headers
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
@@ -4,14 +4,24 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+from sqlalchemy import select
+
 from tests.test_support.app_setup import (
     api_client,
     setup_test_app,
     teardown_test_app,
 )
+from app.api.v1.auth import get_current_principal
+from app.main import app
+from app.models.period_score_best import PeriodScoreBest
 from app.models.scenario import Scenario
 from app.models.score import Score
+from app.models.social import SocialEdge
 from app.models.user import User
+from app.services.leaderboard_service import (
+    purge_expired_periods,
+    record_period_bests,
+)
 
 
 def test_energy_leaderboard_pagination() -> None:
@@ -156,3 +166,179 @@ def test_score_leaderboard_pagination() -> None:
             await teardown_test_app(engine)
 
     asyncio.run(run_test())
+
+
+def test_following_leaderboards_use_social_graph_with_cursors() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(
+            [Scenario.__table__, User.__table__, Score.__table__, SocialEdge.__table__]
+        )
+        try:
+            now = datetime.now(timezone.utc)
+            scenario_id = "deadlift"
+            async with session_maker() as session:
+                session.add(Scenario(id=scenario_id, name="Deadlift", description="Test"))
+                users: dict[str, User] = {}
+                for username, energy in [
+                    ("me", 300.0),
+                    ("pal", 500.0),
+                    ("buddy", 400.0),
+                    ("muted", 900.0),
+                    ("stranger", 1000.0),
+                ]:
+                    user = User(
+                        id=uuid4(),
+                        username=username,
+                        email=f"{username}@example.com",
+                        hashed_password="hashed",
+                        is_active=True,
+                        energy=energy,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    session.add(user)
+                    users[username] = user
+                await session.flush()
+
+                for followee, status in [("pal", "active"), ("buddy", "active"), ("muted", "pending")]:
+                    session.add(
+                        SocialEdge(
+                            follower_id=users["me"].id,
+                            followee_id=users[followee].id,
+                            status=status,
+                        )
+                    )
+                for username, value, minutes in [
+                    ("me", 150.0, 0),
+                    ("pal", 180.0, 1),
+                    ("pal", 200.0, 2),
+                    ("pal", 200.0, 3),
+                    ("buddy", 170.0, 4),
+                    ("muted", 300.0, 5),
+                    ("stranger", 400.0, 6),
+                ]:
+                    session.add(
+                        Score(
+                            user_id=users[username].id,
+                            scenario_id=scenario_id,
+                            weight_lifted=value,
+                            score_value=value,
+                            created_at=now + timedelta(minutes=minutes),
+                        )
+                    )
+                await session.commit()
+
+            app.dependency_overrides[get_current_principal] = lambda: users["me"]
+            url = f"/api/v1/scores/scenario/{scenario_id}/leaderboard/following"
+            async with api_client() as client:
+                first = await client.get(url, params={"limit": 2})
+                second = await client.get(
+                    url, params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]}
+                )
+                energy_first = await client.get(
+                    "/api/v1/energy/leaderboard/following", params={"limit": 2}
+                )
+                energy_second = await client.get(
+                    "/api/v1/energy/leaderboard/following",
+                    params={"limit": 2, "cursor": energy_first.headers["X-Next-Cursor"]},
+                )
+
+            assert [
+                (item["user"]["username"], item["score_value"]) for item in first.json()
+            ] == [("pal", 200.0), ("buddy", 170.0)]
+            assert [
+                (item["user"]["username"], item["score_value"]) for item in second.json()
+            ] == [("me", 150.0)]
+            assert "X-Next-Cursor" not in second.headers
+
+            assert [
+                (entry["username"], entry["rank"]) for entry in energy_first.json()
+            ] == [("pal", 1), ("buddy", 2)]
+            assert [
+                (entry["username"], entry["rank"]) for entry in energy_second.json()
+            ] == [("me", 3)]
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_windowed_leaderboards_read_period_rollups() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(
+            [Scenario.__table__, User.__table__, Score.__table__, PeriodScoreBest.__table__]
+        )
+        try:
+            now = datetime.now(timezone.utc)
+            week_start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+                days=now.weekday()
+            )
+            scenario_id = "squat"
+            async with session_maker() as session:
+                session.add(Scenario(id=scenario_id, name="Squat", description="Test"))
+                users: dict[str, User] = {}
+                for username in ("oscar", "papa", "quebec"):
+                    user = User(
+                        id=uuid4(),
+                        username=username,
+                        email=f"{username}@example.com",
+                        hashed_password="hashed",
+                        is_active=True,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    session.add(user)
+                    users[username] = user
+                await session.flush()
+
+                for username, value, created_at in [
+                    # All-time best, but set long before this week and month.
+                    ("oscar", 250.0, now - timedelta(days=400)),
+                    ("oscar", 150.0, week_start + timedelta(minutes=1)),
+                    ("papa", 180.0, week_start + timedelta(minutes=2)),
+                    ("papa", 170.0, week_start + timedelta(minutes=3)),
+                    ("quebec", 200.0, week_start - timedelta(days=40)),
+                ]:
+                    score = Score(
+                        user_id=users[username].id,
+                        scenario_id=scenario_id,
+                        weight_lifted=value,
+                        score_value=value,
+                        created_at=created_at,
+                    )
+                    session.add(score)
+                    await session.flush()
+                    await record_period_bests(session, score)
+                await session.commit()
+
+            url = f"/api/v1/scores/scenario/{scenario_id}/leaderboard"
+            async with api_client() as client:
+                all_time = await client.get(url)
+                weekly = await client.get(url, params={"window": "week"})
+
+            assert [item["user"]["username"] for item in all_time.json()] == [
+                "oscar",
+                "quebec",
+                "papa",
+            ]
+            assert [
+                (item["user"]["username"], item["score_value"]) for item in weekly.json()
+            ] == [("papa", 180.0), ("oscar", 150.0)]
+
+            async with session_maker() as session:
+                removed = await purge_expired_periods(
+                    session, older_than=timedelta(days=365), now=now
+                )
+                assert removed == 2
+                remaining = (
+                    await session.execute(
+                        select(PeriodScoreBest.user_id).where(
+                            PeriodScoreBest.user_id == users["oscar"].id
+                        )
+                    )
+                ).scalars().all()
+                assert len(remaining) == 2
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
@@ -6,7 +6,7 @@ from typing import Callable
 from uuid import UUID, uuid4
 
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, func, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -18,7 +18,7 @@ os.environ.setdefault("REVENUECAT_WEBHOOK_AUTH_TOKEN", "token")
 os.environ.setdefault("STRIPE_SECRET_KEY", "sk_test")
 os.environ.setdefault("STRIPE_WEBHOOK_SECRET", "whsec_test")
 
-from app.api.v1.auth import get_current_user  # noqa: E402
+from app.api.v1.auth import get_current_principal  # noqa: E402
 from app.api.v1.deps import get_db  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models.quest import (  # noqa: E402
@@ -27,14 +27,19 @@ from app.models.quest import (  # noqa: E402
     QuestStatus,
     QuestTemplate,
     UserQuest,
+    UserQuestHistory,
 )
 from app.models.daily_workout_aggregate import DailyWorkoutAggregate  # noqa: E402
 from app.models.routine_submission import RoutineSubmission  # noqa: E402
 from app.models.user import User  # noqa: E402
+from app.models.user_activity_summary import UserActivitySummary  # noqa: E402
 from app.models.user_xp import UserXP  # noqa: E402
 from app.models.xp_event import XPEvent  # noqa: E402
 from app.services.quest_service import (  # noqa: E402
+    archive_finished_quests,
     claim_user_quest,
+    expire_stale_quests,
+    get_user_quest_history,
     get_user_quests,
     process_routine_submission_event,
 )
@@ -94,7 +99,9 @@ async def _setup_test_app() -> tuple[SessionFactory, Engine]:
     UserXP.__table__.create(bind=engine)
     QuestTemplate.__table__.create(bind=engine)
     UserQuest.__table__.create(bind=engine)
+    UserQuestHistory.__table__.create(bind=engine)
     DailyWorkoutAggregate.__table__.create(bind=engine)
+    UserActivitySummary.__table__.create(bind=engine)
     RoutineSubmission.__table__.create(bind=engine)
 
     sync_maker = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
@@ -156,7 +163,7 @@ async def _set_current_user(user: AuthUser) -> None:
     async def override_current_user() -> AuthUser:
         return user
 
-    app.dependency_overrides[get_current_user] = override_current_user
+    app.dependency_overrides[get_current_principal] = override_current_user
 
 
 async def _teardown(engine: Engine) -> None:
@@ -404,6 +411,154 @@ def test_weekly_quest_requires_three_distinct_days() -> None:
     asyncio.run(run_test())
 
 
+def test_daily_aggregate_upsert_and_limited_quest_from_aggregates() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        start = datetime(2025, 4, 7, 12, tzinfo=timezone.utc)
+        try:
+            user = await _create_user(session_maker, "emery")
+            await _create_template(
+                session_maker,
+                code="limited_total_minutes",
+                cadence=QuestCadence.LIMITED,
+                metric=QuestMetric.ACTIVE_MINUTES,
+                target_value=500,
+                reward_xp=50,
+                auto_claim=False,
+                available_from=start,
+            )
+            async with session_maker() as session:
+                # Same day as the window start, but before it: not counted.
+                await _record_workout(
+                    session,
+                    user.id,
+                    duration_minutes=40,
+                    completed_at=start - timedelta(hours=2),
+                )
+                await _record_workout(
+                    session, user.id, duration_minutes=25, completed_at=start
+                )
+                await _record_workout(
+                    session,
+                    user.id,
+                    duration_minutes=15,
+                    completed_at=start + timedelta(hours=1),
+                )
+                await _record_workout(
+                    session,
+                    user.id,
+                    duration_minutes=50,
+                    completed_at=start + timedelta(days=1),
+                )
+
+                aggregate = await session.scalar(
+                    select(DailyWorkoutAggregate).where(
+                        DailyWorkoutAggregate.user_id == user.id,
+                        DailyWorkoutAggregate.day
+                        == datetime(2025, 4, 7, tzinfo=timezone.utc),
+                    )
+                )
+                assert aggregate.workout_count == 3
+                assert aggregate.total_minutes == 80
+                assert aggregate.longest_session_minutes == 40
+                assert aggregate.qualified_30
+
+                quests = await get_user_quests(
+                    session, user.id, now=start + timedelta(days=1)
+                )
+                assert quests[0].progress_value == 25 + 15 + 50
+
+                # Redelivering an event must not count the submission twice.
+                submission_id = await session.scalar(
+                    select(RoutineSubmission.id).where(
+                        RoutineSubmission.completion_timestamp == start
+                    )
+                )
+                await process_routine_submission_event(
+                    session,
+                    submission_id=submission_id,
+                    now=start + timedelta(days=1),
+                )
+                aggregate = await session.scalar(
+                    select(DailyWorkoutAggregate).where(
+                        DailyWorkoutAggregate.user_id == user.id,
+                        DailyWorkoutAggregate.day
+                        == datetime(2025, 4, 7, tzinfo=timezone.utc),
+                    )
+                )
+                assert aggregate.workout_count == 3
+                assert aggregate.total_minutes == 80
+                quests = await get_user_quests(
+                    session, user.id, now=start + timedelta(days=1)
+                )
+                assert quests[0].progress_value == 90
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
+def test_activity_summary_tracks_streaks_and_rolling_counts() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        today = datetime.now(timezone.utc).replace(
+            hour=6, minute=0, second=0, microsecond=0
+        )
+        try:
+            user = await _create_user(session_maker, "frankie")
+            async with session_maker() as session:
+                for days_ago, minutes in [(5, 30), (4, 20), (1, 45), (0, 10), (0, 15)]:
+                    await _record_workout(
+                        session,
+                        user.id,
+                        duration_minutes=minutes,
+                        completed_at=today - timedelta(days=days_ago),
+                    )
+                summary = await session.scalar(
+                    select(UserActivitySummary).where(
+                        UserActivitySummary.user_id == user.id
+                    )
+                )
+                assert summary.current_streak == 2
+                assert summary.longest_streak == 2
+
+                # Backdated workouts that bridge the gap rebuild the streak.
+                for days_ago in (3, 2):
+                    await _record_workout(
+                        session,
+                        user.id,
+                        duration_minutes=5,
+                        completed_at=today - timedelta(days=days_ago),
+                    )
+                # Older than the rolling window: only affects streak history.
+                await _record_workout(
+                    session,
+                    user.id,
+                    duration_minutes=60,
+                    completed_at=today - timedelta(days=40),
+                )
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                response = await client.get(f"/api/v1/users/{user.id}/activity-summary")
+                assert response.status_code == 200
+                body = response.json()
+                assert body["current_streak"] == 6
+                assert body["longest_streak"] == 6
+                assert body["workouts_7d"] == 7
+                assert body["minutes_7d"] == 30 + 20 + 5 + 5 + 45 + 10 + 15
+                assert body["active_days_7d"] == 6
+                assert body["workouts_28d"] == 7
+                assert body["active_days_28d"] == 6
+
+                missing = await client.get(f"/api/v1/users/{uuid4()}/activity-summary")
+                assert missing.status_code == 404
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
 def test_manual_claim_flow() -> None:
     async def run_test() -> None:
         session_maker, engine = await _setup_test_app()
@@ -511,6 +666,13 @@ def test_quest_api_endpoints() -> None:
                 assert claim_response.status_code == 200
                 claimed = claim_response.json()
                 assert claimed["status"] == "claimed"
+                history_response = await client.get("/api/v1/quests/me/history")
+                assert history_response.status_code == 200
+                assert history_response.json() == {"quests": [], "next_cursor": None}
+                bad_cursor = await client.get(
+                    "/api/v1/quests/me/history", params={"cursor": "not-a-cursor"}
+                )
+                assert bad_cursor.status_code == 400
             async with session_maker() as session:
                 result = await session.execute(
                     select(UserXP.total_xp).where(UserXP.user_id == user.id)
@@ -522,3 +684,123 @@ def test_quest_api_endpoints() -> None:
 
     asyncio.run(run_test())
 
+
+
+def test_expiry_sweeper_and_history_pagination() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        start = datetime(2025, 4, 1, 9, tzinfo=timezone.utc)
+        try:
+            user = await _create_user(session_maker, "erin")
+            await _create_template(
+                session_maker,
+                code="daily_checkin",
+                cadence=QuestCadence.DAILY,
+                metric=QuestMetric.WORKOUTS_COMPLETED,
+                target_value=1,
+                reward_xp=10,
+                auto_claim=True,
+                available_from=start - timedelta(days=1),
+            )
+            async with session_maker() as session:
+                for day in range(10):
+                    await get_user_quests(session, user.id, now=start + timedelta(days=day))
+
+                today = start + timedelta(days=10)
+                quests = await get_user_quests(session, user.id, now=today)
+                # Today's cycle plus the seven days inside the recent window.
+                assert len(quests) == 8
+
+                result = await session.execute(
+                    select(UserQuest.status).where(UserQuest.user_id == user.id)
+                )
+                # Reads no longer write expiry; only today's quest is new.
+                assert set(result.scalars().all()) == {QuestStatus.ACTIVE.value}
+
+            async with session_maker() as session:
+                expired = await expire_stale_quests(session, now=today)
+                assert expired == 10
+                assert await expire_stale_quests(session, now=today) == 0
+
+            async with session_maker() as session:
+                first_page = await get_user_quest_history(
+                    session, user.id, limit=4, now=today
+                )
+                assert len(first_page) == 4
+                assert all(q.status == QuestStatus.EXPIRED.value for q in first_page)
+                last = first_page[-1]
+                second_page = await get_user_quest_history(
+                    session,
+                    user.id,
+                    limit=10,
+                    before=(last.cycle_start, last.id),
+                    now=today,
+                )
+                assert len(second_page) == 6
+                starts = [q.cycle_start for q in first_page + second_page]
+                assert starts == sorted(starts, reverse=True)
+                assert len(set(q.id for q in first_page + second_page)) == 10
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
+def test_archive_moves_finished_quests_and_history_spans_both_tables() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        start = datetime(2025, 1, 6, 9, tzinfo=timezone.utc)
+        try:
+            user = await _create_user(session_maker, "frankie")
+            await _create_template(
+                session_maker,
+                code="daily_checkin",
+                cadence=QuestCadence.DAILY,
+                metric=QuestMetric.WORKOUTS_COMPLETED,
+                target_value=1,
+                reward_xp=10,
+                auto_claim=True,
+                available_from=start - timedelta(days=1),
+            )
+            async with session_maker() as session:
+                for day in range(40):
+                    await get_user_quests(session, user.id, now=start + timedelta(days=day))
+            today = start + timedelta(days=40)
+            async with session_maker() as session:
+                await expire_stale_quests(session, now=today)
+
+            async with session_maker() as session:
+                archived = await archive_finished_quests(
+                    session, older_than=timedelta(days=30), batch_size=4, now=today
+                )
+            # Cycles ending at or before midnight of day 10 fall behind the cutoff.
+            assert archived == 10
+
+            async with session_maker() as session:
+                live = await session.execute(
+                    select(func.count()).select_from(UserQuest)
+                )
+                history = await session.execute(
+                    select(func.count()).select_from(UserQuestHistory)
+                )
+                assert live.scalar() == 30
+                assert history.scalar() == 10
+
+                seen = []
+                before = None
+                while True:
+                    page = await get_user_quest_history(
+                        session, user.id, limit=7, before=before, now=today
+                    )
+                    seen.extend(page)
+                    if len(page) < 7:
+                        break
+                    before = (page[-1].cycle_start, page[-1].id)
+                assert len(seen) == 40
+                assert len({quest.id for quest in seen}) == 40
+                assert sum(isinstance(q, UserQuestHistory) for q in seen) == 10
+                assert isinstance(seen[-1], UserQuestHistory)
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
@@ -0,0 +1,199 @@
+# backend/tests/test_api/test_routine_submission_api.py
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from tests.test_support.app_setup import (
+    api_client,
+    setup_test_app,
+    teardown_test_app,
+)
+from tests.test_support.queries import query_counter
+from app.api.v1 import routine_submission as routine_submission_api
+from app.api.v1.deps import get_session_factory
+from app.core.auth import get_current_principal
+from app.main import app
+from app.models.feed import FeedItem
+from app.models.outbox_event import OutboxEvent
+from app.models.routine_submission import RoutineScenarioSubmission, RoutineSubmission
+from app.models.user import User
+from app.services.principal_cache import AuthenticatedUser
+
+
+def _tables():
+    return [
+        User.__table__,
+        RoutineSubmission.__table__,
+        RoutineScenarioSubmission.__table__,
+        OutboxEvent.__table__,
+        FeedItem.__table__,
+    ]
+
+
+async def _create_user(session_maker) -> User:
+    async with session_maker() as session:
+        user = User(
+            id=uuid4(),
+            username="lifter",
+            email="lifter@example.com",
+            hashed_password="hashed",
+        )
+        session.add(user)
+        await session.commit()
+    principal = AuthenticatedUser(
+        id=user.id,
+        subscription_level="free",
+        is_active=True,
+        preferred_unit="kg",
+        weight=None,
+        gender=None,
+    )
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    return user
+
+
+def test_routine_history_keyset_pagination_and_summary_mode(monkeypatch) -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_tables())
+        base = datetime(2025, 5, 1, 12, tzinfo=timezone.utc)
+        try:
+            user = await _create_user(session_maker)
+            async with session_maker() as session:
+                for day in range(5):
+                    submission = RoutineSubmission(
+                        id=uuid4(),
+                        user_id=user.id,
+                        duration=30 + day,
+                        completion_timestamp=base + timedelta(days=day),
+                        status="completed",
+                        title=f"Workout {day}",
+                    )
+                    submission.scenario_submissions.append(
+                        RoutineScenarioSubmission(
+                            scenario_id="bench",
+                            sets=3,
+                            reps=10,
+                            weight=60.0,
+                            total_volume=1800.0,
+                        )
+                    )
+                    session.add(submission)
+                await session.commit()
+
+            url = f"/api/v1/routine_submission/user/{user.id}"
+            async with api_client() as client:
+                first = await client.get(url, params={"limit": 2})
+                assert first.status_code == 200
+                assert [row["title"] for row in first.json()] == ["Workout 4", "Workout 3"]
+                assert first.json()[0]["scenario_submissions"][0]["scenario_id"] == "bench"
+                cursor = first.headers["X-Next-Cursor"]
+
+                second = await client.get(url, params={"limit": 2, "cursor": cursor})
+                assert [row["title"] for row in second.json()] == ["Workout 2", "Workout 1"]
+
+                last = await client.get(
+                    url,
+                    params={"limit": 2, "cursor": second.headers["X-Next-Cursor"]},
+                )
+                assert [row["title"] for row in last.json()] == ["Workout 0"]
+                assert "X-Next-Cursor" not in last.headers
+
+                # Clients that predate pagination still get the whole history.
+                monkeypatch.setattr(routine_submission_api, "DEFAULT_HISTORY_LIMIT", 2)
+                unpaged = await client.get(url)
+                assert len(unpaged.json()) == 5
+                assert "X-Next-Cursor" not in unpaged.headers
+                paged = await client.get(url, params={"cursor": cursor})
+                assert [row["title"] for row in paged.json()] == ["Workout 2", "Workout 1"]
+
+                windowed = await client.get(
+                    url,
+                    params={
+                        "summary": "true",
+                        "since": (base + timedelta(days=1)).isoformat(),
+                        "until": (base + timedelta(days=3)).isoformat(),
+                    },
+                )
+                assert windowed.status_code == 200
+                rows = windowed.json()
+                assert [row["title"] for row in rows] == ["Workout 2", "Workout 1"]
+                assert all("scenario_submissions" not in row for row in rows)
+
+                # The stream reads through a session of its own, not get_db's.
+                stream_sessions = []
+
+                def stream_session():
+                    session = session_maker()
+                    stream_sessions.append(session)
+                    return session
+
+                app.dependency_overrides[get_session_factory] = lambda: stream_session
+                streamed = await client.get(
+                    url, params={"format": "ndjson", "summary": "true"}
+                )
+                assert len(stream_sessions) == 1
+                assert streamed.status_code == 200
+                assert streamed.headers["content-type"].startswith(
+                    "application/x-ndjson"
+                )
+                lines = [json.loads(line) for line in streamed.text.splitlines()]
+                assert [row["title"] for row in lines] == [
+                    f"Workout {day}" for day in range(4, -1, -1)
+                ]
+                assert all("scenario_submissions" not in row for row in lines)
+
+                bad = await client.get(url, params={"cursor": "not-a-cursor"})
+                assert bad.status_code == 400
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_submit_routine_writes_without_rereading() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_tables())
+        try:
+            user = await _create_user(session_maker)
+            payload = {
+                "user_id": str(user.id),
+                "duration": 42.5,
+                "completion_timestamp": "2025-05-02T07:30:00+00:00",
+                "status": "completed",
+                "scenario_submissions": [
+                    {
+                        "scenario_id": scenario_id,
+                        "sets": 3,
+                        "reps": 8,
+                        "weight": 80.0,
+                        "total_volume": 1920.0,
+                    }
+                    for scenario_id in ("squat", "bench", "deadlift")
+                ],
+            }
+            async with api_client() as client:
+                with query_counter(engine) as stats:
+                    response = await client.post(
+                        "/api/v1/routine_submission/", json=payload
+                    )
+            assert response.status_code == 201
+            body = response.json()
+            assert body["title"] == "Morning Workout"
+            assert [row["scenario_id"] for row in body["scenario_submissions"]] == [
+                "squat",
+                "bench",
+                "deadlift",
+            ]
+            # Parent, batched children, the feed item and the batched outbox
+            # rows; nothing is read back.
+            assert stats["count"] == 4
+            assert all(
+                statement.lstrip().upper().startswith("INSERT")
+                for statement in stats["statements"]
+            )
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
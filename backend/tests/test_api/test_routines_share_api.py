@@ -28,7 +28,7 @@ if not STATIC_DIR.exists():
     STATIC_DIR.mkdir()
     _created_static = True
 
-from app.api.v1.auth import get_current_user  # noqa: E402
+from app.api.v1.auth import get_current_principal  # noqa: E402
 from app.api.v1.deps import get_db  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models.routine import Routine  # noqa: E402
@@ -181,7 +181,7 @@ async def _set_current_user(user: AuthUser) -> None:
     async def override_current_user() -> AuthUser:
         return user
 
-    app.dependency_overrides[get_current_user] = override_current_user
+    app.dependency_overrides[get_current_principal] = override_current_user
 
 
 def test_share_and_import_routine_by_code() -> None:
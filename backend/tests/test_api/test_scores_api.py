@@ -1,6 +1,7 @@
 # backend/tests/test_api/test_scores_api.py
 
 import asyncio
+import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
@@ -14,14 +15,21 @@ from tests.test_support.app_setup import (
     setup_test_app,
     teardown_test_app,
 )
-from app.api.v1.auth import get_current_user  # noqa: E402
+from tests.test_support.queries import query_counter
+from app.api.v1.auth import get_current_principal  # noqa: E402
 from app.main import app  # noqa: E402
+from app.models.feed import FeedItem  # noqa: E402
+from app.models.outbox_event import OutboxEvent  # noqa: E402
+from app.models.period_score_best import PeriodScoreBest  # noqa: E402
 from app.models.personal_best_event import PersonalBestEvent  # noqa: E402
+from app.models.rank_histogram import RankHistogramBucket  # noqa: E402
+from app.models.rate_limit_event import RateLimitEvent  # noqa: E402
 from app.models.scenario import Scenario  # noqa: E402
 from app.models.score import Score  # noqa: E402
 from app.models.user import User  # noqa: E402
 from app.models.user_xp import UserXP  # noqa: E402
 from app.models.xp_event import XPEvent  # noqa: E402
+from app.services.histogram_service import rebuild_histograms  # noqa: E402
 from app.services.score_service import calculate_score_value  # noqa: E402
 
 
@@ -35,7 +43,7 @@ async def _set_current_user(user: AuthUser) -> None:
     async def override_current_user() -> AuthUser:
         return user
 
-    app.dependency_overrides[get_current_user] = override_current_user
+    app.dependency_overrides[get_current_principal] = override_current_user
 
 
 _TABLES = [
@@ -45,6 +53,11 @@ _TABLES = [
     XPEvent.__table__,
     Score.__table__,
     PersonalBestEvent.__table__,
+    RankHistogramBucket.__table__,
+    PeriodScoreBest.__table__,
+    FeedItem.__table__,
+    OutboxEvent.__table__,
+    RateLimitEvent.__table__,
 ]
 
 
@@ -259,3 +272,116 @@ def test_delete_scores_requires_owner() -> None:
 
     asyncio.run(run_test())
 
+
+
+def test_score_history_streams_ndjson() -> None:
+    async def run_test() -> None:
+        session_maker, engine = _setup_test_app()
+        try:
+            user = await _create_user(session_maker, "stream_user", weight=80.0)
+            await _create_scenario(session_maker, "stream_lift")
+            for weight in (100.0, 110.0, 120.0):
+                await _create_existing_score(
+                    session_maker,
+                    user_id=user.id,
+                    scenario_id="stream_lift",
+                    weight_lifted=weight,
+                    reps=1,
+                )
+
+            url = f"/api/v1/scores/user/{user.id}/scenario/stream_lift"
+            async with api_client() as client:
+                listed = await client.get(url)
+                streamed = await client.get(
+                    url, headers={"Accept": "application/x-ndjson"}
+                )
+                forced_json = await client.get(
+                    url,
+                    params={"format": "json"},
+                    headers={"Accept": "application/x-ndjson"},
+                )
+
+            assert streamed.status_code == 200
+            assert streamed.headers["content-type"].startswith("application/x-ndjson")
+            lines = [json.loads(line) for line in streamed.text.splitlines()]
+            assert lines == listed.json()
+            assert len(lines) == 3
+            assert forced_json.json() == listed.json()
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
+def test_personal_bests_maintain_score_histogram() -> None:
+    async def run_test() -> None:
+        session_maker, engine = _setup_test_app()
+        try:
+            await _create_scenario(session_maker, "curl")
+            users = [
+                await _create_user(session_maker, f"lifter{i}", weight=80.0)
+                for i in range(4)
+            ]
+            async with api_client() as client:
+                for user, weight in zip(users, (20.0, 30.0, 40.0, 50.0)):
+                    await _set_current_user(user)
+                    await client.post(
+                        "/api/v1/scores/scenario/curl/",
+                        json={"weight_lifted": weight, "reps": 1},
+                    )
+                # A weaker lift leaves the histogram alone; a PR moves the entry.
+                await client.post(
+                    "/api/v1/scores/scenario/curl/",
+                    json={"weight_lifted": 45.0, "reps": 1},
+                )
+                await _set_current_user(users[0])
+                with query_counter(engine) as stats:
+                    await client.post(
+                        "/api/v1/scores/scenario/curl/",
+                        json={"weight_lifted": 35.0, "reps": 1},
+                    )
+
+                distribution = await client.get("/api/v1/scores/scenario/curl/distribution")
+                percentile = await client.get(
+                    f"/api/v1/scores/scenario/curl/percentile/{users[0].id}"
+                )
+                missing = await client.get(
+                    f"/api/v1/scores/scenario/curl/percentile/{uuid4()}"
+                )
+
+            body = distribution.json()
+            assert body["total"] == 4
+            assert [bucket["lower"] for bucket in body["buckets"]] == [30.0, 35.0, 40.0, 50.0]
+            assert percentile.json() == {"value": 35.0, "percentile": 37.5, "total": 4}
+            assert missing.status_code == 404
+            # The previous best is read under the per-(user, scenario) lock.
+            statements = stats["statements"]
+            lock = next(
+                i for i, sql in enumerate(statements) if "advisory_xact_lock" in sql
+            )
+            previous_best = next(
+                i
+                for i, sql in enumerate(statements)
+                if "ORDER BY scores.score_value DESC" in sql
+            )
+            assert lock < previous_best
+
+            async with session_maker() as session:
+                incremental = sorted(
+                    (row.key, row.bucket, row.count)
+                    for row in (
+                        await session.execute(
+                            select(RankHistogramBucket).where(RankHistogramBucket.count > 0)
+                        )
+                    ).scalars()
+                )
+                await rebuild_histograms(session)
+                rebuilt = sorted(
+                    (row.key, row.bucket, row.count)
+                    for row in (await session.execute(select(RankHistogramBucket))).scalars()
+                )
+                assert rebuilt == incremental
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import create_engine, func, select
+from sqlalchemy import create_engine, func, select, update
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -18,12 +18,19 @@ os.environ.setdefault("REVENUECAT_WEBHOOK_AUTH_TOKEN", "token")
 os.environ.setdefault("STRIPE_SECRET_KEY", "sk_test")
 os.environ.setdefault("STRIPE_WEBHOOK_SECRET", "whsec_test")
 
-from app.api.v1.auth import get_current_user  # noqa: E402
+from app.api.v1.auth import get_current_principal  # noqa: E402
 from app.api.v1.deps import get_db  # noqa: E402
 from app.main import app  # noqa: E402
+from app.models.feed import FeedInbox, FeedItem  # noqa: E402
 from app.models.rate_limit_event import RateLimitEvent  # noqa: E402
 from app.models.social import SocialEdge  # noqa: E402
 from app.models.user import User  # noqa: E402
+from app.services import social_service  # noqa: E402
+from app.services.social_service import SEARCH_COUNT_CAP  # noqa: E402
+from app.services.user_search_index import (  # noqa: E402
+    IndexedUser,
+    user_search_index,
+)
 
 
 @dataclass
@@ -75,6 +82,8 @@ async def _setup_test_app() -> tuple[SessionFactory, Engine]:
     User.__table__.create(bind=engine)
     SocialEdge.__table__.create(bind=engine)
     RateLimitEvent.__table__.create(bind=engine)
+    FeedItem.__table__.create(bind=engine)
+    FeedInbox.__table__.create(bind=engine)
     sync_maker = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
     def factory() -> AsyncSessionWrapper:
@@ -121,13 +130,17 @@ async def _add_edge(
         )
         session.add(edge)
         await session.commit()
+        # Edges are inserted directly to control created_at, so bring the
+        # denormalized counters back in line the way the nightly job would.
+        for user_id in (follower_id, followee_id):
+            await social_service.reconcile_follow_counts(session, user_id=user_id)
 
 
 async def _set_current_user(user: AuthUser) -> None:
     async def override_current_user() -> AuthUser:
         return user
 
-    app.dependency_overrides[get_current_user] = override_current_user
+    app.dependency_overrides[get_current_principal] = override_current_user
 
 
 async def _teardown(engine: Engine) -> None:
@@ -177,6 +190,61 @@ def test_follow_unfollow_idempotent() -> None:
     asyncio.run(run_test())
 
 
+async def _follow_counts(session_maker: SessionFactory, user_id: UUID) -> tuple[int, int, int]:
+    async with session_maker() as session:
+        row = (
+            await session.execute(
+                select(User.follower_count, User.following_count, User.mutual_count).where(
+                    User.id == user_id
+                )
+            )
+        ).one()
+        return tuple(row)
+
+
+def test_follow_counters_track_edges_and_reconcile() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        try:
+            alice = await _create_user(session_maker, "alice")
+            bob = await _create_user(session_maker, "bob")
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                await _set_current_user(alice)
+                await client.post(f"/api/v1/users/{bob.id}/follow")
+                await client.post(f"/api/v1/users/{bob.id}/follow")
+                assert await _follow_counts(session_maker, alice.id) == (0, 1, 0)
+                assert await _follow_counts(session_maker, bob.id) == (1, 0, 0)
+
+                await _set_current_user(bob)
+                await client.post(f"/api/v1/users/{alice.id}/follow")
+                assert await _follow_counts(session_maker, alice.id) == (1, 1, 1)
+                assert await _follow_counts(session_maker, bob.id) == (1, 1, 1)
+                friends = await client.get(f"/api/v1/users/{bob.id}/friends")
+                assert friends.json()["total"] == 1
+
+                await _set_current_user(alice)
+                await client.delete(f"/api/v1/users/{bob.id}/follow")
+                await client.delete(f"/api/v1/users/{bob.id}/follow")
+                assert await _follow_counts(session_maker, alice.id) == (1, 0, 0)
+                assert await _follow_counts(session_maker, bob.id) == (0, 1, 0)
+
+            async with session_maker() as session:
+                await session.execute(
+                    update(User).where(User.id == bob.id).values(follower_count=7)
+                )
+                await session.commit()
+                corrected = await social_service.reconcile_follow_counts(
+                    session, batch_size=1
+                )
+            assert corrected == 1
+            assert await _follow_counts(session_maker, bob.id) == (0, 1, 0)
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
 def test_followers_pagination() -> None:
     async def run_test() -> None:
         session_maker, engine = await _setup_test_app()
@@ -238,6 +306,94 @@ def test_followers_pagination() -> None:
     asyncio.run(run_test())
 
 
+def test_followers_cursor_pagination_walks_ties_once() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        try:
+            target = await _create_user(session_maker, "target")
+            await _set_current_user(target)
+            now = datetime.now(timezone.utc)
+            follower_ids: set[str] = set()
+            for idx in range(5):
+                follower = await _create_user(session_maker, f"follower{idx}")
+                follower_ids.add(str(follower.id))
+                # Three followers share a timestamp to exercise the id tie-break.
+                await _add_edge(
+                    session_maker, follower.id, target.id, now + timedelta(minutes=min(idx, 2))
+                )
+
+            seen: list[str] = []
+            pages = []
+            params: dict[str, object] = {"limit": 2}
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                while True:
+                    page = (
+                        await client.get(f"/api/v1/users/{target.id}/followers", params=params)
+                    ).json()
+                    pages.append(page)
+                    seen.extend(item["id"] for item in page["items"])
+                    if page["next_cursor"] is None:
+                        break
+                    params = {"limit": 2, "cursor": page["next_cursor"]}
+                invalid = await client.get(
+                    f"/api/v1/users/{target.id}/followers", params={"cursor": "nope"}
+                )
+
+            assert len(seen) == 5
+            assert set(seen) == follower_ids
+            assert [page["count"] for page in pages] == [2, 2, 1]
+            assert pages[0]["next_offset"] == 2
+            assert [page["next_offset"] for page in pages[1:]] == [None, None]
+            followed_at = [
+                item["followed_at"] for page in pages for item in page["items"]
+            ]
+            assert followed_at == sorted(followed_at, reverse=True)
+            assert invalid.status_code == 400
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
+def test_get_relationships_resolves_batch_in_both_directions() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        try:
+            viewer = await _create_user(session_maker, "viewer")
+            friend = await _create_user(session_maker, "friend")
+            fan = await _create_user(session_maker, "fan")
+            idol = await _create_user(session_maker, "idol")
+            stranger = await _create_user(session_maker, "stranger")
+            now = datetime.now(timezone.utc)
+            await _add_edge(session_maker, viewer.id, friend.id, now)
+            await _add_edge(session_maker, friend.id, viewer.id, now)
+            await _add_edge(session_maker, fan.id, viewer.id, now)
+            await _add_edge(session_maker, viewer.id, idol.id, now)
+            await _add_edge(session_maker, fan.id, idol.id, now)
+
+            targets = [friend.id, fan.id, idol.id, stranger.id]
+            async with session_maker() as session:
+                relationships = await social_service.get_relationships(
+                    session, viewer.id, targets
+                )
+                anonymous = await social_service.get_relationships(session, None, targets)
+
+            assert relationships[friend.id].is_friend is True
+            assert relationships[fan.id] == social_service.Relationship(
+                is_following=False, is_followed_by=True
+            )
+            assert relationships[idol.id] == social_service.Relationship(
+                is_following=True, is_followed_by=False
+            )
+            assert relationships[stranger.id] == social_service.Relationship()
+            assert all(value == social_service.Relationship() for value in anonymous.values())
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
 def test_follow_rate_limit_enforced() -> None:
     async def run_test() -> None:
         session_maker, engine = await _setup_test_app()
@@ -292,6 +448,164 @@ def test_mutuals_compute_correctly() -> None:
     asyncio.run(run_test())
 
 
+def test_search_users_ranks_exact_and_prefix_matches_first() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        try:
+            viewer = await _create_user(session_maker, "viewer")
+            await _create_user(session_maker, "abob")
+            await _create_user(session_maker, "bobby")
+            await _create_user(session_maker, "zed", display_name="Bob Builder")
+            await _create_user(session_maker, "bob")
+            await _create_user(session_maker, "lo_w")
+            await _create_user(session_maker, "loaw")
+
+            await _set_current_user(viewer)
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                ranked = await client.get("/api/v1/users/lookup", params={"q": "BOB"})
+                literal = await client.get("/api/v1/users/lookup", params={"q": "o_"})
+
+            assert [item["username"] for item in ranked.json()["items"]] == [
+                "bob",
+                "bobby",
+                "zed",
+                "abob",
+            ]
+            assert ranked.json()["total"] == 4
+            # LIKE wildcards in the query are matched literally.
+            assert [item["username"] for item in literal.json()["items"]] == ["lo_w"]
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
+def test_search_users_first_page_from_prefix_index_matches_sql() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        try:
+            viewer = await _create_user(session_maker, "viewer")
+            for username, display_name in [
+                ("abob", None),
+                ("bobby", None),
+                ("zed", "Bob Builder"),
+                ("bob", None),
+                ("Bobcat", None),
+                ("rob", "bobo"),
+            ]:
+                await _create_user(session_maker, username, display_name=display_name)
+            async with session_maker() as session:
+                indexed = [
+                    IndexedUser(
+                        id=user.id,
+                        username=user.username,
+                        display_name=user.display_name,
+                        avatar_url=user.avatar_url,
+                    )
+                    for user in (await session.execute(select(User))).scalars()
+                ]
+
+            await _set_current_user(viewer)
+            queries = [
+                {"q": "bob", "limit": 3},
+                {"q": "BOB", "limit": 5},
+                {"q": "bob", "limit": 10},
+                {"q": "v", "limit": 1},
+            ]
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                from_sql = [
+                    (await client.get("/api/v1/users/lookup", params=params)).json()
+                    for params in queries
+                ]
+                user_search_index.load(indexed)
+                try:
+                    from_index = [
+                        (await client.get("/api/v1/users/lookup", params=params)).json()
+                        for params in queries
+                    ]
+                    served = user_search_index.first_page(
+                        "bob", exclude=viewer.id, limit=3, count_cap=SEARCH_COUNT_CAP
+                    )
+                    exhausted = user_search_index.first_page(
+                        "bob", exclude=viewer.id, limit=5, count_cap=SEARCH_COUNT_CAP
+                    )
+                finally:
+                    user_search_index.clear()
+
+            for sql_page, index_page in zip(from_sql, from_index):
+                assert index_page["items"] == sql_page["items"]
+            assert [item["username"] for item in from_index[1]["items"]] == [
+                "bob",
+                "bobby",
+                "Bobcat",
+                "rob",
+                "zed",
+            ]
+            assert from_index[1]["next_offset"] == 5
+            # Five users match the prefix, each counted once.
+            assert served is not None and served[1] == 5
+            # Every prefix match fits; "abob" is a substring match only SQL finds.
+            assert exhausted is None
+            assert from_index[3]["items"] == []
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
+def test_search_users_index_page_reports_the_sql_total_and_next_offset() -> None:
+    async def run_test() -> None:
+        session_maker, engine = await _setup_test_app()
+        try:
+            viewer = await _create_user(session_maker, "viewer")
+            # Signups default the display name to the username.
+            for username in ("bob", "bobby", "bobcat", "bobo"):
+                await _create_user(session_maker, username, display_name=username)
+            async with session_maker() as session:
+                indexed = [
+                    IndexedUser(
+                        id=user.id,
+                        username=user.username,
+                        display_name=user.display_name,
+                        avatar_url=user.avatar_url,
+                    )
+                    for user in (await session.execute(select(User))).scalars()
+                ]
+
+            await _set_current_user(viewer)
+            first = {"q": "bob", "limit": 3}
+            second = {"q": "bob", "limit": 3, "offset": 3}
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+                from_sql = (await client.get("/api/v1/users/lookup", params=first)).json()
+                user_search_index.load(indexed)
+                try:
+                    served = user_search_index.first_page(
+                        "bob", exclude=viewer.id, limit=3, count_cap=SEARCH_COUNT_CAP
+                    )
+                    from_index = (
+                        await client.get("/api/v1/users/lookup", params=first)
+                    ).json()
+                    next_page = (
+                        await client.get("/api/v1/users/lookup", params=second)
+                    ).json()
+                finally:
+                    user_search_index.clear()
+
+            assert served is not None
+            assert from_index["items"] == from_sql["items"]
+            assert (from_index["total"], from_index["next_offset"]) == (4, 3)
+            assert (from_sql["total"], from_sql["next_offset"]) == (4, 3)
+            assert [item["username"] for item in next_page["items"]] == ["bobo"]
+            assert (next_page["total"], next_page["next_offset"]) == (4, None)
+        finally:
+            await _teardown(engine)
+
+    asyncio.run(run_test())
+
+
 def test_search_users_returns_relationship_flags() -> None:
     async def run_test() -> None:
         session_maker, engine = await _setup_test_app()
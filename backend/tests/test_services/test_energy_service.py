@@ -0,0 +1,128 @@
+# backend/tests/test_services/test_energy_service.py
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from app.models.energy_history import EnergyHistory
+from app.models.energy_rollup import DailyEnergyRollup
+from app.models.user import User
+from app.services.energy_service import compact_energy_history, record_energy
+
+
+def test_compaction_collapses_consecutive_repeats() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(
+            [User.__table__, EnergyHistory.__table__, DailyEnergyRollup.__table__]
+        )
+        start = datetime(2025, 4, 1, 8, tzinfo=timezone.utc)
+        user_ids = [uuid4(), uuid4()]
+        try:
+            async with session_maker() as session:
+                for index, user_id in enumerate(user_ids):
+                    session.add(
+                        User(
+                            id=user_id,
+                            username=f"user{index}",
+                            email=f"user{index}@example.com",
+                            hashed_password="hashed",
+                        )
+                    )
+                await session.commit()
+                values = [300.0, 300.0, 300.0, 350.0, 350.0, 300.0]
+                for minute, energy in enumerate(values):
+                    for user_id in user_ids:
+                        await record_energy(
+                            session,
+                            user_id,
+                            energy,
+                            recorded_at=start + timedelta(minutes=minute),
+                        )
+                await session.commit()
+
+                window = timedelta(hours=1)
+                removed = await compact_energy_history(
+                    session, window=window, user_id=user_ids[0]
+                )
+                assert removed == 3
+
+                kept = (
+                    await session.execute(
+                        select(EnergyHistory.energy)
+                        .where(EnergyHistory.user_id == user_ids[0])
+                        .order_by(EnergyHistory.created_at)
+                    )
+                ).scalars().all()
+                assert kept == [300.0, 350.0, 300.0]
+
+                rollups = {
+                    row.user_id: row
+                    for row in (await session.execute(select(DailyEnergyRollup))).scalars()
+                }
+                assert rollups[user_ids[0]].sample_count == 3
+                assert rollups[user_ids[1]].sample_count == 6
+                assert rollups[user_ids[0]].last_energy == 300.0
+
+                assert (
+                    await compact_energy_history(session, window=window, batch_size=1)
+                    == 3
+                )
+                assert await compact_energy_history(session, window=window) == 0
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_compaction_respects_the_window_and_rebuilds_touched_rollups() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(
+            [User.__table__, EnergyHistory.__table__, DailyEnergyRollup.__table__]
+        )
+        midnight = datetime(2025, 4, 2, tzinfo=timezone.utc)
+        user_id = uuid4()
+        try:
+            async with session_maker() as session:
+                session.add(
+                    User(
+                        id=user_id,
+                        username="spanner",
+                        email="spanner@example.com",
+                        hashed_password="hashed",
+                    )
+                )
+                await session.commit()
+                samples = [
+                    # A repeat three hours later is a real sample, not a resubmit.
+                    (midnight - timedelta(hours=5), 300.0),
+                    (midnight - timedelta(hours=2), 300.0),
+                    # A resubmit just after midnight leaves April 2nd empty.
+                    (midnight - timedelta(minutes=10), 320.0),
+                    (midnight + timedelta(minutes=10), 320.0),
+                ]
+                for recorded_at, energy in samples:
+                    await record_energy(session, user_id, energy, recorded_at=recorded_at)
+                await session.commit()
+
+                removed = await compact_energy_history(
+                    session, window=timedelta(hours=1)
+                )
+                assert removed == 1
+
+                kept = (
+                    await session.execute(
+                        select(EnergyHistory.energy).order_by(EnergyHistory.created_at)
+                    )
+                ).scalars().all()
+                assert kept == [300.0, 300.0, 320.0]
+                rollups = (await session.execute(select(DailyEnergyRollup))).scalars().all()
+                assert [(row.sample_count, row.last_energy) for row in rollups] == [
+                    (3, 320.0)
+                ]
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
@@ -0,0 +1,160 @@
+# backend/tests/test_services/test_export_service.py
+
+import asyncio
+import csv
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from app.core.config import Settings
+from app.models.energy_history import EnergyHistory
+from app.models.routine_submission import RoutineScenarioSubmission, RoutineSubmission
+from app.models.score import Score
+from app.models.user import User
+from app.models.xp_event import XPEvent
+from app.services import export_service
+
+_TABLES = [
+    User.__table__,
+    Score.__table__,
+    RoutineSubmission.__table__,
+    RoutineScenarioSubmission.__table__,
+    EnergyHistory.__table__,
+    XPEvent.__table__,
+]
+
+
+def _read_rows(path) -> list[dict]:
+    with open(path, newline="", encoding="utf-8") as fh:
+        return list(csv.DictReader(fh))
+
+
+def test_export_streams_user_history_into_chunked_csv(tmp_path, monkeypatch) -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_TABLES)
+        base = datetime(2025, 7, 1, tzinfo=timezone.utc)
+        owner, other = uuid4(), uuid4()
+        try:
+            async with session_maker() as session:
+                for user_id, name in ((owner, "owner"), (other, "other")):
+                    session.add(
+                        User(
+                            id=user_id,
+                            username=name,
+                            email=f"{name}@example.com",
+                            hashed_password="hashed",
+                        )
+                    )
+                    for index in range(5):
+                        session.add(
+                            Score(
+                                user_id=user_id,
+                                scenario_id="bench",
+                                score_value=100 + index,
+                                weight_lifted=80.0,
+                                reps=5,
+                                created_at=base + timedelta(days=index),
+                            )
+                        )
+                        session.add(
+                            EnergyHistory(
+                                user_id=user_id,
+                                energy=500.0 + index,
+                                created_at=base + timedelta(days=index),
+                            )
+                        )
+                    submission = RoutineSubmission(
+                        id=uuid4(),
+                        user_id=user_id,
+                        duration=40,
+                        completion_timestamp=base,
+                        status="completed",
+                        title="Push Day",
+                    )
+                    submission.scenario_submissions.append(
+                        RoutineScenarioSubmission(
+                            scenario_id="bench",
+                            sets=3,
+                            reps=5,
+                            weight=80.0,
+                            total_volume=1200.0,
+                        )
+                    )
+                    session.add(submission)
+                await session.commit()
+
+            # Small cursor batches so the stream yields several partitions.
+            monkeypatch.setattr(export_service, "STREAM_BATCH_SIZE", 2)
+            reports: list[export_service.ExportProgress] = []
+            async with session_maker() as session:
+                manifest = await export_service.export_history(
+                    session,
+                    user_id=owner,
+                    chunk_rows=3,
+                    directory=str(tmp_path),
+                    progress=reports.append,
+                )
+
+            assert manifest.tables["scores"] == {
+                "rows": 5,
+                "files": ["scores-00001.csv", "scores-00002.csv"],
+            }
+            assert manifest.tables["energy_history"]["rows"] == 5
+            assert manifest.tables["routine_submissions"]["rows"] == 1
+            assert manifest.tables["routine_scenario_submissions"]["rows"] == 1
+            assert manifest.tables["xp_events"] == {
+                "rows": 0,
+                "files": ["xp_events-00001.csv"],
+            }
+
+            scores = _read_rows(tmp_path / "scores-00001.csv") + _read_rows(
+                tmp_path / "scores-00002.csv"
+            )
+            assert {row["user_id"] for row in scores} == {str(owner)}
+            assert [float(row["score_value"]) for row in scores] == [
+                100.0,
+                101.0,
+                102.0,
+                103.0,
+                104.0,
+            ]
+            children = _read_rows(tmp_path / "routine_scenario_submissions-00001.csv")
+            assert children[0]["user_id"] == str(owner)
+            assert _read_rows(tmp_path / "xp_events-00001.csv") == []
+
+            score_reports = [r.rows for r in reports if r.table == "scores"]
+            assert score_reports == [2, 4, 5, 5]
+            saved = json.loads((tmp_path / "manifest.json").read_text())
+            assert saved["user_id"] == str(owner)
+            assert saved["tables"]["scores"]["rows"] == 5
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_exports_stay_out_of_static_storage_and_expire(tmp_path, monkeypatch) -> None:
+    static_root = export_service.settings.STATIC_STORAGE_DIR
+    assert os.path.commonpath(
+        [export_service.settings.EXPORT_STORAGE_DIR, static_root]
+    ) != static_root
+    with pytest.raises(ValidationError):
+        Settings(EXPORT_STORAGE_DIR=os.path.join(static_root, "exports"))
+
+    monkeypatch.setattr(export_service.settings, "EXPORT_STORAGE_DIR", str(tmp_path))
+
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    for name, age in (("old", timedelta(days=8)), ("fresh", timedelta(days=1))):
+        export_dir = tmp_path / name
+        export_dir.mkdir()
+        (export_dir / "manifest.json").write_text("{}")
+        stamp = (now - age).timestamp()
+        os.utime(export_dir, (stamp, stamp))
+
+    assert export_service.purge_exports(older_than=timedelta(days=7), now=now) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["fresh"]
@@ -0,0 +1,93 @@
+# backend/tests/test_services/test_histogram_service.py
+
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from app.models.rank_histogram import RankHistogramBucket
+from app.models.score import Score
+from app.models.user import User
+from app.services.histogram_service import (
+    ENERGY_KEY,
+    HistogramKind,
+    adjust_histogram,
+    bucket_expression,
+    bucket_for,
+    rebuild_histograms,
+)
+
+
+def test_rebuild_and_incremental_paths_agree_just_below_a_boundary() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(
+            [User.__table__, Score.__table__, RankHistogramBucket.__table__]
+        )
+        # 4.9 / 2.5 = 1.96 and 49.9 / 10 = 4.99: rounding would move both up.
+        scores = (4.9, 2.4, 5.0)
+        energies = (49.9, 50.0)
+        try:
+            async with session_maker() as session:
+                for index, (score_value, energy) in enumerate(
+                    zip(scores, energies + (None,))
+                ):
+                    user_id = uuid4()
+                    session.add(
+                        User(
+                            id=user_id,
+                            username=f"edge{index}",
+                            email=f"edge{index}@example.com",
+                            hashed_password="hashed",
+                            energy=energy,
+                        )
+                    )
+                    session.add(
+                        Score(
+                            user_id=user_id,
+                            scenario_id="curl",
+                            score_value=score_value,
+                            weight_lifted=score_value,
+                        )
+                    )
+                    await adjust_histogram(
+                        session, HistogramKind.SCENARIO, "curl", old=None, new=score_value
+                    )
+                    await adjust_histogram(
+                        session, HistogramKind.ENERGY, ENERGY_KEY, old=None, new=energy
+                    )
+                await session.commit()
+
+                def buckets():
+                    return select(
+                        RankHistogramBucket.kind,
+                        RankHistogramBucket.bucket,
+                        RankHistogramBucket.count,
+                    ).where(RankHistogramBucket.count > 0)
+
+                incremental = sorted((await session.execute(buckets())).all())
+                await rebuild_histograms(session)
+                rebuilt = sorted((await session.execute(buckets())).all())
+
+            assert bucket_for(HistogramKind.SCENARIO, 4.9) == 1
+            assert bucket_for(HistogramKind.ENERGY, 49.9) == 4
+            assert rebuilt == incremental == [
+                ("energy", 4, 1),
+                ("energy", 5, 1),
+                ("scenario", 0, 1),
+                ("scenario", 1, 1),
+                ("scenario", 2, 1),
+            ]
+
+            # SQLite truncates on cast anyway; PostgreSQL rounds without floor.
+            compiled = str(
+                bucket_expression(HistogramKind.ENERGY, User.energy).compile(
+                    dialect=postgresql.dialect()
+                )
+            )
+            assert compiled.startswith("CAST(floor(")
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
@@ -0,0 +1,128 @@
+# backend/tests/test_services/test_outbox_service.py
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from app.models.feed import FeedItem
+from app.models.outbox_event import OutboxEvent
+from app.models.routine_submission import RoutineScenarioSubmission, RoutineSubmission
+from app.models.user import User
+from app.schemas.routine_submission import RoutineSubmissionCreate
+from app.services import outbox_service
+from app.services.routine_submission_service import create_routine_submission
+from app.tasks.analytics_tasks import TRAINING_VOLUME_TOPIC
+from app.tasks.feed_tasks import FEED_FANOUT_TOPIC
+from app.tasks.quest_tasks import ROUTINE_SUBMISSION_TOPIC
+
+_TABLES = [
+    User.__table__,
+    RoutineSubmission.__table__,
+    RoutineScenarioSubmission.__table__,
+    OutboxEvent.__table__,
+    FeedItem.__table__,
+]
+
+
+def test_submission_writes_outbox_event_in_same_commit() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_TABLES)
+        try:
+            user_id = uuid4()
+            completed_at = datetime(2025, 6, 2, 7, tzinfo=timezone.utc)
+            payload = RoutineSubmissionCreate(
+                user_id=user_id,
+                duration=42,
+                completion_timestamp=completed_at,
+                status="completed",
+                scenario_submissions=[],
+            )
+            async with session_maker() as session:
+                submission = await create_routine_submission(
+                    session, payload, SimpleNamespace(id=user_id)
+                )
+                submission_id = submission.id
+
+            async with session_maker() as session:
+                result = await session.execute(select(OutboxEvent))
+                events = {event.topic: event for event in result.scalars().all()}
+                assert set(events) == {
+                    ROUTINE_SUBMISSION_TOPIC,
+                    TRAINING_VOLUME_TOPIC,
+                    FEED_FANOUT_TOPIC,
+                }
+                assert events[TRAINING_VOLUME_TOPIC].payload["user_id"] == str(user_id)
+                event = events[ROUTINE_SUBMISSION_TOPIC]
+                assert event.published_at is None
+                assert event.payload["submission_id"] == str(submission_id)
+                assert event.payload["user_id"] == str(user_id)
+                assert event.payload["event_id"] == str(event.id)
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_relay_publishes_batch_and_backs_off_failures() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_TABLES)
+        now = datetime(2025, 6, 2, 8, tzinfo=timezone.utc)
+        try:
+            async with session_maker() as session:
+                for index in range(3):
+                    outbox_service.add_outbox_event(
+                        session,
+                        topic="test.ok",
+                        payload={"n": index},
+                        now=now - timedelta(seconds=3 - index),
+                    )
+                outbox_service.add_outbox_event(
+                    session, topic="test.fail", payload={"n": 99}, now=now
+                )
+                await session.commit()
+
+            delivered: list[int] = []
+
+            async def ok_handler(payload: dict) -> None:
+                delivered.append(payload["n"])
+
+            async def failing_handler(payload: dict) -> None:
+                raise RuntimeError("broker down")
+
+            handlers = {"test.ok": ok_handler, "test.fail": failing_handler}
+            async with session_maker() as session:
+                published = await outbox_service.relay_outbox_events(
+                    session, handlers, batch_size=10, now=now
+                )
+            assert published == 3
+            assert delivered == [0, 1, 2]
+
+            async with session_maker() as session:
+                published_again = await outbox_service.relay_outbox_events(
+                    session, handlers, batch_size=10, now=now
+                )
+            assert published_again == 0
+            assert delivered == [0, 1, 2]
+
+            async with session_maker() as session:
+                result = await session.execute(
+                    select(OutboxEvent).where(OutboxEvent.topic == "test.fail")
+                )
+                failed = result.scalars().one()
+                assert failed.published_at is None
+                assert failed.attempts == 1
+                assert failed.last_error == "broker down"
+
+            async with session_maker() as session:
+                purged = await outbox_service.purge_published_events(
+                    session, older_than=timedelta(days=1), now=now + timedelta(days=2)
+                )
+            assert purged == 3
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
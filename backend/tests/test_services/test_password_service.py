@@ -0,0 +1,148 @@
+# backend/tests/test_services/test_password_service.py
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from app.core.config import settings
+from app.models.user import User
+from app.services import user_service
+from app.services.password_service import PasswordService
+
+
+def _context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def test_verify_and_update_flags_hashes_with_a_stale_cost() -> None:
+    async def run_test() -> None:
+        old = PasswordService(context=_context(4), max_workers=2, max_pending=4)
+        new = PasswordService(context=_context(5), max_workers=2, max_pending=4)
+        try:
+            stored = await old.hash("hunter2")
+            assert await old.verify_and_update("hunter2", stored) == (True, None)
+            assert await new.verify_and_update("wrong", stored) == (False, None)
+
+            verified, replacement = await new.verify_and_update("hunter2", stored)
+            assert verified and replacement.startswith("$2b$05$")
+            assert await new.verify("hunter2", replacement)
+            assert new.snapshot()["stale_hashes"] == 1
+        finally:
+            old.shutdown()
+            new.shutdown()
+
+    asyncio.run(run_test())
+
+
+def test_calls_beyond_max_pending_are_rejected() -> None:
+    async def run_test() -> None:
+        service = PasswordService(context=_context(4), max_workers=1, max_pending=2)
+        try:
+            results = await asyncio.gather(
+                *(service.hash(f"pw{index}") for index in range(3)),
+                return_exceptions=True,
+            )
+            rejected = [r for r in results if isinstance(r, HTTPException)]
+            assert [r.status_code for r in rejected] == [503]
+            assert sum(isinstance(r, str) for r in results) == 2
+
+            with pytest.raises(ValueError):
+                await service.verify("pw0", "not-a-bcrypt-hash")
+
+            snapshot = service.snapshot()
+            assert (snapshot["completed"], snapshot["rejected"]) == (2, 1)
+            assert snapshot["failed"] == 1
+            assert snapshot["queue_depth"] == 0
+        finally:
+            service.shutdown()
+
+    asyncio.run(run_test())
+
+
+def test_login_replaces_hashes_made_with_an_old_cost(monkeypatch) -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app([User.__table__])
+        service = PasswordService(context=_context(5), max_workers=1, max_pending=1)
+        monkeypatch.setattr(user_service, "password_service", service)
+        try:
+            async with session_maker() as session:
+                session.add(
+                    User(
+                        id=uuid4(),
+                        username="legacy",
+                        email="legacy@example.com",
+                        hashed_password=_context(4).hash("hunter2"),
+                    )
+                )
+                await session.commit()
+
+            async with session_maker() as session:
+                assert await user_service.authenticate_user(
+                    session, "legacy@example.com", "wrong"
+                ) is None
+                user = await user_service.authenticate_user(
+                    session, "legacy@example.com", "hunter2"
+                )
+                assert user.hashed_password.startswith("$2b$05$")
+
+            async with session_maker() as session:
+                stored = await user_service.get_user_by_email(
+                    session, "legacy@example.com"
+                )
+                assert stored.hashed_password.startswith("$2b$05$")
+        finally:
+            service.shutdown()
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_login_only_counts_stale_hashes_when_rehash_is_disabled(monkeypatch) -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app([User.__table__])
+        service = PasswordService(context=_context(5), max_workers=1, max_pending=1)
+        monkeypatch.setattr(user_service, "password_service", service)
+        monkeypatch.setattr(settings, "PASSWORD_REHASH_ON_LOGIN", False)
+
+        async def no_rehash(*args):
+            raise AssertionError("verify_and_update should not run")
+
+        monkeypatch.setattr(service, "verify_and_update", no_rehash)
+        stored = _context(4).hash("hunter2")
+        try:
+            async with session_maker() as session:
+                session.add(
+                    User(
+                        id=uuid4(),
+                        username="legacy",
+                        email="legacy@example.com",
+                        hashed_password=stored,
+                    )
+                )
+                await session.commit()
+
+            async with session_maker() as session:
+                assert await user_service.authenticate_user(
+                    session, "legacy@example.com", "wrong"
+                ) is None
+                user = await user_service.authenticate_user(
+                    session, "legacy@example.com", "hunter2"
+                )
+                assert user.hashed_password == stored
+
+            snapshot = service.snapshot()
+            assert (snapshot["completed"], snapshot["stale_hashes"]) == (2, 1)
+        finally:
+            service.shutdown()
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
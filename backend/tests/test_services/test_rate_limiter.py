@@ -0,0 +1,140 @@
+# backend/tests/test_services/test_rate_limiter.py
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from tests.test_support.queries import query_counter
+from app.models.rate_limit_event import RateLimitEvent
+from app.services.rate_limiter import (
+    CounterRateLimitBackend,
+    DatabaseRateLimitBackend,
+    InMemoryCounterStore,
+    InMemoryRateLimitBackend,
+    purge_rate_limit_events,
+)
+
+_WINDOW = timedelta(minutes=10)
+_START = datetime(2025, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+async def _attempts(backend, db, user_id, moments) -> list[bool]:
+    return [
+        await backend.acquire(db, "test", user_id, limit=5, window=_WINDOW, now=moment)
+        for moment in moments
+    ]
+
+
+def test_in_memory_gcra_allows_burst_then_refills_at_the_emission_rate() -> None:
+    async def run_test() -> None:
+        backend = InMemoryRateLimitBackend(max_keys=1)
+        user_id = uuid4()
+        burst = await _attempts(backend, None, user_id, [_START] * 6)
+        assert burst == [True] * 5 + [False]
+
+        # One slot frees up every window / limit = 2 minutes.
+        assert await _attempts(
+            backend,
+            None,
+            user_id,
+            [_START + timedelta(minutes=1), _START + timedelta(minutes=2)],
+        ) == [False, True]
+        # A second user triggers the sweep but keeps the first user's state.
+        assert await _attempts(backend, None, uuid4(), [_START]) == [True]
+        assert await _attempts(
+            backend, None, user_id, [_START + timedelta(minutes=2)]
+        ) == [False]
+
+    asyncio.run(run_test())
+
+
+def test_counter_backend_weights_previous_window_and_refunds_rejections() -> None:
+    async def run_test() -> None:
+        store = InMemoryCounterStore()
+        backend = CounterRateLimitBackend(store)
+        user_id = uuid4()
+        window_start = datetime.fromtimestamp(
+            (_START.timestamp() // _WINDOW.total_seconds()) * _WINDOW.total_seconds(),
+            tz=timezone.utc,
+        )
+        assert await _attempts(backend, None, user_id, [window_start] * 6) == (
+            [True] * 5 + [False]
+        )
+        # Halfway through the next window the old five still count as 2.5.
+        halfway = window_start + _WINDOW * 1.5
+        assert await _attempts(backend, None, user_id, [halfway] * 3) == [
+            True,
+            True,
+            False,
+        ]
+        index = int(halfway.timestamp() // _WINDOW.total_seconds())
+        assert await store.get(f"ratelimit:test:{user_id}:{index}") == 2
+
+    asyncio.run(run_test())
+
+
+def test_database_backend_counts_flushed_events() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app([RateLimitEvent.__table__])
+        backend = DatabaseRateLimitBackend()
+        user_id = uuid4()
+        try:
+            async with session_maker() as session:
+                assert await _attempts(backend, session, user_id, [_START] * 6) == (
+                    [True] * 5 + [False]
+                )
+                assert await _attempts(
+                    backend, session, user_id, [_START + _WINDOW + timedelta(seconds=1)]
+                ) == [True]
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
+
+
+def test_database_backend_leaves_expired_events_to_the_reaper() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app([RateLimitEvent.__table__])
+        backend = DatabaseRateLimitBackend()
+        user_id = uuid4()
+        stale = _START - timedelta(days=2)
+        try:
+            async with session_maker() as session:
+                for offset in range(7):
+                    session.add(
+                        RateLimitEvent(
+                            user_id=user_id,
+                            action="test" if offset % 2 else "other",
+                            occurred_at=stale + timedelta(minutes=offset),
+                        )
+                    )
+                await session.commit()
+
+                with query_counter(engine) as stats:
+                    assert await _attempts(backend, session, user_id, [_START]) == [True]
+                assert not any(
+                    statement.lstrip().upper().startswith("DELETE")
+                    for statement in stats["statements"]
+                )
+
+                with query_counter(engine) as purge_stats:
+                    removed = await purge_rate_limit_events(
+                        session, older_than=timedelta(days=1), batch_size=2, now=_START
+                    )
+                assert removed == 7
+                # Actions are found by seeking the index, not by a DISTINCT scan.
+                assert not any("DISTINCT" in sql for sql in purge_stats["statements"])
+                assert "WITH RECURSIVE" in purge_stats["statements"][0]
+                remaining = (
+                    await session.execute(select(RateLimitEvent.occurred_at))
+                ).scalars().all()
+                assert [moment.replace(tzinfo=timezone.utc) for moment in remaining] == [
+                    _START
+                ]
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
@@ -1,14 +1,11 @@
 # backend/tests/test_services/test_routine_service.py
 
 import asyncio
-from contextlib import contextmanager
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
-
 from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from tests.test_support.queries import query_counter
 from app.models.hidden_routine import HiddenRoutine
 from app.models.routine import Routine
 from app.models.routine_scenario import RoutineScenario
@@ -17,20 +14,6 @@ from app.models.user import User
 from app.services import routine_service
 
 
-@contextmanager
-def query_counter(engine: Engine):
-    stats = {"count": 0}
-
-    def before_cursor_execute(*_args, **_kwargs):
-        stats["count"] += 1
-
-    event.listen(engine, "before_cursor_execute", before_cursor_execute)
-    try:
-        yield stats
-    finally:
-        event.remove(engine, "before_cursor_execute", before_cursor_execute)
-
-
 def test_get_user_routines_loads_in_batches() -> None:
     async def run_test() -> None:
         session_maker, engine = setup_test_app(
@@ -0,0 +1,130 @@
+# backend/tests/test_services/test_training_volume_service.py
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from tests.test_support.queries import query_counter
+from app.models.associations import ScenarioPrimaryMuscleAssociation
+from app.models.muscle import Muscle
+from app.models.routine_submission import RoutineScenarioSubmission, RoutineSubmission
+from app.models.scenario import Scenario
+from app.models.training_volume import WeeklyTrainingVolume
+from app.models.user import User
+from app.services.training_volume_service import (
+    VolumeDimension,
+    compute_volume_series,
+    get_weekly_volume,
+    refresh_weekly_volume,
+)
+
+_TABLES = [
+    User.__table__,
+    Muscle.__table__,
+    Scenario.__table__,
+    ScenarioPrimaryMuscleAssociation.__table__,
+    RoutineSubmission.__table__,
+    RoutineScenarioSubmission.__table__,
+    WeeklyTrainingVolume.__table__,
+]
+
+
+def test_weekly_volume_buckets_and_rollup_refresh() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app(_TABLES)
+        # Wednesday; the week starts on Monday 2025-06-02.
+        wednesday = datetime(2025, 6, 4, 18, tzinfo=timezone.utc)
+        monday = datetime(2025, 6, 2, tzinfo=timezone.utc)
+        user_id = uuid4()
+        try:
+            async with session_maker() as session:
+                session.add(
+                    User(
+                        id=user_id,
+                        username="volume",
+                        email="volume@example.com",
+                        hashed_password="hashed",
+                    )
+                )
+                for muscle_id in ("chest", "triceps", "quads"):
+                    session.add(Muscle(id=muscle_id, name=muscle_id.title()))
+                session.add(Scenario(id="bench", name="Bench Press"))
+                session.add(Scenario(id="squat", name="Back Squat"))
+                session.add_all(
+                    [
+                        ScenarioPrimaryMuscleAssociation(scenario_id="bench", muscle_id="chest"),
+                        ScenarioPrimaryMuscleAssociation(scenario_id="bench", muscle_id="triceps"),
+                        ScenarioPrimaryMuscleAssociation(scenario_id="squat", muscle_id="quads"),
+                    ]
+                )
+                for completed_at, entries in [
+                    (wednesday, [("bench", 3, 1000.0), ("squat", 5, 2500.0)]),
+                    (wednesday + timedelta(days=1), [("bench", 2, 500.0)]),
+                    (wednesday - timedelta(days=7), [("squat", 4, 2000.0)]),
+                ]:
+                    submission = RoutineSubmission(
+                        id=uuid4(),
+                        user_id=user_id,
+                        duration=45,
+                        completion_timestamp=completed_at,
+                        status="completed",
+                        title="Workout",
+                    )
+                    for scenario_id, sets, volume in entries:
+                        submission.scenario_submissions.append(
+                            RoutineScenarioSubmission(
+                                scenario_id=scenario_id,
+                                sets=sets,
+                                reps=5,
+                                weight=100.0,
+                                total_volume=volume,
+                            )
+                        )
+                    session.add(submission)
+                await session.commit()
+
+            async with session_maker() as session:
+                series = await compute_volume_series(
+                    session,
+                    user_id,
+                    dimension=VolumeDimension.SCENARIO,
+                    start=monday - timedelta(days=7),
+                    end=monday + timedelta(days=7),
+                )
+                assert [(b.week_start, b.key, b.volume, b.sets) for b in series] == [
+                    (monday - timedelta(days=7), "squat", 2000.0, 4),
+                    (monday, "bench", 1500.0, 5),
+                    (monday, "squat", 2500.0, 5),
+                ]
+
+                written = await refresh_weekly_volume(
+                    session, user_id, week_start=wednesday
+                )
+                assert written == 5
+                # Idempotent: a second refresh replaces rather than adds.
+                with query_counter(engine) as stats:
+                    await refresh_weekly_volume(session, user_id, week_start=wednesday)
+                # The user-week lock is taken before anything is read or replaced.
+                assert "advisory_xact_lock" in stats["statements"][0]
+
+                rows = await get_weekly_volume(
+                    session,
+                    user_id,
+                    dimension=VolumeDimension.MUSCLE,
+                    weeks=4,
+                    now=wednesday,
+                )
+                assert {(row.key, row.volume, row.sets) for row in rows} == {
+                    ("chest", 1500.0, 5),
+                    ("triceps", 1500.0, 5),
+                    ("quads", 2500.0, 5),
+                }
+                result = await session.execute(select(WeeklyTrainingVolume))
+                assert len(result.scalars().all()) == 5
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
@@ -0,0 +1,77 @@
+# backend/tests/test_services/test_user_search_index.py
+
+import asyncio
+import threading
+from uuid import uuid4
+
+from tests.test_support.app_setup import setup_test_app, teardown_test_app
+from app.models.user import User
+from app.services.user_search_index import (
+    IndexedUser,
+    UserPrefixIndex,
+    load_user_search_index,
+)
+
+
+class _RacingIndex(UserPrefixIndex):
+    """Applies local writes while the rebuild sorts, like a concurrent request."""
+
+    def __init__(self, writes) -> None:
+        super().__init__()
+        self.writes = writes
+        self.build_thread: int | None = None
+
+    def build(self, users):
+        self.build_thread = threading.get_ident()
+        self.writes(self)
+        return UserPrefixIndex.build(users)
+
+
+def test_rebuild_sorts_off_the_loop_and_keeps_writes_made_meanwhile() -> None:
+    async def run_test() -> None:
+        session_maker, engine = setup_test_app([User.__table__])
+        users = [
+            User(
+                id=uuid4(),
+                username=name,
+                email=f"{name}@example.com",
+                hashed_password="hashed",
+                display_name=name.title(),
+            )
+            for name in ("alice", "albert", "alfred")
+        ]
+        ids = [user.id for user in users]
+        signup = IndexedUser(
+            id=uuid4(), username="alma", display_name=None, avatar_url=None
+        )
+
+        def writes(index: UserPrefixIndex) -> None:
+            index.upsert(signup)
+            index.remove(ids[1])
+            index.upsert(
+                IndexedUser(
+                    id=ids[2],
+                    username="zelda",
+                    display_name=None,
+                    avatar_url=None,
+                )
+            )
+
+        index = _RacingIndex(writes)
+        try:
+            async with session_maker() as session:
+                session.add_all(users)
+                await session.commit()
+                assert await load_user_search_index(session, index) == 3
+
+            assert index.build_thread != threading.get_ident()
+            assert not index.loading
+            page, total = index.first_page("al", exclude=None, limit=1, count_cap=10)
+            assert [user.username for user in page] == ["alice"]
+            assert total == 2  # alice and alma; Alice's display name is alice
+            assert index._users[ids[2]].username == "zelda"
+            assert len(index) == 3
+        finally:
+            await teardown_test_app(engine)
+
+    asyncio.run(run_test())
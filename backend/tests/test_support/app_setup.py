@@ -27,10 +27,21 @@ if not STATIC_DIR.exists():
     STATIC_DIR.mkdir()
     _created_static = True
 
-from app.api.v1.deps import get_db  # noqa: E402
+from app.api.v1.deps import get_db, get_session_factory  # noqa: E402
 from app.main import app  # noqa: E402
 
 
+class AsyncResultWrapper:
+    """Async iteration over a synchronous streamed ``Result``."""
+
+    def __init__(self, result) -> None:
+        self._result = result
+
+    async def partitions(self, size=None):
+        for partition in self._result.partitions(size):
+            yield partition
+
+
 class AsyncSessionWrapper:
     """Light-weight async facade around a synchronous SQLAlchemy session."""
 
@@ -48,6 +59,12 @@ class AsyncSessionWrapper:
     async def execute(self, statement):
         return self._sync_session.execute(statement)
 
+    async def stream(self, statement):
+        return AsyncResultWrapper(self._sync_session.execute(statement))
+
+    async def stream_scalars(self, statement):
+        return AsyncResultWrapper(self._sync_session.execute(statement).scalars())
+
     async def get(self, model, ident):
         return self._sync_session.get(model, ident)
 
@@ -72,6 +89,9 @@ class AsyncSessionWrapper:
     async def rollback(self) -> None:
         self._sync_session.rollback()
 
+    async def close(self) -> None:
+        self._sync_session.close()
+
 
 SessionFactory = Callable[[], AsyncSessionWrapper]
 
@@ -94,6 +114,7 @@ def setup_test_app(tables: Iterable[Table]) -> tuple[SessionFactory, Engine]:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: factory
     return factory, engine
 
 
@@ -0,0 +1,25 @@
+"""SQL statement counting helpers for tests."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def query_counter(engine: Engine):
+    """Count the statements sent to ``engine``; SQL text is kept in ``statements``."""
+
+    stats = {"count": 0, "statements": []}
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args, **_kwargs):
+        stats["count"] += 1
+        stats["statements"].append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,17 @@
+"""Tests for chart downsampling helpers."""
+
+from app.utils.downsample import lttb
+
+
+def test_lttb_keeps_endpoints_and_extremes() -> None:
+    points = [(float(x), 0.0) for x in range(100)]
+    points[37] = (37.0, 50.0)
+    points[71] = (71.0, -40.0)
+
+    kept = lttb(points, 10)
+
+    assert len(kept) == 10
+    assert kept[0] == 0 and kept[-1] == 99
+    assert kept == sorted(kept)
+    assert 37 in kept and 71 in kept
+    assert lttb(points[:5], 10) == [0, 1, 2, 3, 4]